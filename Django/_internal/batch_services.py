@@ -0,0 +1,129 @@
+import os
+
+import template_data as td
+from manifest import sync_files
+from substitution import plan_for
+
+
+class TemplateSnapshot:
+    """
+    APP_TEMPLATE, MICROSERVICES_TEMPLATE and MICROSERVICES_MODELS loaded once,
+    each with a precomputed substitution plan.
+
+    A plan records the placeholder offsets of a template, so filling it for
+    a service is a single pass instead of a chain of str.replace copies.
+    """
+
+    TEMPLATE_SETS = (
+        "APP_TEMPLATE", "MICROSERVICES_TEMPLATE", "MICROSERVICES_MODELS",
+        "ASGI_APP_TEMPLATE", "ASGI_MICROSERVICES_TEMPLATE",
+    )
+
+    def __init__(self):
+        self.plans = {}
+        for template_set in map(td.load, self.TEMPLATE_SETS):
+            for content in template_set.values():
+                self.plans[content] = plan_for(content)
+
+    def fill(self, content: str, app_name: str, project_name: str) -> str:
+        plan = self.plans.get(content)
+        if plan is None:
+            plan = self.plans[content] = plan_for(content)
+        return plan.render({"app_name": app_name, "project_name": project_name})
+
+
+def parse_service_spec(spec: str) -> tuple:
+    """
+    Parses a startservices argument such as 'user:user_app,profile_app'.
+
+    Returns:
+        tuple: (service_name, [app_names])
+    """
+    service, _, apps = spec.partition(":")
+    return service.strip(), [app.strip() for app in apps.split(",") if app.strip()]
+
+
+def service_files(service: str, apps: list[str], secret_key: str, API: bool = False, snapshot: TemplateSnapshot = None, asgi: bool = False) -> dict:
+    """
+    Builds every template-owned file of one service, relative to the
+    service root.
+
+    Returns:
+        dict: Relative path -> file content
+    """
+    snapshot = snapshot or TemplateSnapshot()
+    files = {}
+    for app_name in apps:
+        files.update(td.app_boilerplate_files(app_name, service, True, fill=snapshot.fill, asgi=asgi))
+
+    readme_content = td.load("README_TEMPLATE").format(
+        project_name=service,
+        apps_list="\n".join([f"- {app}" for app in apps]),
+    )
+    files.update(td.project_files(service, readme_content, API, secret_key, asgi))
+    return files
+
+
+_worker_snapshot = None
+
+
+def _init_worker(snapshot: TemplateSnapshot) -> None:
+    global _worker_snapshot
+    _worker_snapshot = snapshot
+
+
+def _scaffold_service(job: tuple) -> tuple:
+    base_path, service, apps, secret_key, API, asgi = job
+    snapshot = _worker_snapshot or TemplateSnapshot()
+    service_root = os.path.join(base_path, service)
+    for app_name in apps:
+        td.remove_files(os.path.join(service_root, app_name), td.MICROSERVICES_REMOVED_FILES)
+    files = service_files(service, apps, secret_key, API, snapshot, asgi)
+    return service, sync_files(
+        service_root, files, td.project_file_versions(service), replace_unrecorded=td.startapp_paths(apps)
+    )
+
+
+def scaffold_services(services: list[str], base_path: str = ".", API: bool = False, max_workers: int = None, asgi: bool = False) -> dict:
+    """
+    Scaffolds many services from one in-memory template snapshot.
+
+    The snapshot and all secret keys are prepared once in the parent
+    process; services are then rendered and written in parallel worker
+    processes. The Django skeleton of each service (`django-admin
+    startproject` / `startapp`) must already exist below base_path, as with
+    the sequential startservices flow.
+
+    Frozen (PyInstaller) builds must call multiprocessing.freeze_support()
+    in the entry point before using this on Windows.
+
+    Args:
+        services (list[str]): Service definitions, 'service:app1,app2' or 'service'.
+        base_path (str, optional): Directory containing the services. Defaults to ".".
+        API (bool, optional): Include the REST framework requirements. Defaults to False.
+        max_workers (int, optional): Worker processes. Defaults to the CPU count.
+        asgi (bool, optional): Async views and ASGI deployment files. Defaults to False.
+
+    Each service keeps its own .scaffold-manifest.json, so re-running a batch
+    only rewrites files whose template changed.
+
+    Returns:
+        dict: Service name -> {"written": {path: seconds}, "skipped": [...], "conflicts": [...]}
+    """
+    specs = [parse_service_spec(spec) for spec in services]
+    keys = td.generate_secret_keys(len(specs))
+    jobs = [
+        (base_path, service, apps, key, API, asgi)
+        for (service, apps), key in zip(specs, keys)
+    ]
+    snapshot = TemplateSnapshot()
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        _init_worker(snapshot)
+        return dict(_scaffold_service(job) for job in jobs)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(snapshot,)) as pool:
+        return dict(pool.map(_scaffold_service, jobs))
@@ -0,0 +1,63 @@
+import re
+
+# Placeholders used by APP_TEMPLATE, MICROSERVICES_TEMPLATE and MICROSERVICES_MODELS
+PLACEHOLDER_PATTERN = re.compile(r"(app_name|project_name)")
+
+
+class SubstitutionPlan:
+    """
+    A template with the offsets of every placeholder precomputed.
+
+    ``slots`` holds one (start, end, name) tuple per placeholder occurrence.
+    Rendering walks the slots once, filling a buffer sized up front, so each
+    template is copied exactly once no matter how many placeholders it has.
+    Substituted values are never rescanned, which means an app called
+    e.g. "my_project_name" no longer gets its own name rewritten.
+    """
+
+    __slots__ = ("source", "slots")
+
+    def __init__(self, source: str, slots):
+        self.source = source
+        self.slots = tuple(slots)
+
+    @classmethod
+    def compile(cls, source: str, pattern: re.Pattern) -> "SubstitutionPlan":
+        """``pattern`` must capture the placeholder name in group 1."""
+        return cls(source, ((m.start(), m.end(), m.group(1)) for m in pattern.finditer(source)))
+
+    @property
+    def names(self) -> frozenset:
+        return frozenset(name for _, _, name in self.slots)
+
+    def render(self, values: dict) -> str:
+        if not self.slots:
+            return self.source
+        source = self.source
+        buffer = [""] * (2 * len(self.slots) + 1)
+        position = 0
+        index = 0
+        for start, end, name in self.slots:
+            buffer[index] = source[position:start]
+            buffer[index + 1] = values[name]
+            index += 2
+            position = end
+        buffer[index] = source[position:]
+        return "".join(buffer)
+
+
+_plans = {}
+
+
+def plan_for(source: str, pattern: re.Pattern = PLACEHOLDER_PATTERN) -> SubstitutionPlan:
+    """Returns the cached plan of ``source`` for ``pattern``, compiling it on first use."""
+    key = (pattern.pattern, source)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = SubstitutionPlan.compile(source, pattern)
+    return plan
+
+
+def substitute(source: str, values: dict, pattern: re.Pattern = PLACEHOLDER_PATTERN) -> str:
+    """Fills every placeholder of ``source`` in a single pass."""
+    return plan_for(source, pattern).render(values)
@@ -0,0 +1,496 @@
+"""
+Django CLI templates and the functions that render them.
+
+The template strings live in submodules (app, project, logger_templates,
+microservices) and are only imported when a file that needs them is
+generated, so the CLI starts without evaluating every template.
+Module-level names such as ``template_data.APP_TEMPLATE`` still work and
+load their submodule on first access.
+
+PyInstaller cannot see these lazy imports; list the submodules under
+``hiddenimports`` (or use ``--collect-submodules template_data``) when
+building the executable.
+"""
+import importlib
+import os
+import secrets
+from file_writer import write_files
+from manifest import content_hash, sync_files
+from substitution import substitute
+
+# Template name -> submodule that defines it
+TEMPLATE_MODULES = {
+    "APP_TEMPLATE": "app",
+    "AUTH_MODEL": "app",
+    "PAGINATION_TEMPLATE": "app",
+    "README_TEMPLATE": "project",
+    "GITIGNORE_TEMPLATE": "project",
+    "DOCKERFILE_TEMPLATE": "project",
+    "DOCKER_COMPOSE_TEMPLATE": "project",
+    "DOCKER_COMPOSE_PROD_TEMPLATE": "project",
+    "REQUIREMENTS_TEMPLATE": "project",
+    "REQUIREMENTS_WITH_API": "project",
+    "DOCKERIGNORE_TEMPLATE": "project",
+    "ENV_TEMPLATE": "project",
+    "HEALTH_CHECK_TEMPLATE": "project",
+    "HEALTH_CHECK_ASYNC_TEMPLATE": "project",
+    "DOCKERFILE_ASGI_TEMPLATE": "project",
+    "GUNICORN_ASGI_CONF_TEMPLATE": "project",
+    "REQUIREMENTS_ASGI": "project",
+    "LOADTEST_TEMPLATE": "project",
+    "ASGI_APP_TEMPLATE": "app",
+    "logger_settings": "logger_templates",
+    "logger_template": "logger_templates",
+    "MICROSERVICES_TEMPLATE": "microservices",
+    "MICROSERVICES_MODELS": "microservices",
+    "ASGI_MICROSERVICES_TEMPLATE": "microservices",
+    "BULK_API_TEMPLATE": "microservices",
+}
+
+def load(name: str):
+    """Imports the submodule that defines ``name`` and returns the template."""
+    try:
+        module_name = TEMPLATE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+def __getattr__(name: str):
+    return load(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(TEMPLATE_MODULES))
+
+MICROSERVICES_TEST_PACKAGES = {
+    "tests/__init__.py": "# Tests package\n",
+    "tests/unit/__init__.py": "# Unit tests\n",
+    "tests/integration/__init__.py": "# Integration tests\n",
+    "tests/fixtures/__init__.py": "# Test fixtures\n",
+}
+
+# Files created by `django-admin startapp` that the microservices layout replaces
+MICROSERVICES_REMOVED_FILES = ["models.py", "tests.py", "forms.py"]
+
+# Stubs `django-admin startapp` writes before the boilerplate is generated
+STARTAPP_FILES = ["__init__.py", "admin.py", "apps.py", "models.py", "tests.py", "views.py", "migrations/__init__.py"]
+
+def fill_placeholders(content: str, app_name: str, project_name: str) -> str:
+    """Replaces the 'app_name' and 'project_name' placeholders in a template in one pass."""
+    return substitute(content, {"app_name": app_name, "project_name": project_name})
+
+def startapp_paths(app_names: list[str]) -> list[str]:
+    """Paths of the startapp stubs of ``app_names``, relative to their parent directory."""
+    return [f"{app_name}/{filename}" for app_name in app_names for filename in STARTAPP_FILES]
+
+def remove_files(base_path: str, filenames: list[str]) -> None:
+    """Deletes the given files below base_path if they exist."""
+    for filename in filenames:
+        file_path = os.path.join(base_path, filename)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+def create_microservices_structure(app_path: str):
+    """Create tests folder structure and delete tests.py"""
+    try:
+        remove_files(app_path, ["tests.py"])
+        write_files(app_path, MICROSERVICES_TEST_PACKAGES, fsync=False)
+    except OSError as e:
+        print(f"Error creating microservices structure: {e}")
+        raise
+
+def api_structure_files(project_name: str, app_name: str) -> dict:
+    """
+    Builds the APIs folder files for an app, relative to the project root
+    (same level as settings.py).
+
+    Returns:
+        dict: Relative path -> file content
+    """
+    apis_dir = f"apis/v1/{app_name}"
+
+    entity1_serializer = f"""from rest_framework import serializers
+from {app_name}.models.entity1_model import Entity1
+
+class Entity1Serializer(serializers.ModelSerializer):
+    class Meta:
+        model = Entity1
+        fields = '__all__'
+
+class Entity1CreateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Entity1
+        fields = '__all__'
+
+class Entity1UpdateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Entity1
+        fields = '__all__'
+"""
+    
+    entity2_serializer = f"""from rest_framework import serializers
+from {app_name}.models.entity2_model import Entity2
+
+class Entity2Serializer(serializers.ModelSerializer):
+    class Meta:
+        model = Entity2
+        fields = '__all__'
+
+class Entity2CreateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Entity2
+        fields = '__all__'
+
+class Entity2UpdateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Entity2
+        fields = '__all__'
+"""
+    
+    entity1_view = f"""from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.authentication import TokenAuthentication
+from {app_name}.models.entity1_model import Entity1
+from {project_name}.apis.v1.{app_name}.serializers.entity1_serializers import Entity1Serializer, Entity1CreateSerializer, Entity1UpdateSerializer
+from {project_name}.apis.v1.{app_name}.bulk import BulkActionsMixin
+
+class Entity1ViewSet(BulkActionsMixin, viewsets.ModelViewSet):
+    queryset = Entity1.objects.all()
+    serializer_class = Entity1Serializer
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return Entity1CreateSerializer
+        elif self.action in ['update', 'partial_update']:
+            return Entity1UpdateSerializer
+        return Entity1Serializer
+"""
+    
+    entity2_view = f"""from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.authentication import TokenAuthentication
+from {app_name}.models.entity2_model import Entity2
+from {project_name}.apis.v1.{app_name}.serializers.entity2_serializers import Entity2Serializer, Entity2CreateSerializer, Entity2UpdateSerializer
+from {project_name}.apis.v1.{app_name}.bulk import BulkActionsMixin
+
+class Entity2ViewSet(BulkActionsMixin, viewsets.ModelViewSet):
+    queryset = Entity2.objects.all()
+    serializer_class = Entity2Serializer
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return Entity2CreateSerializer
+        elif self.action in ['update', 'partial_update']:
+            return Entity2UpdateSerializer
+        return Entity2Serializer
+"""
+
+    return {
+        f"{apis_dir}/__init__.py": "# API package\n",
+        f"{apis_dir}/bulk.py": load("BULK_API_TEMPLATE"),
+        f"{apis_dir}/serializers/": None,
+        f"{apis_dir}/views/": None,
+        f"{apis_dir}/serializers/entity1_serializers.py": entity1_serializer,
+        f"{apis_dir}/serializers/entity2_serializers.py": entity2_serializer,
+        f"{apis_dir}/views/entity1_views.py": entity1_view,
+        f"{apis_dir}/views/entity2_views.py": entity2_view,
+    }
+
+def create_api_structure(project_name: str, app_name: str):
+    """Create APIs folder structure in project root (same level as settings.py)"""
+    project_root = os.path.join(os.getcwd(), project_name)
+    try:
+        write_files(project_root, api_structure_files(project_name, app_name), fsync=False)
+    except OSError as e:
+        print(f"Error creating API structure: {e}")
+        raise
+
+def app_boilerplate_files(app_name: str, project_name: str, microservices: bool = False, fill=fill_placeholders, asgi: bool = False) -> dict:
+    """
+    Builds the boilerplate files for a Django app without touching disk.
+
+    Paths are relative to the directory that contains the app (the
+    project or service root).
+
+    Args:
+        app_name (str): The app name to generate boilerplate for.
+        project_name (str): The project (or service) the app belongs to.
+        microservices (bool, optional): Use the microservices layout. Defaults to False.
+        fill (callable, optional): fill(content, app_name, project_name) used
+            to substitute the placeholders. Defaults to fill_placeholders.
+        asgi (bool, optional): Generate async views (async ORM) and their
+            urls.py for ASGI deployment. Defaults to False.
+
+    Returns:
+        dict: Relative path -> file content (None for empty directories)
+    """
+    from .app import APP_TEMPLATE, ASGI_APP_TEMPLATE
+    from .microservices import ASGI_MICROSERVICES_TEMPLATE, MICROSERVICES_MODELS, MICROSERVICES_TEMPLATE
+
+    files = {}
+    if microservices:
+        files[f"{app_name}/models/__init__.py"] = "# Models package\n"
+        for filename, content in MICROSERVICES_MODELS.items():
+            files[f"{app_name}/models/{filename}"] = fill(content, app_name, project_name)
+
+        for filename, content in MICROSERVICES_TEST_PACKAGES.items():
+            files[f"{app_name}/{filename}"] = content
+
+        for filename, content in api_structure_files(project_name, app_name).items():
+            files[f"{project_name}/{filename}"] = content
+
+        # Use microservices templates for views.py and admin.py
+        for filename, content in MICROSERVICES_TEMPLATE.items():
+            files[f"{app_name}/{filename}"] = fill(content, app_name, project_name)
+
+        # Use standard templates for urls.py only
+        files[f"{app_name}/urls.py"] = fill(APP_TEMPLATE["urls.py"], app_name, project_name)
+    else:
+        # Standard app structure with single models.py
+        for filename, content in APP_TEMPLATE.items():
+            files[f"{app_name}/{filename}"] = fill(content, app_name, project_name)
+
+        # Create template folder with placeholder index.html
+        files[f"{app_name}/templates/{app_name}/index.html"] = f"<h1>{app_name.capitalize()} Index Page</h1>"
+
+    if asgi:
+        async_views = ASGI_MICROSERVICES_TEMPLATE if microservices else ASGI_APP_TEMPLATE
+        files[f"{app_name}/views.py"] = fill(async_views["views.py"], app_name, project_name)
+        files[f"{app_name}/urls.py"] = fill(ASGI_APP_TEMPLATE["urls.py"], app_name, project_name)
+    return files
+
+def generate_app_boilerplate(app_name: str, project_name: str, microservices: bool = False, asgi: bool = False) -> dict:
+    """
+    Generates default boilerplate files for a Django app.
+
+    It writes default models.py, views.py, urls.py, admin.py, tests.py,
+    serializers.py, forms.py and the benchmark_models management command
+    from APP_TEMPLATE, replacing the placeholder 'app_name' with the actual
+    app name.
+
+    Also creates a templates directory with a basic index.html.
+
+    With microservices=True the app gets a models/ package, a tests/ tree and
+    a versioned apis/ folder instead, and models.py, tests.py and forms.py
+    are removed.
+
+    Re-running it only rewrites files whose template changed, as recorded
+    in the project's .scaffold-manifest.json. The stubs written by
+    `django-admin startapp` are replaced even though they are not recorded
+    yet.
+
+    Args:
+        app_name (str): The app name to generate boilerplate for.
+        project_name (str): The project the app belongs to.
+        microservices (bool, optional): Use the microservices layout. Defaults to False.
+        asgi (bool, optional): Generate async views for ASGI deployment. Defaults to False.
+
+    Returns:
+        dict: {"written": {path: seconds}, "skipped": [paths], "conflicts": [paths]}
+    """
+    base_path = os.getcwd()
+    if microservices:
+        remove_files(os.path.join(base_path, app_name), MICROSERVICES_REMOVED_FILES)
+    try:
+        return sync_files(
+            base_path,
+            app_boilerplate_files(app_name, project_name, microservices, asgi=asgi),
+            replace_unrecorded=startapp_paths([app_name]),
+        )
+    except OSError as e:
+        print(f"Error creating app {app_name}: {e}")
+        raise
+
+
+
+def generate_readme(project_name: str, apps: list[str], API: bool=False, secret_key: str=None, asgi: bool=False) -> dict:
+    """
+    Generates a README.md file for the Django project.
+
+    It lists all apps included in the project with setup instructions.
+
+    Args:
+        project_name (str): Name of the Django project.
+        apps (list[str]): List of app names included in the project.
+        secret_key (str, optional): Pre-generated SECRET_KEY for the .env file.
+        asgi (bool, optional): Deploy with uvicorn workers on the ASGI app. Defaults to False.
+
+    Returns:
+        dict: {"written": {path: seconds}, "skipped": [paths], "conflicts": [paths]}
+    """
+    from .project import README_TEMPLATE
+
+    apps_list = "\n".join([f"- {app}" for app in apps])
+
+    readme_content = README_TEMPLATE.format(
+        project_name=project_name,
+        apps_list=apps_list,
+    )
+
+    return generate_project_files(project_name, readme_content, API, secret_key, asgi)
+
+# Same alphabet and length as django.core.management.utils.get_random_secret_key
+SECRET_KEY_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*(-_=+)"
+SECRET_KEY_LENGTH = 50
+
+def generate_secret_keys(count: int) -> list[str]:
+    """
+    Generates ``count`` Django-style secret keys from a single CSPRNG draw.
+
+    Bytes are mapped onto SECRET_KEY_CHARS with rejection sampling so every
+    character stays uniformly distributed.
+
+    Args:
+        count (int): Number of keys to generate, e.g. one per service.
+
+    Returns:
+        list[str]: The generated keys
+    """
+    alphabet_size = len(SECRET_KEY_CHARS)
+    limit = 256 - 256 % alphabet_size
+    needed = count * SECRET_KEY_LENGTH
+    chars = []
+    while len(chars) < needed:
+        chars.extend(
+            SECRET_KEY_CHARS[byte % alphabet_size]
+            for byte in secrets.token_bytes(needed - len(chars) + 16)
+            if byte < limit
+        )
+    return [
+        "".join(chars[i:i + SECRET_KEY_LENGTH])
+        for i in range(0, needed, SECRET_KEY_LENGTH)
+    ]
+
+def get_random_secret_key() -> str:
+    """Returns a 50 character secret key, matching Django's own format."""
+    return generate_secret_keys(1)[0]
+
+def project_files(project_name: str, readme_content: str, API: bool=False, secret_key: str=None, asgi: bool=False) -> dict:
+    """
+    Builds the map of common project files (README.md, .gitignore, Dockerfile,
+    docker-compose.yml, ...) without touching disk.
+
+    Args:
+        project_name (str): Name of the Django project
+        readme_content (str): Content for the README.md file
+        API (bool, optional): Include the REST framework requirements. Defaults to False.
+        secret_key (str, optional): Pre-generated SECRET_KEY, e.g. from
+            generate_secret_keys() when creating many services. A fresh key is
+            generated when omitted.
+        asgi (bool, optional): Run gunicorn with uvicorn workers on the ASGI
+            app (gunicorn.conf.py sizes workers from the CPU count), use the
+            async health check and add scripts/loadtest.py, a WSGI vs ASGI
+            throughput comparison. Defaults to False.
+
+    Returns:
+        dict: File name -> rendered content
+    """
+    from .project import (
+        DOCKER_COMPOSE_PROD_TEMPLATE, DOCKER_COMPOSE_TEMPLATE, DOCKERFILE_ASGI_TEMPLATE,
+        DOCKERFILE_TEMPLATE, DOCKERIGNORE_TEMPLATE, ENV_TEMPLATE, GITIGNORE_TEMPLATE,
+        GUNICORN_ASGI_CONF_TEMPLATE, HEALTH_CHECK_ASYNC_TEMPLATE, HEALTH_CHECK_TEMPLATE,
+        LOADTEST_TEMPLATE, REQUIREMENTS_ASGI, REQUIREMENTS_TEMPLATE, REQUIREMENTS_WITH_API,
+    )
+
+    ALL_REQUIREMENTS = REQUIREMENTS_TEMPLATE + (REQUIREMENTS_WITH_API if API else "") + (REQUIREMENTS_ASGI if asgi else "")
+    django_key = secret_key or get_random_secret_key()
+    dockerfile = DOCKERFILE_ASGI_TEMPLATE if asgi else DOCKERFILE_TEMPLATE
+    files = {
+        "README.md": readme_content,
+        ".gitignore": GITIGNORE_TEMPLATE,
+        ".env": ENV_TEMPLATE.format(project_name=project_name, KEY=django_key),
+        "Dockerfile": dockerfile.format(project_name=project_name),
+        "docker-compose.yml": DOCKER_COMPOSE_TEMPLATE,
+        "docker-compose.prod.yml": DOCKER_COMPOSE_PROD_TEMPLATE,
+        "requirements.txt": ALL_REQUIREMENTS,
+        ".dockerignore": DOCKERIGNORE_TEMPLATE,
+        f"{project_name}/health_check.py": HEALTH_CHECK_ASYNC_TEMPLATE if asgi else HEALTH_CHECK_TEMPLATE,
+    }
+    if asgi:
+        files["gunicorn.conf.py"] = GUNICORN_ASGI_CONF_TEMPLATE
+        files["scripts/loadtest.py"] = LOADTEST_TEMPLATE
+    return files
+
+def project_file_versions(project_name: str) -> dict:
+    """
+    Template versions for project files whose output is not deterministic.
+
+    The .env gets a fresh secret key on every render, so its version is
+    derived from the template instead; an existing .env (and its key) is
+    kept until ENV_TEMPLATE itself changes.
+    """
+    from .project import ENV_TEMPLATE
+
+    return {".env": content_hash(ENV_TEMPLATE + project_name)}
+
+def generate_project_files(project_name: str, readme_content: str, API: bool=False, secret_key: str=None, asgi: bool=False) -> dict:
+    """
+    Generates common project files like README.md, .gitignore, Dockerfile and docker-compose.yml
+
+    The files are written concurrently with a single fsync barrier at the end.
+    Re-running it only rewrites files whose template changed, as recorded in
+    the project's .scaffold-manifest.json.
+
+    Args:
+        project_name (str): Name of the Django project
+        readme_content (str): Content for the README.md file
+        secret_key (str, optional): Pre-generated SECRET_KEY for the .env file
+        asgi (bool, optional): Deploy with uvicorn workers on the ASGI app. Defaults to False.
+
+    Returns:
+        dict: {"written": {path: seconds}, "skipped": [paths], "conflicts": [paths]}
+    """
+    files_to_create = project_files(project_name, readme_content, API, secret_key, asgi)
+    try:
+        return sync_files(project_name, files_to_create, project_file_versions(project_name))
+    except OSError as e:
+        print(f"Error creating file {e.filename}: {e}")
+        raise
+
+def generate_project_archive(target, project_name: str, apps: list[str], API: bool=False, secret_key: str=None, microservices: bool=False, fmt: str=None, asgi: bool=False) -> dict:
+    """
+    Streams the template-owned files of a project into a tar.gz/zip archive
+    (or to stdout with target="-") instead of writing them to disk.
+
+    The archive holds the same file map as generate_readme() plus
+    generate_app_boilerplate() for every app, with the same relative paths,
+    so unpacking it in the working directory matches a normal run.
+
+    Args:
+        target: Archive path, "-" for stdout, or a writable binary file object.
+        project_name (str): Name of the Django project
+        apps (list[str]): App names to include boilerplate for
+        API (bool, optional): Include the REST framework requirements. Defaults to False.
+        secret_key (str, optional): Pre-generated SECRET_KEY for the .env file
+        microservices (bool, optional): Use the microservices app layout. Defaults to False.
+        fmt (str, optional): "tar.gz" or "zip"; guessed from target's extension when omitted.
+        asgi (bool, optional): Async views and ASGI deployment files. Defaults to False.
+
+    Returns:
+        dict: {"format": fmt, "files": count, "bytes": uncompressed size}
+    """
+    # Imported here: tarfile/zipfile are only needed for archive output.
+    from archive_writer import write_archive
+    from .project import README_TEMPLATE
+
+    readme_content = README_TEMPLATE.format(
+        project_name=project_name,
+        apps_list="\n".join([f"- {app}" for app in apps]),
+    )
+    files = {
+        f"{project_name}/{filename}": content
+        for filename, content in project_files(project_name, readme_content, API, secret_key, asgi).items()
+    }
+    for app_name in apps:
+        files.update(app_boilerplate_files(app_name, project_name, microservices, asgi=asgi))
+
+    try:
+        return write_archive(files, target, fmt=fmt)
+    except OSError as e:
+        print(f"Error writing archive {e.filename or target}: {e}")
+        raise
@@ -0,0 +1,723 @@
+# Keyset pagination helpers shared by the generated index views
+PAGINATION_TEMPLATE = """import base64
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Q
+
+# "estimate": Postgres planner statistics (pg_class.reltuples) for unfiltered
+#             tables, falling back to "cached" for filtered querysets and
+#             other databases; "cached": COUNT(*) cached for
+#             PAGINATION_COUNT_CACHE_TIMEOUT seconds; "exact": COUNT(*) per
+#             request; "none": no total at all.
+COUNT_MODE = getattr(settings, "PAGINATION_COUNT_MODE", "estimate")
+COUNT_CACHE_TIMEOUT = getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", 300)
+
+
+def related_fields(model):
+    '''
+    Splits the model's forward relations into (select_related, prefetch_related)
+    names: foreign keys and one-to-ones are joined, many-to-manys are
+    prefetched. Reverse relations are left alone.
+    '''
+    joined, prefetched = [], []
+    for field in model._meta.get_fields():
+        if not field.is_relation or field.auto_created or not field.concrete:
+            continue
+        if field.many_to_many:
+            prefetched.append(field.name)
+        elif field.many_to_one or field.one_to_one:
+            joined.append(field.name)
+    return joined, prefetched
+
+
+def with_relations(queryset):
+    '''Loads exactly the forward relations of the queryset's model.'''
+    joined, prefetched = related_fields(queryset.model)
+    if joined:
+        queryset = queryset.select_related(*joined)
+    if prefetched:
+        queryset = queryset.prefetch_related(*prefetched)
+    return queryset
+
+
+def _estimated_count(queryset):
+    if connection.vendor != "postgresql" or queryset.query.where:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 (or 0) until the table has been analyzed.
+    return row[0] if row and row[0] > 0 else None
+
+
+def _count_key(queryset):
+    sql, params = queryset.query.sql_with_params()
+    return "pagination-count:" + hashlib.sha1(f"{sql}|{params}".encode("utf-8")).hexdigest()
+
+
+def _cached_count(queryset):
+    key = _count_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, COUNT_CACHE_TIMEOUT)
+    return count
+
+
+async def _acached_count(queryset):
+    key = _count_key(queryset)
+    count = await cache.aget(key)
+    if count is None:
+        count = await queryset.acount()
+        await cache.aset(key, count, COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def page_total(queryset, mode=None):
+    '''
+    Returns (count, is_estimate) for ``queryset`` according to ``mode``
+    (PAGINATION_COUNT_MODE by default); count is None with mode "none".
+    '''
+    mode = mode or COUNT_MODE
+    if mode == "none":
+        return None, False
+    if mode == "estimate":
+        estimate = _estimated_count(queryset)
+        if estimate is not None:
+            return estimate, True
+        mode = "cached"
+    if mode == "cached":
+        return _cached_count(queryset), True
+    return queryset.count(), False
+
+
+async def apage_total(queryset, mode=None):
+    '''page_total() for async views.'''
+    mode = mode or COUNT_MODE
+    if mode == "none":
+        return None, False
+    if mode == "estimate":
+        estimate = await sync_to_async(_estimated_count)(queryset)
+        if estimate is not None:
+            return estimate, True
+        mode = "cached"
+    if mode == "cached":
+        return await _acached_count(queryset), True
+    return await queryset.acount(), False
+
+
+def _encode_cursor(values):
+    raw = json.dumps(values, default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+class KeysetPage:
+    '''
+    One page of a keyset-paginated queryset. ``next_cursor`` is passed back
+    as ?after=... to fetch the following page; ``count`` is the total from
+    page_total().
+    '''
+
+    def __init__(self, object_list, per_page, has_next, next_cursor, cursor, count, count_is_estimate):
+        self.object_list = object_list
+        self.per_page = per_page
+        self.has_next = has_next
+        self.next_cursor = next_cursor
+        self.has_previous = cursor is not None
+        self.cursor = cursor
+        self.count = count
+        self.count_is_estimate = count_is_estimate
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def _keyset_query(queryset, request):
+    '''
+    Returns (ordered queryset, the same filtered past the ?after= cursor,
+    ordering field, cursor or None).
+    '''
+    model = queryset.model
+    ordering = (model._meta.ordering or ["-pk"])[0]
+    descending = ordering.startswith("-")
+    name = ordering.lstrip("-")
+    pk_field = model._meta.pk
+    field = pk_field if name in ("pk", pk_field.name) else model._meta.get_field(name)
+    direction = "-" if descending else ""
+    lookup = "lt" if descending else "gt"
+
+    ordered = with_relations(queryset).order_by(f"{direction}{field.name}", f"{direction}{pk_field.name}")
+    cursor = request.GET.get("after") or None
+    if cursor:
+        try:
+            raw_value, raw_pk = _decode_cursor(cursor)
+            value = field.to_python(raw_value)
+            pk = pk_field.to_python(raw_pk)
+            if value is None or pk is None:
+                raise ValueError("cursor has no position")
+            paged = ordered.filter(
+                Q(**{f"{field.name}__{lookup}": value})
+                | Q(**{field.name: value, f"{pk_field.name}__{lookup}": pk})
+            )
+        except (ValueError, TypeError, ValidationError):
+            # Malformed or tampered cursor (including null or empty values,
+            # which lt/gt cannot compare): serve the first page
+            cursor = None
+        else:
+            return ordered, paged, field, cursor
+    return ordered, ordered, field, cursor
+
+
+def _page(rows, per_page, field, cursor, count, count_is_estimate):
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = _encode_cursor([field.value_to_string(last), last.pk])
+    return KeysetPage(rows, per_page, has_next, next_cursor, cursor, count, count_is_estimate)
+
+
+def keyset_paginate(queryset, request, per_page=25, count_mode=None):
+    '''
+    Pages ``queryset`` by the first field of the model's Meta.ordering
+    (e.g. "-created_at") with the primary key as tie-breaker. Each page is
+    WHERE (field, pk) < (last row seen) ... LIMIT n, which an index on the
+    field serves at the same cost on every page, unlike OFFSET.
+    '''
+    ordered, paged, field, cursor = _keyset_query(queryset, request)
+    count, count_is_estimate = page_total(ordered, count_mode)
+    rows = list(paged[:per_page + 1])
+    return _page(rows, per_page, field, cursor, count, count_is_estimate)
+
+
+async def akeyset_paginate(queryset, request, per_page=25, count_mode=None):
+    '''keyset_paginate() for async views, on the async ORM.'''
+    ordered, paged, field, cursor = _keyset_query(queryset, request)
+    count, count_is_estimate = await apage_total(ordered, count_mode)
+    window = paged[:per_page + 1]
+    if related_fields(queryset.model)[1]:
+        # Async iteration of prefetch_related querysets needs Django 5.0.
+        rows = await sync_to_async(list)(window)
+    else:
+        rows = [obj async for obj in window]
+    return _page(rows, per_page, field, cursor, count, count_is_estimate)
+"""
+
+
+# Chunked bulk write helpers shared by the generated models
+BULK_TEMPLATE = """from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from project_name.logger import audit_batch
+
+BULK_BATCH_SIZE = getattr(settings, "BULK_BATCH_SIZE", 1000)
+
+
+def chunks(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class BulkQuerySet(models.QuerySet):
+    '''
+    Bulk writes in chunks of BULK_BATCH_SIZE rows, one transaction per
+    chunk, so a large import neither holds one huge transaction nor pays a
+    round trip per row. A failing chunk rolls back on its own; earlier
+    chunks stay committed.
+
+    bulk_create/bulk_update skip save() and post_save, so audited models get
+    one audit_batch() line per chunk instead.
+    '''
+
+    def bulk_create_chunked(self, objs, batch_size=None, **kwargs):
+        '''Inserts ``objs`` and returns how many rows were created.'''
+        created = 0
+        for chunk in chunks(objs, batch_size or BULK_BATCH_SIZE):
+            with transaction.atomic(using=self.db):
+                saved = self.bulk_create(chunk, **kwargs)
+            audit_batch(self.model, "Created", saved)
+            created += len(saved)
+        return created
+
+    def bulk_update_chunked(self, objs, fields, batch_size=None):
+        '''
+        Writes ``fields`` of ``objs`` and returns how many rows were updated.
+        auto_now fields (e.g. updated_at) are refreshed and written too.
+        '''
+        fields = list(fields)
+        auto_now = [f.name for f in self.model._meta.concrete_fields if getattr(f, "auto_now", False)]
+        fields += [name for name in auto_now if name not in fields]
+        now = timezone.now()
+        updated = 0
+        for chunk in chunks(objs, batch_size or BULK_BATCH_SIZE):
+            for obj in chunk:
+                for name in auto_now:
+                    setattr(obj, name, now)
+            with transaction.atomic(using=self.db):
+                updated += self.bulk_update(chunk, fields)
+            audit_batch(self.model, "Updated", chunk)
+        return updated
+
+    def bulk_delete_chunked(self, pks, batch_size=None):
+        '''
+        Deletes the rows with the given primary keys and returns how many
+        were deleted. Audited models still log each delete via post_delete.
+        '''
+        deleted = 0
+        for chunk in chunks(pks, batch_size or BULK_BATCH_SIZE):
+            with transaction.atomic(using=self.db):
+                count, _ = self.filter(pk__in=chunk).delete()
+            deleted += count
+        return deleted
+
+
+BulkManager = models.Manager.from_queryset(BulkQuerySet)
+"""
+
+
+# Boilerplate code templates for the default app files
+APP_TEMPLATE = {
+    "models.py": """from django.db import models
+from django.core.validators import MinLengthValidator, RegexValidator
+from app_name.bulk import BulkManager
+from project_name.logger import audit_model
+
+class SampleModel(models.Model):
+    STATUS_CHOICES = [
+        ('active', 'Active'),
+        ('inactive', 'Inactive'),
+        ('pending', 'Pending'),
+    ]
+    
+    title = models.CharField(
+        max_length=100,
+        validators=[
+            MinLengthValidator(3, 'Title must be at least 3 characters long'),
+            RegexValidator(r'^[a-zA-Z0-9\s]+$', 'Title can only contain letters, numbers and spaces')
+        ],
+        help_text='Enter a descriptive title (3-100 characters)'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='active',
+        db_index=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = BulkManager()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Sample Model'
+        verbose_name_plural = 'Sample Models'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+        # constraints = [
+        #     models.CheckConstraint(
+        #         check=models.Q(title__length__gte=3),
+        #         name='title_min_length'
+        #     ),
+        # ]
+
+    def __str__(self):
+        return self.title
+    
+    def clean(self):
+        if self.title:
+            self.title = self.title.strip().title()
+
+
+# Saves and deletes are logged through signals only when MODEL_AUDIT_LOG is
+# on in settings; otherwise nothing is connected and they cost nothing extra.
+audit_model(SampleModel)
+""",
+
+    "views.py": """from django.shortcuts import render
+from django.db import DatabaseError
+from app_name.models import SampleModel
+from app_name.pagination import keyset_paginate
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.views')
+
+def index(request):
+    try:
+        logger.debug("Index view accessed by user: %s", request.user)
+
+        # Keyset pagination: ?after=<cursor> instead of ?page=N, so deep pages
+        # cost the same as the first one and no COUNT(*) runs per request.
+        page_obj = keyset_paginate(SampleModel.objects.all(), request, per_page=25)
+
+        logger.debug("Retrieved %d items, next cursor %s", len(page_obj), page_obj.next_cursor)
+        return render(request, 'app_name/index.html', {'page_obj': page_obj})
+        
+    except DatabaseError as e:
+        logger.error(f"Database error in index view: {e}")
+        return render(request, 'app_name/error.html', {'error': 'Database connection error'})
+    except Exception as e:
+        logger.error(f"Unexpected error in index view: {e}")
+        return render(request, 'app_name/error.html', {'error': 'An unexpected error occurred'})
+
+""",
+
+    "urls.py": """from django.urls import path
+from app_name.views import index
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.urls')
+
+urlpatterns = [
+    path('', index, name='index'),
+]
+
+logger.info("app_name URL patterns loaded")
+
+""",
+
+    "admin.py": """from django.contrib import admin
+from app_name.models import SampleModel
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.admin')
+
+@admin.register(SampleModel)
+class SampleModelAdmin(admin.ModelAdmin):
+    list_display = ['title', 'status', 'created_at', 'updated_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['title']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'updated_at']
+    list_per_page = 25
+    actions = ['mark_active', 'mark_inactive']
+    
+    fieldsets = (
+        ('Basic Information', {
+            'fields': ('title', 'status')
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+    
+    def save_model(self, request, obj, form, change):
+        try:
+            logger.info(f"Admin saving SampleModel by {request.user}")
+            super().save_model(request, obj, form, change)
+            logger.info(f"Admin saved SampleModel: {obj.pk}")
+        except Exception as e:
+            logger.error(f"Error saving SampleModel in admin: {e}")
+            raise
+    
+    def delete_model(self, request, obj):
+        try:
+            logger.warning(f"Admin deleting SampleModel: {obj.pk}")
+            super().delete_model(request, obj)
+            logger.info(f"Admin deleted SampleModel")
+        except Exception as e:
+            logger.error(f"Error deleting SampleModel in admin: {e}")
+            raise
+
+    @admin.action(description='Mark selected as active')
+    def mark_active(self, request, queryset):
+        self._set_status(request, queryset, 'active')
+
+    @admin.action(description='Mark selected as inactive')
+    def mark_inactive(self, request, queryset):
+        self._set_status(request, queryset, 'inactive')
+
+    def _set_status(self, request, queryset, status):
+        # One chunked bulk_update instead of a save() per selected row.
+        objs = list(queryset.only('pk', 'status'))
+        for obj in objs:
+            obj.status = status
+        updated = SampleModel.objects.bulk_update_chunked(objs, ['status'])
+        self.message_user(request, f"{updated} rows marked {status}.")
+
+""",
+
+    "tests.py": """from django.test import TestCase, Client
+from django.urls import reverse
+from django.core.exceptions import ValidationError
+from app_name.models import SampleModel
+from django.contrib.auth.models import User
+
+class SampleModelTest(TestCase):
+    def setUp(self):
+        self.sample_data = {
+            'title': 'Test Sample',
+            'status': 'active'
+        }
+    
+    def test_model_creation(self):
+        obj = SampleModel.objects.create(**self.sample_data)
+        self.assertEqual(obj.title, 'Test Sample')
+        self.assertEqual(obj.status, 'active')
+        self.assertTrue(obj.created_at)
+        self.assertTrue(obj.updated_at)
+    
+    def test_model_str_representation(self):
+        obj = SampleModel.objects.create(**self.sample_data)
+        self.assertEqual(str(obj), 'Test Sample')
+    
+    def test_model_validation(self):
+        with self.assertRaises(ValidationError):
+            obj = SampleModel(title='AB', status='active')
+            obj.full_clean()
+    
+    def test_model_choices(self):
+        valid_statuses = ['active', 'inactive', 'pending']
+        for status in valid_statuses:
+            obj = SampleModel.objects.create(title='Test', status=status)
+            self.assertEqual(obj.status, status)
+
+class SampleModelViewTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        for i in range(30):
+            SampleModel.objects.create(
+                title=f'Test Item {i}',
+                status='active'
+            )
+    
+    def test_index_view_status_code(self):
+        response = self.client.get(reverse('index'))
+        self.assertEqual(response.status_code, 200)
+    
+    def test_index_view_pagination(self):
+        response = self.client.get(reverse('index'))
+        self.assertContains(response, 'page_obj')
+        self.assertTrue('page_obj' in response.context)
+    
+    def test_index_view_with_authenticated_user(self):
+        self.client.login(username='testuser', password='testpass123')
+        response = self.client.get(reverse('index'))
+        self.assertEqual(response.status_code, 200)
+""",
+
+
+
+    "forms.py": """from django import forms
+from app_name.models import SampleModel
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.forms')
+
+class SampleModelForm(forms.ModelForm):
+    class Meta:
+        model = SampleModel
+        fields = ['title', 'status']
+        widgets = {
+            'title': forms.TextInput(attrs={'placeholder': 'Enter title (3-100 characters)'}),
+            'status': forms.Select(attrs={'class': 'form-select'}),
+        }
+    
+    def clean_title(self):
+        title = self.cleaned_data.get('title')
+        if title:
+            title = title.strip()
+            if len(title) < 3:
+                raise forms.ValidationError('Title must be at least 3 characters long')
+            if not title.replace(' ', '').isalnum():
+                raise forms.ValidationError('Title can only contain letters, numbers and spaces')
+        logger.debug("Validating title: %s", title)
+        return title
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        title = cleaned_data.get('title')
+        if title:
+            cleaned_data['title'] = title.title()
+        return cleaned_data
+    
+    def save(self, commit=True):
+        try:
+            logger.info("Saving SampleModelForm")
+            instance = super().save(commit)
+            logger.info(f"Form saved: {instance.pk}")
+            return instance
+        except Exception as e:
+            logger.error(f"Error saving form: {e}")
+            raise
+
+""",
+
+    "pagination.py": PAGINATION_TEMPLATE,
+
+    "bulk.py": BULK_TEMPLATE,
+
+    "management/__init__.py": "",
+
+    "management/commands/__init__.py": "",
+
+    "management/commands/benchmark_models.py": """import statistics
+import time
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+from django.apps import apps
+
+from project_name.logger import disable_audit, enable_audit
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Times bulk save() and the admin changelist of SampleModel with audit "
+        "logging off and on. Everything runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--app", default="app_name", help="app whose SampleModel is benchmarked")
+        parser.add_argument("--rows", type=int, default=1000, help="objects saved per run")
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        model = apps.get_model(options["app"], "SampleModel")
+        model_admin = admin.site._registry.get(model)
+        results = {}
+        for mode in ("off", "on"):
+            if mode == "on":
+                enable_audit(model)
+            else:
+                disable_audit(model)
+            saves, renders = [], []
+            for _ in range(options["runs"]):
+                save_time, render_time = self.run_once(model, model_admin, options["rows"])
+                saves.append(save_time)
+                renders.append(render_time)
+            results[mode] = (statistics.median(saves), statistics.median(renders) if model_admin else None)
+        disable_audit(model)
+
+        rows = options["rows"]
+        for mode, (save_time, render_time) in results.items():
+            line = f"audit {mode:3}  save x{rows}: {save_time * 1000:8.1f} ms"
+            if render_time is not None:
+                line += f"   changelist: {render_time * 1000:8.1f} ms"
+            self.stdout.write(line)
+
+    def run_once(self, model, model_admin, rows):
+        render_time = None
+        try:
+            with transaction.atomic():
+                started = time.perf_counter()
+                for i in range(rows):
+                    model(title=f"Benchmark {i}").save()
+                save_time = time.perf_counter() - started
+
+                if model_admin is not None:
+                    request = RequestFactory().get("/admin/")
+                    request.user = get_user_model()(is_staff=True, is_superuser=True, is_active=True)
+                    with override_settings(ALLOWED_HOSTS=["*"]):
+                        started = time.perf_counter()
+                        model_admin.changelist_view(request).render()
+                        render_time = time.perf_counter() - started
+                raise Rollback
+        except Rollback:
+            pass
+        return save_time, render_time
+"""
+}
+
+# views.py variant for ASGI projects (asgi=True)
+ASGI_APP_TEMPLATE = {
+    "views.py": """from django.db import DatabaseError
+from django.forms.models import model_to_dict
+from django.http import JsonResponse
+from django.shortcuts import render
+from app_name.models import SampleModel
+from app_name.pagination import akeyset_paginate
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.views')
+
+async def index(request):
+    # Async view: the queries below use the async ORM, so under an ASGI
+    # server this worker keeps serving other requests while they run.
+    try:
+        page_obj = await akeyset_paginate(SampleModel.objects.all(), request, per_page=25)
+
+        logger.debug("Retrieved %d items, next cursor %s", len(page_obj), page_obj.next_cursor)
+        return render(request, 'app_name/index.html', {'page_obj': page_obj})
+
+    except DatabaseError as e:
+        logger.error("Database error in index view: %s", e)
+        return render(request, 'app_name/error.html', {'error': 'Database connection error'})
+    except Exception as e:
+        logger.error("Unexpected error in index view: %s", e)
+        return render(request, 'app_name/error.html', {'error': 'An unexpected error occurred'})
+
+
+async def detail(request, pk):
+    try:
+        item = await SampleModel.objects.aget(pk=pk)
+    except SampleModel.DoesNotExist:
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse(model_to_dict(item))
+
+""",
+
+    "urls.py": """from django.urls import path
+from app_name.views import detail, index
+
+urlpatterns = [
+    path('', index, name='index'),
+    path('<int:pk>/', detail, name='detail'),
+]
+""",
+}
+
+# Custom User model boilerplate for auth-enabled app
+AUTH_MODEL = """from django.contrib.auth.models import AbstractUser
+from django.db import models
+from django.core.validators import MaxLengthValidator
+
+class CustomUser(AbstractUser):
+    bio = models.TextField(
+        blank=True,
+        max_length=500,
+        validators=[MaxLengthValidator(500, 'Bio cannot exceed 500 characters')],
+        help_text='Optional bio (max 500 characters)'
+    )
+    
+    class Meta:
+        verbose_name = 'User'
+        verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['email']),
+            models.Index(fields=['username']),
+        ]
+"""
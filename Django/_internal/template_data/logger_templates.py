@@ -0,0 +1,209 @@
+logger_settings = """DYNAMIC_LOG_PATH = os.path.join(BASE_DIR, "Logs")
+LOG_DIRECTORY = os.path.join(DYNAMIC_LOG_PATH, "server_logs")
+LOG_LEVEL = os.environ.get("DJANGO_LOG_LEVEL", "INFO")
+LOG_QUEUE = True          # write records from a background thread (see logger.py)
+LOG_QUEUE_SIZE = 10000    # records beyond this are dropped and counted
+MODEL_AUDIT_LOG = False   # log saves/deletes of models registered with audit_model()
+MODEL_AUDIT_SAMPLE_RATE = 1.0  # fraction of saves/deletes logged when MODEL_AUDIT_LOG is on
+
+os.makedirs(LOG_DIRECTORY, exist_ok=True)
+
+# Applied once by django.setup(). Module loggers from logger_object()
+# propagate to the root handlers below.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s [%(levelname)s] [%(name)s] %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S',
+        },
+        'json': {
+            'format': '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "module": "%(name)s", "message": "%(message)s"}',
+            'datefmt': '%Y-%m-%d %H:%M:%S',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'standard',
+        },
+        'file': {
+            # Rotated files are suffixed with their date (server.log.2025-10-10).
+            'class': 'logging.handlers.TimedRotatingFileHandler',
+            'formatter': 'standard',
+            'filename': os.path.join(LOG_DIRECTORY, 'server.log'),
+            'encoding': 'utf-8',
+            'when': 'midnight',
+            'backupCount': 5,
+            'delay': True,
+        },
+    },
+    'root': {
+        'handlers': ['console', 'file'],
+        'level': LOG_LEVEL,
+    },
+}
+"""
+
+logger_template = """import atexit
+import logging
+import os
+import queue
+import random
+import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+_lock = threading.Lock()
+_configured = False
+_listener = None
+_audited = set()
+
+
+class DroppingQueueHandler(QueueHandler):
+    '''
+    QueueHandler that drops records when the queue is full instead of
+    blocking the request thread, and counts what it dropped.
+    '''
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _start_listener(targets):
+    '''
+    Puts ``targets`` behind a queue on the root logger, so file and console
+    writes happen on one background thread.
+    '''
+    global _listener
+    handler = DroppingQueueHandler(queue.Queue(getattr(settings, "LOG_QUEUE_SIZE", 10000)))
+    logging.getLogger().handlers = [handler]
+    _listener = QueueListener(handler.queue, *targets, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener():
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_in_child():
+    # Threads do not survive fork() (e.g. gunicorn --preload), so each
+    # worker gets a fresh queue and listener thread.
+    global _lock
+    _lock = threading.Lock()
+    if _listener is not None:
+        _start_listener(_listener.handlers)
+
+
+def configure_logging() -> None:
+    '''
+    Runs once per process. Handlers and levels come from settings.LOGGING,
+    which django.setup() has already applied.
+    '''
+    global _configured
+    if _configured:
+        return
+    with _lock:
+        if _configured:
+            return
+        _configured = True
+        if not getattr(settings, "LOG_QUEUE", True):
+            return
+        _start_listener(tuple(logging.getLogger().handlers))
+    atexit.register(_stop_listener)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_restart_in_child)
+
+
+def dropped_records() -> int:
+    '''Number of log records dropped because the queue was full.'''
+    return sum(h.dropped for h in logging.getLogger().handlers if isinstance(h, DroppingQueueHandler))
+
+
+@lru_cache(maxsize=None)
+def logger_object(api_module: str) -> logging.Logger:
+    '''
+    Returns a logger for the given module.
+    - Logs to the handlers in settings.LOGGING (console and a daily rotated file).
+    - Records are written by a background thread when LOG_QUEUE is on.
+    '''
+    configure_logging()
+    return logging.getLogger(api_module)
+
+
+def _audit_receivers(model, sample_rate):
+    audit_logger = logger_object(f"{model._meta.app_label}.audit")
+    label = model._meta.label
+
+    def sampled():
+        return sample_rate >= 1.0 or random.random() < sample_rate
+
+    def on_save(sender, instance, created, **kwargs):
+        if sampled():
+            audit_logger.info("%s %s pk=%s", "Created" if created else "Updated", label, instance.pk)
+
+    def on_delete(sender, instance, **kwargs):
+        if sampled():
+            audit_logger.info("Deleted %s pk=%s", label, instance.pk)
+
+    return on_save, on_delete
+
+
+def enable_audit(model, sample_rate: float = None) -> None:
+    '''
+    Logs every save and delete of ``model`` (or a ``sample_rate`` fraction of
+    them) through post_save/post_delete signals, with lazy %-formatting.
+    '''
+    if sample_rate is None:
+        sample_rate = getattr(settings, "MODEL_AUDIT_SAMPLE_RATE", 1.0)
+    on_save, on_delete = _audit_receivers(model, sample_rate)
+    uid = f"audit:{model._meta.label}"
+    disable_audit(model)
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=uid)
+    _audited.add(model._meta.label)
+
+
+def disable_audit(model) -> None:
+    uid = f"audit:{model._meta.label}"
+    post_save.disconnect(sender=model, dispatch_uid=uid)
+    post_delete.disconnect(sender=model, dispatch_uid=uid)
+    _audited.discard(model._meta.label)
+
+
+def audit_batch(model, action: str, objs) -> None:
+    '''
+    Batched counterpart of the save receivers for bulk_create/bulk_update,
+    which send no per-object signals: one line per batch instead of one
+    per row, and nothing at all unless ``model`` is audited.
+    '''
+    if model._meta.label not in _audited:
+        return
+    pks = [obj.pk for obj in objs]
+    logger_object(f"{model._meta.app_label}.audit").info(
+        "%s %d %s rows (pk %s .. %s)", action, len(pks), model._meta.label, pks[0] if pks else None, pks[-1] if pks else None
+    )
+
+
+def audit_model(model):
+    '''
+    Class-level hook for models.py: enables audit logging for ``model`` when
+    settings.MODEL_AUDIT_LOG is on. When it is off no receivers are
+    connected, so saves, deletes and __str__ pay nothing for logging.
+    '''
+    if getattr(settings, "MODEL_AUDIT_LOG", False):
+        enable_audit(model)
+    return model
+"""
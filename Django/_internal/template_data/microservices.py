@@ -0,0 +1,321 @@
+from .app import BULK_TEMPLATE, PAGINATION_TEMPLATE
+
+# Microservices templates (clean imports)
+MICROSERVICES_TEMPLATE = {
+    "pagination.py": PAGINATION_TEMPLATE,
+
+    "bulk.py": BULK_TEMPLATE,
+
+    "views.py": """from django.shortcuts import render
+from django.db import DatabaseError
+from app_name.models.entity1_model import Entity1
+from app_name.models.entity2_model import Entity2
+from app_name.pagination import keyset_paginate
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.views')
+
+def index(request):
+    try:
+        logger.debug("Index view accessed by user: %s", request.user)
+
+        # Keyset pagination: ?after=<cursor> instead of ?page=N, so deep pages
+        # cost the same as the first one and no COUNT(*) runs per request.
+        page_obj = keyset_paginate(Entity1.objects.all(), request, per_page=25)
+
+        logger.debug("Retrieved %d items, next cursor %s", len(page_obj), page_obj.next_cursor)
+        return render(request, 'app_name/index.html', {'page_obj': page_obj})
+        
+    except DatabaseError as e:
+        logger.error(f"Database error in index view: {e}")
+        return render(request, 'app_name/error.html', {'error': 'Database connection error'})
+    except Exception as e:
+        logger.error(f"Unexpected error in index view: {e}")
+        return render(request, 'app_name/error.html', {'error': 'An unexpected error occurred'})
+
+""",
+
+    "admin.py": """from django.contrib import admin
+from app_name.models.entity1_model import Entity1
+from app_name.models.entity2_model import Entity2
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.admin')
+
+@admin.register(Entity1)
+class Entity1Admin(admin.ModelAdmin):
+    list_display = ['name', 'is_active', 'created_at']
+    list_filter = ['is_active', 'created_at']
+    search_fields = ['name']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'updated_at']
+    list_per_page = 25
+
+@admin.register(Entity2)
+class Entity2Admin(admin.ModelAdmin):
+    list_display = ['title', 'status', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['title']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'updated_at']
+    list_per_page = 25
+
+"""
+}
+
+# Microservices model templates
+MICROSERVICES_MODELS = {
+    "entity1_model.py": """from django.db import models
+from django.core.validators import MinLengthValidator, MaxLengthValidator
+from app_name.bulk import BulkManager
+
+class Entity1(models.Model):
+    name = models.CharField(
+        max_length=100,
+        validators=[
+            MinLengthValidator(2, 'Name must be at least 2 characters long'),
+            MaxLengthValidator(100, 'Name cannot exceed 100 characters')
+        ],
+        db_index=True,
+        help_text='Enter entity name (2-100 characters)'
+    )
+    description = models.TextField(
+        blank=True,
+        max_length=1000,
+        help_text='Optional description (max 1000 characters)'
+    )
+    is_active = models.BooleanField(
+        default=True,
+        db_index=True,
+        help_text='Whether this entity is active'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = BulkManager()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Entity 1'
+        verbose_name_plural = 'Entity 1 Records'
+        indexes = [
+            models.Index(fields=['is_active', 'created_at']),
+            models.Index(fields=['name']),
+        ]
+        # constraints = [
+        #     models.CheckConstraint(
+        #         check=models.Q(name__length__gte=2),
+        #         name='entity1_name_min_length'
+        #     ),
+        # ]
+
+    def __str__(self):
+        return self.name
+    
+    def clean(self):
+        if self.name:
+            self.name = self.name.strip()
+""",
+
+    "entity2_model.py": """from django.db import models
+from django.core.validators import MinLengthValidator
+from app_name.bulk import BulkManager
+
+class Entity2(models.Model):
+    STATUS_CHOICES = [
+        ('active', 'Active'),
+        ('inactive', 'Inactive'),
+        ('draft', 'Draft'),
+        ('archived', 'Archived'),
+    ]
+    
+    title = models.CharField(
+        max_length=100,
+        validators=[
+            MinLengthValidator(3, 'Title must be at least 3 characters long')
+        ],
+        db_index=True,
+        help_text='Enter title (3-100 characters)'
+    )
+    content = models.TextField(
+        blank=True,
+        max_length=5000,
+        help_text='Optional content (max 5000 characters)'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='active',
+        db_index=True,
+        help_text='Current status of the entity'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = BulkManager()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Entity 2'
+        verbose_name_plural = 'Entity 2 Records'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['title']),
+        ]
+        # constraints = [
+        #     models.CheckConstraint(
+        #         check=models.Q(title__length__gte=3),
+        #         name='entity2_title_min_length'
+        #     ),
+        # ]
+
+    def __str__(self):
+        return self.title
+    
+    def clean(self):
+        if self.title:
+            self.title = self.title.strip()
+"""
+}
+
+# views.py variant for ASGI services (asgi=True); urls.py comes from ASGI_APP_TEMPLATE
+ASGI_MICROSERVICES_TEMPLATE = {
+    "views.py": """from django.db import DatabaseError
+from django.forms.models import model_to_dict
+from django.http import JsonResponse
+from django.shortcuts import render
+from app_name.models.entity1_model import Entity1
+from app_name.pagination import akeyset_paginate
+from project_name.logger import logger_object
+
+logger = logger_object('app_name.views')
+
+async def index(request):
+    # Async view: the queries below use the async ORM, so under an ASGI
+    # server this worker keeps serving other requests while they run.
+    try:
+        page_obj = await akeyset_paginate(Entity1.objects.all(), request, per_page=25)
+
+        logger.debug("Retrieved %d items, next cursor %s", len(page_obj), page_obj.next_cursor)
+        return render(request, 'app_name/index.html', {'page_obj': page_obj})
+
+    except DatabaseError as e:
+        logger.error("Database error in index view: %s", e)
+        return render(request, 'app_name/error.html', {'error': 'Database connection error'})
+    except Exception as e:
+        logger.error("Unexpected error in index view: %s", e)
+        return render(request, 'app_name/error.html', {'error': 'An unexpected error occurred'})
+
+
+async def detail(request, pk):
+    try:
+        item = await Entity1.objects.aget(pk=pk)
+    except Entity1.DoesNotExist:
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse(model_to_dict(item))
+
+""",
+}
+
+
+# DRF /bulk/ endpoints for the generated API viewsets (apis/v1/<app>/bulk.py)
+BULK_API_TEMPLATE = """from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+BULK_MAX_ITEMS = getattr(settings, "BULK_MAX_ITEMS", 10000)
+
+
+class BulkActionsMixin:
+    '''
+    Adds /bulk/ to a ModelViewSet whose model uses BulkManager:
+
+        POST   /bulk/  [{...}, ...]             create, one bulk_create per chunk
+        PATCH  /bulk/  [{"id": 1, ...}, ...]    partial update, one bulk_update per chunk
+        DELETE /bulk/  {"ids": [1, 2, ...]}     delete by primary key
+
+    Every item is validated by the viewset's create/update serializer
+    before anything is written. A request may carry up to BULK_MAX_ITEMS
+    items; send larger imports in several requests.
+    '''
+
+    bulk_create_serializer_action = 'create'
+    bulk_update_serializer_action = 'partial_update'
+
+    def _bulk_items(self, data):
+        if not isinstance(data, list):
+            raise ValidationError({'detail': 'Expected a list of objects.'})
+        if len(data) > BULK_MAX_ITEMS:
+            raise ValidationError({'detail': f'At most {BULK_MAX_ITEMS} items per request.'})
+        return data
+
+    def _pks(self, model, values):
+        # JSON ids may arrive as strings ("1"); in_bulk() keys are typed.
+        pk_field = model._meta.pk
+        try:
+            return [pk_field.to_python(value) for value in values]
+        except DjangoValidationError:
+            raise ValidationError({'detail': f'Invalid "{pk_field.name}" value.'})
+
+    def _serializer_class_for(self, serializer_action):
+        current, self.action = self.action, serializer_action
+        try:
+            return self.get_serializer_class()
+        finally:
+            self.action = current
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        items = self._bulk_items(request.data)
+        serializer_class = self._serializer_class_for(self.bulk_create_serializer_action)
+        serializer = serializer_class(data=items, many=True, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        model = self.get_queryset().model
+        created = model.objects.bulk_create_chunked(model(**attrs) for attrs in serializer.validated_data)
+        return Response({'created': created}, status=status.HTTP_201_CREATED)
+
+    @bulk.mapping.patch
+    def bulk_update(self, request):
+        items = self._bulk_items(request.data)
+        model = self.get_queryset().model
+        pk_name = model._meta.pk.name
+        try:
+            raw_ids = [item[pk_name] for item in items]
+        except (KeyError, TypeError):
+            raise ValidationError({'detail': f'Every item needs "{pk_name}".'})
+        ids = self._pks(model, raw_ids)
+        instances = self.get_queryset().in_bulk(ids)
+        missing = [pk for pk in ids if pk not in instances]
+        if missing:
+            raise ValidationError({'detail': 'Not found.', 'ids': missing[:100]})
+
+        serializer_class = self._serializer_class_for(self.bulk_update_serializer_action)
+        context = self.get_serializer_context()
+        objs, fields, errors = [], set(), {}
+        for pk, item in zip(ids, items):
+            instance = instances[pk]
+            serializer = serializer_class(instance, data=item, partial=True, context=context)
+            if not serializer.is_valid():
+                errors[str(pk)] = serializer.errors
+                continue
+            for name, value in serializer.validated_data.items():
+                setattr(instance, name, value)
+            fields.update(serializer.validated_data)
+            objs.append(instance)
+        if errors:
+            raise ValidationError(errors)
+        updated = model.objects.bulk_update_chunked(objs, sorted(fields)) if fields else 0
+        return Response({'updated': updated})
+
+    @bulk.mapping.delete
+    def bulk_delete(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list):
+            raise ValidationError({'detail': 'Expected {"ids": [...]}.'})
+        self._bulk_items(ids)
+        deleted = self.get_queryset().bulk_delete_chunked(self._pks(self.get_queryset().model, ids))
+        return Response({'deleted': deleted})
+"""
@@ -0,0 +1,577 @@
+# Template for README.md content with placeholders
+README_TEMPLATE = """# {project_name}
+
+## 🚀 Setup Instructions
+
+1. Create virtual environment 
+   `python -m venv venv && source venv/bin/activate`
+
+2. Install dependencies 
+   `pip install -r requirements.txt`
+
+3. Run migrations 
+   `python manage.py migrate`
+
+4. Start development server
+   `python manage.py runserver`
+
+## 🧱 Apps Included
+{apps_list}
+"""
+
+GITIGNORE_TEMPLATE = """# Python-generated files
+__pycache__/
+*/__pycache__/*
+*.py[oc]
+
+# Distribution / packaging
+.Python
+build/
+downloads/
+lib/
+lib64/
+parts/
+sdist/
+pip-wheel-metadata/
+share/python-wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+MANIFEST
+
+# Installer logs
+pip-log.txt
+pip-delete-this-directory.txt
+
+# Unit test / coverage reports
+htmlcov/
+.tox/
+.nox/
+.coverage
+.coverage.*
+.cache
+nosetests.xml
+coverage.xml
+*.cover
+*.py,cover
+.hypothesis/
+.pytest_cache/
+
+# Translations
+*.mo
+*.pot
+
+# dist/
+wheels/
+*.egg-info
+
+# Environments
+.env
+.venv
+env/
+venv/
+ENV/
+env.bak/
+venv.bak/
+*env
+
+# C extensions
+*.so
+"""
+
+DOCKERFILE_TEMPLATE = """# Stage 1: Base build stage
+FROM python:3.13-slim AS builder
+ 
+# Install PostgreSQL client library and build tools
+RUN apt-get update && apt-get install -y \
+    libpq-dev \
+    gcc \
+    && rm -rf /var/lib/apt/lists/*
+
+# Create the app directory
+RUN mkdir /app
+ 
+# Set the working directory
+WORKDIR /app
+ 
+# Set environment variables to optimize Python
+ENV PYTHONDONTWRITEBYTECODE=1
+ENV PYTHONUNBUFFERED=1 
+ 
+# Upgrade pip and install dependencies
+RUN pip install --upgrade pip 
+ 
+# Copy the requirements file first (better caching)
+COPY requirements.txt /app/
+ 
+# Install Python dependencies
+RUN pip install --no-cache-dir -r requirements.txt
+ 
+# Stage 2: Production stage
+FROM python:3.13-slim
+ 
+# Install PostgreSQL client library for runtime
+RUN apt-get update && apt-get install -y \
+    libpq5 \
+    && rm -rf /var/lib/apt/lists/*
+
+RUN useradd -m -r appuser && \
+   mkdir /app && \
+   chown -R appuser /app
+ 
+# Copy the Python dependencies from the builder stage
+COPY --from=builder /usr/local/lib/python3.13/site-packages/ /usr/local/lib/python3.13/site-packages/
+COPY --from=builder /usr/local/bin/ /usr/local/bin/
+ 
+# Set the working directory
+WORKDIR /app
+ 
+# Copy application code
+COPY --chown=appuser:appuser . .
+ 
+# Set environment variables to optimize Python
+ENV PYTHONDONTWRITEBYTECODE=1
+ENV PYTHONUNBUFFERED=1 
+ 
+# Switch to non-root user
+USER appuser
+ 
+# Expose the application port
+EXPOSE 8000 
+ 
+# Start the application using Gunicorn
+CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "3", "{project_name}.wsgi:application"]
+"""
+
+DOCKER_COMPOSE_TEMPLATE = """services:
+ db:
+   image: postgres:15
+   environment:
+     POSTGRES_DB: ${DB_NAME}
+     POSTGRES_USER: ${DB_USER}
+     POSTGRES_PASSWORD: ${DB_PASSWORD}
+   ports:
+     - "${DB_PORT}:${DB_PORT}"
+   volumes:
+     - postgres_data:/var/lib/postgresql/data
+   env_file:
+     - .env
+ 
+ web:
+   build: .
+   container_name: django-docker
+   ports:
+     - "8000:8000"
+   depends_on:
+     - db
+   environment:
+     SECRET_KEY: ${SECRET_KEY}
+     DEBUG: ${DEBUG}
+     ALLOWED_HOSTS: ${ALLOWED_HOSTS}
+     DB_NAME: ${DB_NAME}
+     DB_USER: ${DB_USER}
+     DB_PASSWORD: ${DB_PASSWORD}
+     DB_HOST: ${DB_HOST}
+     DB_PORT: ${DB_PORT}
+   env_file:
+     - .env
+volumes:
+   postgres_data:
+"""
+
+DOCKER_COMPOSE_PROD_TEMPLATE = """services:
+ db:
+   image: postgres:15
+   environment:
+     POSTGRES_DB: ${DB_NAME}
+     POSTGRES_USER: ${DB_USER}
+     POSTGRES_PASSWORD: ${DB_PASSWORD}
+   ports:
+     - "${DB_PORT}:${DB_PORT}"
+   volumes:
+     - postgres_data:/var/lib/postgresql/data
+   env_file:
+     - .env
+ 
+ web:
+   build: .
+   container_name: django-docker
+   ports:
+     - "8000:8000"
+   depends_on:
+     - db
+   environment:
+     SECRET_KEY: ${SECRET_KEY}
+     DEBUG: ${DEBUG}
+     ALLOWED_HOSTS: ${ALLOWED_HOSTS}
+     DB_NAME: ${DB_NAME}
+     DB_USER: ${DB_USER}
+     DB_PASSWORD: ${DB_PASSWORD}
+     DB_HOST: ${DB_HOST_PROD}
+     DB_PORT: ${DB_PORT}
+   env_file:
+     - .env
+volumes:
+   postgres_data:
+"""
+
+REQUIREMENTS_TEMPLATE = """# Django core framework for building web applications
+Django>=4.2,<5.0
+
+# PostgreSQL database adapter for Python (modern async-friendly version)
+psycopg>=3.2.10
+
+# Testing framework for Python
+pytest>=7.0
+
+# Pytest plugin for testing Django apps
+pytest-django>=4.5.0
+
+# Plugin to measure test coverage
+pytest-cov>=4.0.0
+
+# Factory library for generating test data
+factory-boy>=3.3.0
+
+# HTTP library for making API calls (used in integrations or external service calls)
+requests>=2.31.0
+
+# Production-grade WSGI server for running Django apps
+gunicorn>=21.2.0
+
+# Middleware for handling Cross-Origin Resource Sharing (CORS) in Django
+django-cors-headers>=4.3.0
+
+# Useful Django extensions for development (e.g., shell_plus, runscript)
+django-extensions>=3.2.0
+
+# Library for reading environment variables from `.env` files
+python-decouple>=3.8
+
+
+# Coding conventions
+ruff>=0.1.0
+"""
+
+REQUIREMENTS_WITH_API = """# Django REST Framework for API development
+djangorestframework>=3.14.0
+ 
+# Swagger/OpenAPI documentation for DRF
+drf-yasg>=1.21.0
+"""
+
+DOCKERIGNORE_TEMPLATE = """# Python
+__pycache__
+*.pyc
+*.pyo
+*.pyd
+.Python
+env
+venv
+.venv
+pip-log.txt
+pip-delete-this-directory.txt
+.tox
+.coverage
+.coverage.*
+.cache
+nosetests.xml
+coverage.xml
+*.cover
+*.log
+.git
+.mypy_cache
+.pytest_cache
+.hypothesis
+
+# OS
+.DS_Store
+.DS_Store?
+._*
+.Spotlight-V100
+.Trashes
+ehthumbs.db
+Thumbs.db
+
+# IDE
+.vscode
+.idea
+*.swp
+*.swo
+*~
+
+# Project
+.env
+.env.local
+.env.*.local
+node_modules
+"""
+
+ENV_TEMPLATE = """# Django Settings
+# SECURITY WARNING: Generate a new secret key for production!
+# Use: python -c "from django.core.management.utils import get_random_secret_key; print(get_random_secret_key())"
+SECRET_KEY={KEY}
+ALLOWED_HOSTS=localhost,127.0.0.1
+DEBUG=True
+DJANGO_SETTINGS_MODULE={project_name}.settings
+
+# Database Configuration
+DB_NAME={project_name}_db
+DB_USER=postgres
+DB_PASSWORD=postgres
+DB_HOST=localhost
+DB_HOST_PROD=db
+DB_PORT=5432
+
+"""
+
+HEALTH_CHECK_TEMPLATE = """
+from django.http import JsonResponse
+from django.db import connections
+from django.db.utils import OperationalError
+from django.views.decorators.http import require_http_methods
+
+@require_http_methods(["GET"])
+def health_check(request):
+    db_conn = connections['default']
+    try:
+        db_conn.cursor()
+        db_status = "ok"
+    except OperationalError:
+        db_status = "unhealthy"
+
+    data = {
+        "message": "Service is running",
+        "database": db_status,
+    }
+    return JsonResponse(data)
+"""
+
+# ASGI deployment (asgi=True)
+HEALTH_CHECK_ASYNC_TEMPLATE = """
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.db.utils import OperationalError
+from django.http import HttpResponseNotAllowed, JsonResponse
+
+
+def _database_status():
+    try:
+        connections['default'].ensure_connection()
+        return "ok"
+    except OperationalError:
+        return "unhealthy"
+
+
+async def health_check(request):
+    # require_http_methods only wraps async views from Django 5.0 on.
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    # Django database connections are synchronous; sync_to_async runs the
+    # check on the thread that owns this request's connection.
+    db_status = await sync_to_async(_database_status)()
+
+    data = {
+        "message": "Service is running",
+        "database": db_status,
+    }
+    return JsonResponse(data)
+"""
+
+DOCKERFILE_ASGI_TEMPLATE = DOCKERFILE_TEMPLATE.replace(
+    'CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "3", "{project_name}.wsgi:application"]',
+    '# Workers and the uvicorn worker class come from gunicorn.conf.py\n'
+    'CMD ["gunicorn", "-c", "gunicorn.conf.py", "{project_name}.asgi:application"]',
+)
+
+GUNICORN_ASGI_CONF_TEMPLATE = """# gunicorn.conf.py - loaded by `gunicorn -c gunicorn.conf.py <project>.asgi:application`
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Each uvicorn worker runs an event loop that interleaves many requests
+# waiting on I/O, so one worker per core keeps every core busy; sync
+# workers need 2 * cores + 1 to cover the time they spend blocked.
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then to bound memory growth.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = max_requests // 10
+"""
+
+REQUIREMENTS_ASGI = """
+# ASGI server: gunicorn process manager with uvicorn workers
+uvicorn[standard]>=0.30.0
+uvicorn-worker>=0.2.0
+"""
+
+LOADTEST_TEMPLATE = '''"""
+WSGI vs ASGI throughput for an I/O-bound endpoint.
+
+Starts the project under gunicorn twice, first with sync workers on the
+WSGI application and then with uvicorn workers on the ASGI application.
+Each run gets the same concurrent load on --path. The script prints requests
+per second and latency percentiles for both. Needs gunicorn, uvicorn-worker
+and a reachable database; the default /health/ endpoint queries it.
+
+    python scripts/loadtest.py --path /health/ --concurrency 64 --duration 15
+    python scripts/loadtest.py --url http://127.0.0.1:8000/health/   # load a running server only
+
+The load comes from threads on keep-alive connections, so run it on a
+different core set or machine than the server for numbers above a few
+thousand requests per second.
+"""
+import argparse
+import http.client
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CPUS = os.cpu_count() or 1
+
+
+def project_module() -> str:
+    """The project package, read from DJANGO_SETTINGS_MODULE in manage.py."""
+    with open(os.path.join(ROOT, "manage.py"), "r", encoding="utf-8") as f:
+        match = re.search(r"DJANGO_SETTINGS_MODULE['\\"],\\s*['\\"](\\w+)\\.settings", f.read())
+    if not match:
+        sys.exit("Could not find DJANGO_SETTINGS_MODULE in manage.py; pass --project")
+    return match.group(1)
+
+
+def run_load(url: str, concurrency: int, duration: float) -> dict:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        mine, failed = [], 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 500:
+                    failed += 1
+                else:
+                    mine.append(time.perf_counter() - started)
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(q):
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 2) if latencies else None
+
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else None,
+    }
+
+
+def wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=2)
+            connection.request("GET", parts.path or "/")
+            connection.getresponse().read()
+            connection.close()
+            return
+        except (OSError, http.client.HTTPException):
+            time.sleep(0.25)
+    raise RuntimeError(f"Server at {url} did not come up within {timeout:.0f}s")
+
+
+def serve(kind: str, module: str, port: int, workers: int) -> subprocess.Popen:
+    application = f"{module}.{kind}:application"
+    worker_class = "sync" if kind == "wsgi" else "uvicorn_worker.UvicornWorker"
+    command = [
+        sys.executable, "-m", "gunicorn",
+        "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers),
+        "--worker-class", worker_class,
+        "--log-level", "warning",
+        application,
+    ]
+    return subprocess.Popen(command, cwd=ROOT)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="/health/", help="endpoint to load (default /health/)")
+    parser.add_argument("--url", help="load this running server instead of starting gunicorn")
+    parser.add_argument("--project", help="project package (default: read from manage.py)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per run")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--wsgi-workers", type=int, default=2 * CPUS + 1)
+    parser.add_argument("--asgi-workers", type=int, default=CPUS)
+    args = parser.parse_args()
+
+    if args.url:
+        print(run_load(args.url, args.concurrency, args.duration))
+        return 0
+
+    module = args.project or project_module()
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    results = {}
+    for kind, workers in (("wsgi", args.wsgi_workers), ("asgi", args.asgi_workers)):
+        server = serve(kind, module, args.port, workers)
+        try:
+            wait_until_ready(url)
+            run_load(url, min(args.concurrency, 8), 2.0)  # warm up connections and caches
+            results[kind] = dict(run_load(url, args.concurrency, args.duration), workers=workers)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    print(f"{'mode':6} {'workers':>7} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for kind, row in results.items():
+        print(
+            f"{kind:6} {row['workers']:>7} {row['requests']:>9} {row['errors']:>7} "
+            f"{row['rps']:>9} {row['p50_ms']!s:>8} {row['p99_ms']!s:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
@@ -0,0 +1,130 @@
+import io
+import sys
+import tarfile
+import time
+import zipfile
+
+ARCHIVE_FORMATS = ("tar.gz", "zip")
+
+FILE_MODE = 0o644
+DIRECTORY_MODE = 0o755
+
+
+def archive_format(target: str, fmt: str = None) -> str:
+    """
+    Returns the archive format for ``target``: ``fmt`` when given, otherwise
+    guessed from the file extension (.tar.gz / .tgz / .zip).
+
+    Raises:
+        ValueError: If the format is unknown or cannot be guessed.
+    """
+    if fmt is None:
+        if target.endswith((".tar.gz", ".tgz")):
+            fmt = "tar.gz"
+        elif target.endswith(".zip"):
+            fmt = "zip"
+        else:
+            raise ValueError(f"Cannot guess the archive format of {target!r}; pass one of {', '.join(ARCHIVE_FORMATS)}")
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unknown archive format {fmt!r}; expected one of {', '.join(ARCHIVE_FORMATS)}")
+    return fmt
+
+
+def _entries(files: dict, prefix: str):
+    """Yields (archive name, bytes or None for directories) in file map order."""
+    prefix = prefix.strip("/\\")
+    for relative_path, content in files.items():
+        name = relative_path.replace("\\", "/")
+        if prefix:
+            name = f"{prefix}/{name}"
+        if content is None or name.endswith("/"):
+            yield name.rstrip("/") + "/", None
+        else:
+            yield name, content.encode("utf-8")
+
+
+def _write_tar(stream, entries, mtime: float) -> None:
+    # "w|gz" writes a forward-only stream, so stdout and sockets work too.
+    with tarfile.open(fileobj=stream, mode="w|gz") as archive:
+        for name, data in entries:
+            info = tarfile.TarInfo(name.rstrip("/"))
+            info.mtime = mtime
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                info.mode = DIRECTORY_MODE
+                archive.addfile(info)
+            else:
+                info.mode = FILE_MODE
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+
+def _write_zip(stream, entries, mtime: float) -> None:
+    date_time = time.localtime(mtime)[:6]
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries:
+            info = zipfile.ZipInfo(name, date_time)
+            if data is None:
+                info.external_attr = ((0o040000 | DIRECTORY_MODE) << 16) | 0x10
+                archive.writestr(info, b"")
+            else:
+                info.external_attr = FILE_MODE << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, data)
+
+
+def write_archive(files: dict, target, fmt: str = None, prefix: str = "", mtime: float = None) -> dict:
+    """
+    Streams a rendered file map into a tar.gz or zip archive instead of
+    creating the tree on disk.
+
+    Every file is rendered in memory and written straight into the
+    compressor, so the only disk I/O is the archive itself (none at all when
+    writing to stdout or an open socket/response body).
+
+    Args:
+        files (dict): Relative path -> file content. A value of None, or a
+            path ending in "/", adds an empty directory.
+        target: Archive path, "-" for stdout, or a writable binary file object.
+        fmt (str, optional): "tar.gz" or "zip". Guessed from ``target``'s
+            extension when omitted; required for "-" and file objects.
+        prefix (str, optional): Directory every entry is placed under,
+            usually the project name.
+        mtime (float, optional): Modification time recorded for every entry.
+            Defaults to now; pass a fixed value for reproducible archives.
+
+    Returns:
+        dict: {"format": fmt, "files": count, "bytes": uncompressed size}
+
+    Raises:
+        ValueError: If the format is unknown or cannot be guessed.
+        OSError: If the archive cannot be written.
+    """
+    if isinstance(target, str) and target != "-":
+        fmt = archive_format(target, fmt)
+    elif fmt is None:
+        raise ValueError(f"An archive format is required when writing to a stream; pass one of {', '.join(ARCHIVE_FORMATS)}")
+    else:
+        fmt = archive_format("", fmt)
+    mtime = time.time() if mtime is None else mtime
+
+    stats = {"format": fmt, "files": 0, "bytes": 0}
+
+    def counted(entries):
+        for name, data in entries:
+            if data is not None:
+                stats["files"] += 1
+                stats["bytes"] += len(data)
+            yield name, data
+
+    write = _write_tar if fmt == "tar.gz" else _write_zip
+    entries = counted(_entries(files, prefix))
+    if target == "-":
+        write(sys.stdout.buffer, entries, mtime)
+        sys.stdout.buffer.flush()
+    elif isinstance(target, str):
+        with open(target, "wb") as stream:
+            write(stream, entries, mtime)
+    else:
+        write(target, entries, mtime)
+    return stats
@@ -0,0 +1,88 @@
+# file_writer.py
+import os
+import time
+
+# Writes are I/O bound, so a small pool is enough to hide network/bind-mount latency
+# without opening hundreds of handles at once.
+DEFAULT_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+
+def _is_directory_entry(relative_path: str, content) -> bool:
+    return content is None or relative_path.endswith(("/", "\\"))
+
+
+def _fsync_path(path: str) -> None:
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_files(root: str, files: dict, max_workers: int = DEFAULT_MAX_WORKERS, fsync: bool = True) -> dict:
+    """
+    Writes a full map of rendered files below ``root``.
+
+    The directory tree is created in a single pass up front, the files are
+    then written concurrently through a bounded thread pool, and (if
+    ``fsync`` is True) every file is flushed to disk in one barrier once all
+    writes have finished.
+
+    Args:
+        root (str): Directory the relative paths are resolved against.
+        files (dict): Relative path -> file content. A value of None, or a
+            path ending in "/", creates an empty directory instead.
+        max_workers (int, optional): Size of the writer pool.
+        fsync (bool, optional): Flush all files to disk before returning.
+
+    Returns:
+        dict: Relative path -> seconds spent writing that file.
+
+    Raises:
+        OSError: If a directory or file cannot be created. The error's
+            ``filename`` is the path that failed.
+    """
+    directories = {root}
+    targets = {}
+    for relative_path, content in files.items():
+        full_path = os.path.join(root, relative_path)
+        if _is_directory_entry(relative_path, content):
+            directories.add(full_path.rstrip("/\\"))
+        else:
+            directories.add(os.path.dirname(full_path))
+            targets[relative_path] = (full_path, content)
+
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+
+    def write_one(item):
+        relative_path, (full_path, content) = item
+        started = time.perf_counter()
+        with open(full_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return relative_path, time.perf_counter() - started
+
+    if not targets:
+        return {}
+
+    # Imported here: concurrent.futures pulls in logging and threading, which
+    # would otherwise be paid by every CLI invocation, including --help.
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max(1, min(max_workers, len(targets)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        timings = dict(pool.map(write_one, targets.items()))
+        if fsync:
+            list(pool.map(_fsync_path, [full_path for full_path, _ in targets.values()]))
+
+    return timings
+
+
+def format_timings(timings: dict, limit: int = 10) -> str:
+    """Returns a short, slowest-first report of per-file write timings."""
+    if not timings:
+        return "No files written."
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:limit]
+    lines = [f"Wrote {len(timings)} files in {sum(timings.values()) * 1000:.1f} ms (summed per-file time)"]
+    lines.extend(f"  {seconds * 1000:8.2f} ms  {path}" for path, seconds in slowest)
+    return "\n".join(lines)
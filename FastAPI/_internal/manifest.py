@@ -0,0 +1,126 @@
+# manifest.py
+import hashlib
+import json
+import os
+
+from file_writer import write_files
+
+MANIFEST_NAME = ".scaffold-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: str):
+    """Returns the content hash of a file on disk, or None if it does not exist."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return content_hash(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def load_manifest(root: str) -> dict:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "files": {}}
+    if manifest.get("version") != MANIFEST_VERSION or not isinstance(manifest.get("files"), dict):
+        return {"version": MANIFEST_VERSION, "files": {}}
+    return manifest
+
+
+def save_manifest(root: str, manifest: dict) -> None:
+    path = os.path.join(root, MANIFEST_NAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def sync_files(
+    root: str,
+    files: dict,
+    versions: dict = None,
+    force: bool = False,
+    fsync: bool = True,
+    replace_unrecorded=(),
+) -> dict:
+    """
+    Writes only the files whose template changed since the last run and
+    records every file in ``root/.scaffold-manifest.json``.
+
+    A file's template version is the hash of its rendered content unless
+    ``versions`` provides one; that is needed for output that is not
+    deterministic, such as a .env with a freshly generated secret key.
+
+    For each file:
+        - already identical on disk: skipped (and recorded)
+        - missing on disk: written
+        - on disk but not in the manifest (e.g. a project generated before
+          manifests existed): there is nothing to tell whether it was edited,
+          so it is left alone and reported as a conflict (rewritten when
+          ``force`` is True or the path is in ``replace_unrecorded``)
+        - same template version as recorded: skipped
+        - template changed and the file is untouched since it was generated:
+          rewritten
+        - template changed but the file was edited locally: left alone and
+          reported as a conflict (rewritten when ``force`` is True)
+
+    Args:
+        root (str): Directory the relative paths are resolved against.
+        files (dict): Relative path -> content (None for directories).
+        versions (dict, optional): Relative path -> template version override.
+        force (bool, optional): Overwrite locally edited files. Defaults to False.
+        fsync (bool, optional): Flush written files to disk. Defaults to True.
+        replace_unrecorded (iterable, optional): Paths whose unrecorded copy on
+            disk is a stub to replace, e.g. what `django-admin startapp` just
+            created. Defaults to none.
+
+    Returns:
+        dict: {"written": {path: seconds}, "skipped": [paths], "conflicts": [paths]}
+    """
+    versions = versions or {}
+    replace_unrecorded = set(replace_unrecorded)
+    manifest = load_manifest(root)
+    recorded = manifest["files"]
+
+    to_write = {}
+    new_entries = {}
+    skipped = []
+    conflicts = []
+    for path, content in files.items():
+        if content is None or path.endswith(("/", "\\")):
+            to_write[path] = content
+            continue
+        output_hash = content_hash(content)
+        template_version = versions.get(path, output_hash)
+        entry = recorded.get(path)
+        on_disk = file_hash(os.path.join(root, path))
+
+        if on_disk == output_hash:
+            skipped.append(path)
+            new_entries[path] = {"template_version": template_version, "output_hash": output_hash}
+            continue
+        if entry is not None and on_disk is not None:
+            if entry.get("template_version") == template_version:
+                skipped.append(path)
+                continue
+            if on_disk != entry.get("output_hash") and not force:
+                conflicts.append(path)
+                continue
+        elif entry is None and on_disk is not None and not force and path not in replace_unrecorded:
+            conflicts.append(path)
+            continue
+
+        to_write[path] = content
+        new_entries[path] = {"template_version": template_version, "output_hash": output_hash}
+
+    written = write_files(root, to_write, fsync=fsync)
+    recorded.update(new_entries)
+    save_manifest(root, manifest)
+    return {"written": written, "skipped": skipped, "conflicts": conflicts}
@@ -0,0 +1,148 @@
+# planner.py
+import argparse
+import hashlib
+import json
+from typing import NamedTuple, Optional
+
+from structures import APP_MODULE_STRUCTURE
+from template import app_templates, file_templates, selected_structures, structure_paths
+from template_engine import compile_template
+import templates_data as data
+
+
+class PlannedFile(NamedTuple):
+    """
+    One entry of a plan. ``template`` is the key of the source in
+    ``templates`` (one of the LazyTemplates maps in template.py), or None
+    for empty files and directories.
+    """
+
+    path: str
+    is_dir: bool
+    template: Optional[str] = None
+    templates: Optional[object] = None
+    context: tuple = ()
+
+    def render(self) -> Optional[str]:
+        if self.is_dir:
+            return None
+        if self.template is None:
+            return ""
+        return compile_template(self.templates[self.template]).render(dict(self.context))
+
+
+class ProjectPlan:
+    """
+    The resolved file tree of a project, computed without touching disk.
+
+    Entries are fixed when the plan is built; contents are rendered lazily
+    on first access and memoised, so a plan can be built and compared for
+    thousands of scaffolds while only rendering the files that are inspected.
+    """
+
+    __slots__ = ("_entries", "_index", "_rendered")
+
+    def __init__(self, entries):
+        self._entries = tuple(entries)
+        self._index = {entry.path: entry for entry in self._entries}
+        self._rendered = {}
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    @property
+    def paths(self) -> tuple:
+        return tuple(entry.path for entry in self._entries)
+
+    def content(self, path: str) -> Optional[str]:
+        if path not in self._rendered:
+            self._rendered[path] = self._index[path].render()
+        return self._rendered[path]
+
+    def files(self) -> dict:
+        """Relative path -> content (None for directories), ready for write_project."""
+        return {entry.path: self.content(entry.path) for entry in self._entries}
+
+    def describe(self, path: str) -> dict:
+        entry = self._index[path]
+        if entry.is_dir:
+            return {"path": path, "type": "dir"}
+        encoded = self.content(path).encode("utf-8")
+        return {
+            "path": path,
+            "type": "file",
+            "template": entry.template,
+            "size": len(encoded),
+            "sha256": hashlib.sha256(encoded).hexdigest(),
+        }
+
+    def to_dict(self) -> dict:
+        described = [self.describe(entry.path) for entry in self._entries]
+        return {
+            "files": described,
+            "file_count": sum(1 for item in described if item["type"] == "file"),
+            "total_size": sum(item.get("size", 0) for item in described),
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def diff(self, other: "ProjectPlan") -> dict:
+        """Compares two plans by path and content hash."""
+        mine = {item["path"]: item.get("sha256") for item in map(self.describe, self.paths)}
+        theirs = {item["path"]: item.get("sha256") for item in map(other.describe, other.paths)}
+        return {
+            "added": sorted(theirs.keys() - mine.keys()),
+            "removed": sorted(mine.keys() - theirs.keys()),
+            "changed": sorted(path for path in mine.keys() & theirs.keys() if mine[path] != theirs[path]),
+        }
+
+
+def plan_project(db: bool = False, auth: bool = False, app_names: list = None, async_db: bool = False) -> ProjectPlan:
+    """
+    Resolves BASE_STRUCTURE (plus DB_STRUCTURE / AUTH_STRUCTURE when enabled)
+    and APP_MODULE_STRUCTURE for each app into a ProjectPlan.
+    """
+    project_templates = file_templates(async_db)
+    module_templates = app_templates(async_db)
+    entries = []
+    for path in structure_paths(selected_structures(db, auth)):
+        if path.endswith("/"):
+            entries.append(PlannedFile(path, True))
+        elif path in project_templates:
+            entries.append(PlannedFile(path, False, path, project_templates))
+        else:
+            entries.append(PlannedFile(path, False))
+
+    seen = set(entry.path for entry in entries)
+    for app_name in app_names or []:
+        context = data.app_module_context(app_name)
+        for raw_path in structure_paths([APP_MODULE_STRUCTURE]):
+            path = raw_path.format(**context)
+            if path in seen:
+                continue
+            seen.add(path)
+            template = raw_path if raw_path in module_templates else None
+            entries.append(PlannedFile(path, False, template, module_templates, tuple(sorted(context.items()))))
+    return ProjectPlan(entries)
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Print the file plan of a FastAPI project without writing it.")
+    parser.add_argument("--db", action="store_true")
+    parser.add_argument("--auth", action="store_true")
+    parser.add_argument("--async-db", action="store_true", help="use the SQLAlchemy asyncio templates")
+    parser.add_argument("--app", action="append", default=[], dest="apps")
+    args = parser.parse_args(argv)
+    print(plan_project(args.db, args.auth, args.apps, args.async_db).to_json())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
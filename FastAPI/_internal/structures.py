@@ -14,9 +14,12 @@ BASE_STRUCTURE = {
         "api/__init__.py",
         "api/main_router.py",
         "utils/retry_utils.py",
+        "utils/resilience.py",
+        "utils/pagination.py",
         "core/helpers/message.py",
         "core/helpers/exception.py",
-        "core/redis_client.py"
+        "core/redis_client.py",
+        "core/response_cache.py"
        
     ],
     "tests": ["__init__.py"],
@@ -26,14 +29,17 @@ BASE_STRUCTURE = {
         "main.py",
         ".env",
         ".gitignore",
+        ".dockerignore",
+        "pyproject.toml",
         "requirements.txt",
         "README.md",
     ]
 }
 
 DB_STRUCTURE = {
-    "app/db": ["__init__.py", "base.py", "session.py"],
-    
+    "app/db": ["__init__.py", "base.py", "session.py", "metrics.py"],
+    "alembic": ["env.py"],
+    "scripts": ["pool_load_test.py"],
 }
 
 AUTH_STRUCTURE = {
@@ -44,6 +50,8 @@ AUTH_STRUCTURE = {
         "schemas.py",
         "crud.py",
         "router.py",
+        "utility.py",
+        "cache.py",
     ],
     "app/modules/user": [
         "__init__.py",
@@ -53,6 +61,7 @@ AUTH_STRUCTURE = {
         "router.py",
     ],
     "tests": ["test_auth.py", "test_users.py"],
+    "scripts": ["login_burst_benchmark.py"],
 }
 
 # App module structure template
@@ -0,0 +1,65 @@
+# substitution.py
+import re
+
+# Placeholders look like {{app_name}}; single braces are left alone so the
+# f-strings and dict literals inside the generated code survive untouched.
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+
+class SubstitutionPlan:
+    """
+    A template with the offsets of every placeholder precomputed.
+
+    ``slots`` holds one (start, end, name) tuple per placeholder occurrence.
+    Rendering walks the slots once, filling a buffer sized up front, so each
+    template is copied exactly once no matter how many placeholders it has.
+    Substituted values are never rescanned, so a value containing
+    "{{app_class}}" is inserted literally rather than expanded again.
+    """
+
+    __slots__ = ("source", "slots")
+
+    def __init__(self, source: str, slots):
+        self.source = source
+        self.slots = tuple(slots)
+
+    @classmethod
+    def compile(cls, source: str, pattern: re.Pattern) -> "SubstitutionPlan":
+        """``pattern`` must capture the placeholder name in group 1."""
+        return cls(source, ((m.start(), m.end(), m.group(1)) for m in pattern.finditer(source)))
+
+    @property
+    def names(self) -> frozenset:
+        return frozenset(name for _, _, name in self.slots)
+
+    def render(self, values: dict) -> str:
+        if not self.slots:
+            return self.source
+        source = self.source
+        buffer = [""] * (2 * len(self.slots) + 1)
+        position = 0
+        index = 0
+        for start, end, name in self.slots:
+            buffer[index] = source[position:start]
+            buffer[index + 1] = values[name]
+            index += 2
+            position = end
+        buffer[index] = source[position:]
+        return "".join(buffer)
+
+
+_plans = {}
+
+
+def plan_for(source: str, pattern: re.Pattern = PLACEHOLDER_PATTERN) -> SubstitutionPlan:
+    """Returns the cached plan of ``source`` for ``pattern``, compiling it on first use."""
+    key = (pattern.pattern, source)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = SubstitutionPlan.compile(source, pattern)
+    return plan
+
+
+def substitute(source: str, values: dict, pattern: re.Pattern = PLACEHOLDER_PATTERN) -> str:
+    """Fills every placeholder of ``source`` in a single pass."""
+    return plan_for(source, pattern).render(values)
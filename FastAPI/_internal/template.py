@@ -1,58 +1,240 @@
 # template.py
+import os
+import posixpath
+from collections.abc import Mapping
+
 import templates_data as data
+from manifest import sync_files
+from structures import BASE_STRUCTURE, DB_STRUCTURE, AUTH_STRUCTURE
+from template_engine import compile_template
+
+
+class LazyTemplates(Mapping):
+    """
+    Output path -> template source, where each source is only imported from
+    templates_data when that path is actually rendered.
+
+    Values are template names in templates_data; None means an empty file.
+    """
+
+    def __init__(self, names: dict):
+        self.names = names
+
+    def __getitem__(self, path: str) -> str:
+        name = self.names[path]
+        return "" if name is None else data.load(name)
 
-FILE_TEMPLATES = {
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+FILE_TEMPLATES = LazyTemplates({
     # Root files
-    "main.py": data.main,
-    "Dockerfile": data.dockerfile,
-    "docker-compose.yml": data.docker_compose,
-    ".dockerignore": data.dockerignore,
-    ".gitignore": data.gitignore,
-    ".env": data.env,
-    "requirements.txt": data.requirements,
-    "pyproject.toml": data.pyproject_toml,
+    "main.py": "main",
+    "Dockerfile": "dockerfile",
+    "docker-compose.yml": "docker_compose",
+    ".dockerignore": "dockerignore",
+    ".gitignore": "gitignore",
+    ".env": "env",
+    "requirements.txt": "requirements",
+    "pyproject.toml": "pyproject_toml",
 
-    "README.md": data.readme,
+    "README.md": "readme",
 
     # Core
-    "app/core/config.py": data.core_config,
-    "app/core/security.py": data.core_security,
-    'app/core/middleware.py': data.core_middleware,
-    'app/core/helpers/message.py': data.message,
-    'app/core/helpers/exception.py': data.execeptions,
-    'app/core/redis_client.py': data.redis_client,
+    "app/core/config.py": "core_config",
+    "app/core/security.py": "core_security",
+    "app/core/logger.py": "core_logger",
+    'app/core/middleware.py': "core_middleware",
+    'app/core/helpers/message.py': "message",
+    'app/core/helpers/exception.py': "execeptions",
+    'app/core/redis_client.py': "redis_client",
+    "app/core/response_cache.py": "response_cache",
    
 
     # Database
-    "app/db/base.py": data.db_base,
-    "app/db/session.py": data.db_session,
+    "app/db/base.py": "db_base",
+    "app/db/session.py": "db_session",
+    "app/db/metrics.py": "db_metrics",
+    "scripts/pool_load_test.py": "db_pool_load_test",
 
     # Auth module
-    "app/modules/auth/crud.py": data.auth_crud,
-    "app/modules/auth/router.py": data.auth_router,
-    "app/modules/auth/models.py": data.auth_models,
-    "app/modules/auth/utility.py": data.auth_utils,
+    "app/modules/auth/crud.py": "auth_crud",
+    "app/modules/auth/router.py": "auth_router",
+    "app/modules/auth/models.py": "auth_models",
+    "app/modules/auth/utility.py": "auth_utils",
+    "app/modules/auth/cache.py": "auth_cache",
+    "scripts/login_burst_benchmark.py": "auth_login_benchmark",
 
     # User module
-    "app/modules/user/crud.py": data.user_crud,
-    "app/modules/user/router.py": data.user_router,
-    "app/modules/user/models.py": data.user_models,
-    "app/modules/user/schemas.py": data.user_schemas,
+    "app/modules/user/crud.py": "user_crud",
+    "app/modules/user/router.py": "user_router",
+    "app/modules/user/models.py": "user_models",
+    "app/modules/user/schemas.py": "user_schemas",
 
     # API
-    "app/api/main_router.py": data.main_router,
+    "app/api/main_router.py": "main_router",
 
     # Alembic
-    "alembic/env.py": data.alembic_env,
+    "alembic/env.py": "alembic_env",
 
     # Utils
-    "app/utils/retry_utils.py" :data.retry_utils,
-}
-def app_module_templates(app_name: str):
-     return {
-         f"app/modules/{app_name}/__init__.py": "",
-         f"app/modules/{app_name}/models.py": data.get_app_model_template(app_name),
-         f"app/modules/{app_name}/schemas.py": data.get_app_schema_template(app_name),
-         f"app/modules/{app_name}/crud.py": data.get_app_crud_template(app_name),
-         f"app/modules/{app_name}/router.py": data.get_app_router_template(app_name),
-     }
+    "app/utils/retry_utils.py" :"retry_utils",
+    "app/utils/resilience.py": "resilience",
+    "app/utils/pagination.py": "pagination_utils",
+})
+APP_MODULE_TEMPLATES = LazyTemplates({
+    "app/modules/{app_name}/__init__.py": None,
+    "app/modules/{app_name}/models.py": "app_model",
+    "app/modules/{app_name}/schemas.py": "app_schema",
+    "app/modules/{app_name}/crud.py": "app_crud",
+    "app/modules/{app_name}/router.py": "app_router",
+})
+
+# --async-db: the same trees, with the session, CRUD, routers and Alembic
+# env swapped for their SQLAlchemy asyncio versions.
+ASYNC_DB_FILE_TEMPLATES = LazyTemplates({
+    **FILE_TEMPLATES.names,
+    ".env": "env_async_db",
+    "requirements.txt": "requirements_async_db",
+    "pyproject.toml": "pyproject_toml_async_db",
+    "app/db/session.py": "db_session_async",
+    "scripts/pool_load_test.py": "db_pool_load_test_async",
+    "app/modules/auth/crud.py": "auth_crud_async",
+    "app/modules/auth/router.py": "auth_router_async",
+    "app/modules/user/crud.py": "user_crud_async",
+    "app/modules/user/router.py": "user_router_async",
+    "alembic/env.py": "alembic_env_async",
+})
+ASYNC_DB_APP_MODULE_TEMPLATES = LazyTemplates({
+    **APP_MODULE_TEMPLATES.names,
+    "app/modules/{app_name}/crud.py": "app_crud_async",
+    "app/modules/{app_name}/router.py": "app_router_async",
+})
+
+
+def render_templates(templates: dict, context: dict = None) -> dict:
+    """
+    Renders a mapping of output path -> template source.
+
+    Each source is compiled once (and cached on disk by content hash), so
+    repeated runs only pay for placeholder substitution.
+    """
+    context = context or {}
+    return {
+        path.format(**context): compile_template(source).render(context)
+        for path, source in templates.items()
+    }
+
+
+def file_templates(async_db: bool = False) -> LazyTemplates:
+    return ASYNC_DB_FILE_TEMPLATES if async_db else FILE_TEMPLATES
+
+
+def app_templates(async_db: bool = False) -> LazyTemplates:
+    return ASYNC_DB_APP_MODULE_TEMPLATES if async_db else APP_MODULE_TEMPLATES
+
+
+def render_file_templates(context: dict = None, async_db: bool = False) -> dict:
+    return render_templates(file_templates(async_db), context)
+
+
+def app_module_templates(app_name: str, async_db: bool = False):
+    return render_templates(app_templates(async_db), data.app_module_context(app_name))
+
+
+def is_async_db_project(project_path: str) -> bool:
+    """
+    True if the project at ``project_path`` was generated with --async-db,
+    so startapp can emit matching async CRUD and routers.
+    """
+    try:
+        with open(os.path.join(project_path, "app", "db", "session.py"), "r", encoding="utf-8") as f:
+            return "create_async_engine" in f.read()
+    except OSError:
+        return False
+
+
+def structure_paths(structures: list, context: dict = None) -> list:
+    """
+    Flattens structure dicts into relative paths, in declaration order.
+
+    Directory entries keep their trailing "/" so writers can tell them apart.
+    Placeholders such as {app_name} are only filled in when ``context`` is given.
+    """
+    paths = []
+    for structure in structures:
+        for base, entries in structure.items():
+            for entry in entries:
+                path = posixpath.join(base, entry) if base else entry
+                if context is not None:
+                    path = path.format(**context)
+                if path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def selected_structures(db: bool = False, auth: bool = False) -> list:
+    structures = [BASE_STRUCTURE]
+    if db:
+        structures.append(DB_STRUCTURE)
+    if auth:
+        structures.append(AUTH_STRUCTURE)
+    return structures
+
+
+def build_file_map(db: bool = False, auth: bool = False, app_names: list = None, async_db: bool = False) -> dict:
+    """
+    Returns relative path -> rendered content for a whole project.
+
+    Files without a template are created empty; directory entries map to None.
+    With ``async_db`` the database layer, CRUD and routers use SQLAlchemy's
+    asyncio extension (create_async_engine / async_sessionmaker).
+    See planner.plan_project for the same tree without rendering anything.
+    """
+    from planner import plan_project
+
+    return plan_project(db, auth, app_names, async_db).files()
+
+
+def write_project(project_path: str, files: dict, fsync: bool = True, force: bool = False) -> dict:
+    """
+    Writes a rendered file map below ``project_path`` through the parallel
+    writer.
+
+    Re-running it against an existing project only rewrites files whose
+    template changed since the last run (tracked in .scaffold-manifest.json);
+    locally edited files are reported as conflicts unless ``force`` is True.
+
+    Returns:
+        dict: {"written": {path: seconds}, "skipped": [paths], "conflicts": [paths]}
+    """
+    try:
+        return sync_files(project_path, files, force=force, fsync=fsync)
+    except OSError as e:
+        print(f"Error creating file {e.filename}: {e}")
+        raise
+
+
+def write_project_archive(target, files: dict, project_name: str = "", fmt: str = None) -> dict:
+    """
+    Streams a rendered file map into a tar.gz/zip archive (or to stdout with
+    ``target="-"``) instead of creating the project tree on disk.
+
+    Entries are placed under ``project_name/`` so the archive unpacks into
+    the same layout write_project would have produced.
+
+    Returns:
+        dict: {"format": fmt, "files": count, "bytes": uncompressed size}
+    """
+    # Imported here: tarfile/zipfile are only needed for archive output.
+    from archive_writer import write_archive
+
+    try:
+        return write_archive(files, target, fmt=fmt, prefix=project_name)
+    except OSError as e:
+        print(f"Error writing archive {e.filename or target}: {e}")
+        raise
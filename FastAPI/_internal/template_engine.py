@@ -0,0 +1,130 @@
+# template_engine.py
+import hashlib
+import json
+import os
+
+from substitution import PLACEHOLDER_PATTERN, SubstitutionPlan
+
+CACHE_VERSION = 2
+CACHE_DIR = os.environ.get(
+    "FASTAPI_CLI_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "fastapi_cli", "templates"),
+)
+
+
+class TemplateError(Exception):
+    """Raised when a template cannot be rendered."""
+
+
+class CompiledTemplate(SubstitutionPlan):
+    """
+    A template parsed once into placeholder offsets.
+
+    Rendering is the single-pass fill of SubstitutionPlan; only the offsets
+    are cached on disk, since the source is always at hand when loading.
+    """
+
+    __slots__ = ()
+
+    @property
+    def placeholders(self) -> frozenset:
+        return self.names
+
+    def render(self, context: dict = None) -> str:
+        context = context or {}
+        try:
+            return super().render({name: str(context[name]) for name in self.names})
+        except KeyError as e:
+            raise TemplateError(f"Missing value for placeholder {e.args[0]!r}")
+
+    __call__ = render
+
+    def to_json(self) -> dict:
+        return {"version": CACHE_VERSION, "slots": self.slots}
+
+    @classmethod
+    def from_json(cls, source: str, data: dict) -> "CompiledTemplate":
+        if data.get("version") != CACHE_VERSION:
+            raise ValueError("stale template cache entry")
+        slots = [(start, end, name) for start, end, name in data["slots"]]
+        for start, end, name in slots:
+            if source[start:end] != f"{{{{{name}}}}}":
+                raise ValueError("template cache entry does not match its source")
+        return cls(source, slots)
+
+
+def template_hash(source: str) -> str:
+    """Returns the content hash used as the cache key of a template."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def parse(source: str) -> CompiledTemplate:
+    """Records the offset and name of every placeholder in ``source``."""
+    return CompiledTemplate.compile(source, PLACEHOLDER_PATTERN)
+
+
+_memory_cache = {}
+
+
+def _load_from_disk(key: str, source: str):
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return CompiledTemplate.from_json(source, json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_on_disk(key: str, compiled: CompiledTemplate) -> None:
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(compiled.to_json(), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is an optimisation only; a read-only home must not break scaffolding.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def compile_template(source: str, use_disk_cache: bool = True) -> CompiledTemplate:
+    """
+    Returns the compiled form of ``source``.
+
+    Lookup order is the in-process cache, then the on-disk cache keyed by
+    the content hash, then a fresh parse (which is written back to disk).
+    """
+    compiled = _memory_cache.get(source)
+    if compiled is not None:
+        return compiled
+
+    key = template_hash(source)
+    compiled = _load_from_disk(key, source) if use_disk_cache else None
+    if compiled is None:
+        compiled = parse(source)
+        if use_disk_cache:
+            _store_on_disk(key, compiled)
+
+    _memory_cache[source] = compiled
+    return compiled
+
+
+def render(source: str, context: dict = None) -> str:
+    """Compiles (or fetches from cache) ``source`` and fills in ``context``."""
+    return compile_template(source).render(context)
+
+
+def clear_cache(disk: bool = False) -> None:
+    """Drops the in-process cache and, optionally, the on-disk cache."""
+    _memory_cache.clear()
+    if disk and os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, name))
+                except OSError:
+                    pass
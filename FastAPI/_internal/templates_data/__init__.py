@@ -0,0 +1,96 @@
+# templates_data/__init__.py
+"""
+Template sources, split into one module per feature group.
+
+Nothing is imported until a template is first requested, so commands such
+as --help never pay for evaluating every template string, and a project
+without --db/--auth never loads those groups at all. Attribute access keeps
+the old flat API working: ``templates_data.core_config`` imports
+``templates_data.core`` on first use.
+
+PyInstaller cannot see these lazy imports; list the submodules under
+``hiddenimports`` (or use ``--collect-submodules templates_data``) when
+building the executable.
+"""
+import importlib
+
+# Template name -> submodule that defines it
+TEMPLATE_MODULES = {
+    "main": "root",
+    "dockerfile": "root",
+    "dockerignore": "root",
+    "gitignore": "root",
+    "docker_compose": "root",
+    "env": "root",
+    "requirements": "root",
+    "pyproject_toml": "root",
+    "alembic_ini": "root",
+    "readme": "root",
+    "retry_utils": "utils",
+    "resilience": "utils",
+    "pagination_utils": "utils",
+    "core_config": "core",
+    "core_security": "core",
+    "core_logger": "core",
+    "core_middleware": "core",
+    "redis_client": "core",
+    "response_cache": "core",
+    "message": "helpers",
+    "execeptions": "helpers",
+    "db_base": "db",
+    "db_session": "db",
+    "db_metrics": "db",
+    "db_pool_load_test": "db",
+    "alembic_env": "migrations",
+    "auth_crud": "auth",
+    "auth_router": "auth",
+    "auth_models": "auth",
+    "auth_utils": "auth",
+    "auth_login_benchmark": "auth",
+    "auth_cache": "auth",
+    "user_crud": "user",
+    "user_router": "user",
+    "user_models": "user",
+    "user_schemas": "user",
+    "main_router": "api",
+    "app_model": "app_module",
+    "app_schema": "app_module",
+    "app_crud": "app_module",
+    "app_router": "app_module",
+    "app_module_context": "app_module",
+    "get_app_model_template": "app_module",
+    "get_app_schema_template": "app_module",
+    "get_app_crud_template": "app_module",
+    "get_app_router_template": "app_module",
+    "env_async_db": "async_db",
+    "requirements_async_db": "async_db",
+    "pyproject_toml_async_db": "async_db",
+    "db_session_async": "async_db",
+    "db_pool_load_test_async": "async_db",
+    "alembic_env_async": "async_db",
+    "user_crud_async": "async_db",
+    "user_router_async": "async_db",
+    "auth_crud_async": "async_db",
+    "auth_router_async": "async_db",
+    "app_crud_async": "async_db",
+    "app_router_async": "async_db",
+}
+
+
+def load(name: str):
+    """Imports the submodule that defines ``name`` and returns the template."""
+    try:
+        module_name = TEMPLATE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str):
+    return load(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(TEMPLATE_MODULES))
@@ -0,0 +1,139 @@
+# templates_data/app_module.py
+from template_engine import render
+
+# ----------------APP MODULE TEMPLATES---------------#
+# Rendered by template_engine; {{app_name}} is the module name and
+# {{app_class}} its capitalized model/class name.
+app_model = '''from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, DateTime
+from app.db.base import Base
+from datetime import datetime, timezone
+
+
+class {{app_class}}(Base):
+    __tablename__ = '{{app_name}}s'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, default=datetime.now(timezone.utc))
+'''
+
+app_schema = '''from pydantic import BaseModel
+from datetime import datetime
+
+
+class {{app_class}}Base(BaseModel):
+    name: str
+
+
+class {{app_class}}Create({{app_class}}Base):
+    pass
+
+
+class {{app_class}}Schema({{app_class}}Base):
+    id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+'''
+
+app_crud = '''from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.response_cache import invalidate
+from app.utils.pagination import PageParams
+from .models import {{app_class}}
+from .schemas import {{app_class}}Create, {{app_class}}Schema
+
+
+def get_{{app_name}}s(db: Session, page: PageParams = None):
+    page = page or PageParams()
+    columns = page.columns({{app_class}}, {{app_class}}Schema.model_fields)
+    query = page.apply(select(*columns) if columns else select({{app_class}}), {{app_class}})
+    result = db.execute(query)
+    return result.mappings().all() if columns else result.scalars().all()
+
+
+def get_{{app_name}}(db: Session, {{app_name}}_id: int):
+    return db.query({{app_class}}).filter({{app_class}}.id == {{app_name}}_id).first()
+
+
+def create_{{app_name}}(db: Session, {{app_name}}: {{app_class}}Create):
+    db_{{app_name}} = {{app_class}}(**{{app_name}}.dict())
+    db.add(db_{{app_name}})
+    db.commit()
+    db.refresh(db_{{app_name}})
+    invalidate("{{app_name}}s")
+    return db_{{app_name}}
+
+
+def delete_{{app_name}}(db: Session, {{app_name}}_id: int):
+    db_{{app_name}} = db.query({{app_class}}).filter({{app_class}}.id == {{app_name}}_id).first()
+    if db_{{app_name}}:
+        db.delete(db_{{app_name}})
+        db.commit()
+        invalidate("{{app_name}}s")
+    return db_{{app_name}}
+'''
+
+app_router = '''from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session
+from app.core.response_cache import cached_response
+from app.db.session import get_db
+from app.utils.pagination import PageParams, page_params
+from .schemas import {{app_class}}Schema, {{app_class}}Create
+from .crud import get_{{app_name}}s, get_{{app_name}}, create_{{app_name}}, delete_{{app_name}}
+
+{{app_name}}_router = APIRouter(
+    prefix='/{{app_name}}s',
+    tags=['{{app_class}}s']
+)
+
+
+@{{app_name}}_router.get('/', response_model=list[{{app_class}}Schema])
+@cached_response(namespace="{{app_name}}s", ttl=30, response_model=list[{{app_class}}Schema], lazy=("db",))
+def list_{{app_name}}s(response: Response, page: PageParams = Depends(page_params), db: Session = Depends(get_db)):
+    return page.respond(get_{{app_name}}s(db, page), response)
+
+
+@{{app_name}}_router.get('/{id}', response_model={{app_class}}Schema)
+@cached_response(namespace="{{app_name}}s", ttl=60, response_model={{app_class}}Schema, lazy=("db",))
+def get_{{app_name}}_detail(id: int, db: Session = Depends(get_db)):
+    {{app_name}} = get_{{app_name}}(db, id)
+    if not {{app_name}}:
+        raise HTTPException(status_code=404, detail="{{app_class}} not found")
+    return {{app_name}}
+
+
+@{{app_name}}_router.post('/', response_model={{app_class}}Schema)
+def create_{{app_name}}_endpoint({{app_name}}: {{app_class}}Create, db: Session = Depends(get_db)):
+    return create_{{app_name}}(db, {{app_name}})
+
+
+@{{app_name}}_router.delete('/{id}')
+def delete_{{app_name}}_endpoint(id: int, db: Session = Depends(get_db)):
+    {{app_name}} = delete_{{app_name}}(db, id)
+    if not {{app_name}}:
+        raise HTTPException(status_code=404, detail="{{app_class}} not found")
+    return {"message": "{{app_class}} deleted"}
+'''
+
+
+def app_module_context(app_name: str) -> dict:
+    return {"app_name": app_name, "app_class": app_name.capitalize()}
+
+
+def get_app_model_template(app_name: str) -> str:
+    return render(app_model, app_module_context(app_name))
+
+
+def get_app_schema_template(app_name: str) -> str:
+    return render(app_schema, app_module_context(app_name))
+
+
+def get_app_crud_template(app_name: str) -> str:
+    return render(app_crud, app_module_context(app_name))
+
+
+def get_app_router_template(app_name: str) -> str:
+    return render(app_router, app_module_context(app_name))
@@ -0,0 +1,560 @@
+# templates_data/async_db.py
+# ----------------ASYNC DATABASE (--async-db)---------------#
+# Drop-in replacements for the session, CRUD, router and Alembic templates
+# that use SQLAlchemy's asyncio extension, so I/O-bound routes run on the
+# event loop instead of the threadpool.
+from .root import env, pyproject_toml, requirements
+
+requirements_async_db = requirements.replace("anyio==4.10.0\n", "anyio==4.10.0\nasyncpg==0.30.0\n", 1)
+
+pyproject_toml_async_db = pyproject_toml.replace(
+    '    "bcrypt>=4.3.0",\n', '    "asyncpg>=0.30.0",\n    "bcrypt>=4.3.0",\n', 1
+)
+
+env_async_db = env.replace("postgresql+psycopg2://", "postgresql+asyncpg://")
+
+db_session_async = '''
+# app/db/session.py
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.db.metrics import PoolMetrics
+
+
+def pool_options() -> dict:
+    """Connection-pool arguments for create_async_engine, taken from Settings."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+# Create the async SQLAlchemy engine.
+# DATABASE_URL must use an async driver, e.g. postgresql+asyncpg://...
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    **pool_options(),
+)
+
+# Session factory
+# expire_on_commit=False: objects stay usable after commit without an
+# implicit (and, under asyncio, impossible) lazy refresh.
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+pool_metrics = PoolMetrics(engine.sync_engine.pool, capacity=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+
+
+def pool_stats() -> dict:
+    """Current pool gauges and checkout latency percentiles, e.g. for a metrics endpoint."""
+    return pool_metrics.snapshot()
+
+
+# Dependency for FastAPI routes. The session checks a connection out of
+# the pool on its first query, so routes that never query hold none.
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+'''
+
+db_pool_load_test_async = '''
+# scripts/pool_load_test.py
+"""
+Connection-pool load test (async engine).
+
+Runs waves of concurrent requests against DATABASE_URL on one event loop.
+Each request gets a session from get_db, runs SELECT 1 and holds the
+connection for --hold-ms, like a route doing work. Up to DB_POOL_SIZE +
+DB_MAX_OVERFLOW concurrent requests, checkout latency stays near zero.
+Beyond that, requests queue for a free connection: latency grows by about
+one hold time per extra "wave", saturation stays pinned at 1.0, and
+requests fail with pool timeouts once the wait exceeds DB_POOL_TIMEOUT.
+
+Usage:
+    python scripts/pool_load_test.py [--hold-ms 50] [--requests 200] [--levels 5 15 30 60]
+"""
+import argparse
+import asyncio
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+from app.db.session import engine, get_db, pool_metrics
+
+
+async def one_request(hold: float) -> bool:
+    dependency = get_db()
+    db = await dependency.__anext__()
+    try:
+        # The connection is checked out here, on the first query
+        await db.execute(text("SELECT 1"))
+        await asyncio.sleep(hold)
+    except PoolTimeoutError:
+        return False
+    finally:
+        await dependency.aclose()
+    return True
+
+
+async def run_level(concurrency: int, requests: int, hold: float) -> dict:
+    pool_metrics.reset()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def limited():
+        async with limit:
+            return await one_request(hold)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(limited() for _ in range(requests)))
+    wall = time.perf_counter() - started
+
+    stats = pool_metrics.snapshot()
+    return {
+        "concurrency": concurrency,
+        "ok": sum(results),
+        "timeouts": stats["timeouts"],
+        "p50_ms": stats["checkout_ms_p50"],
+        "p99_ms": stats["checkout_ms_p99"],
+        "peak_saturation": stats["peak_saturation"],
+        "req_per_s": round(requests / wall, 1),
+    }
+
+
+async def main() -> int:
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hold-ms", type=float, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--levels", type=int, nargs="+",
+        default=[max(1, settings.DB_POOL_SIZE // 2), settings.DB_POOL_SIZE, capacity, capacity * 2, capacity * 4],
+    )
+    args = parser.parse_args()
+
+    print(f"pool_size={settings.DB_POOL_SIZE} max_overflow={settings.DB_MAX_OVERFLOW} pool_timeout={settings.DB_POOL_TIMEOUT}s")
+    print(f"{'clients':>8} {'ok':>6} {'timeouts':>9} {'p50 ms':>9} {'p99 ms':>9} {'peak sat':>9} {'req/s':>8}")
+    for concurrency in args.levels:
+        row = await run_level(concurrency, args.requests, args.hold_ms / 1000)
+        print(
+            f"{row['concurrency']:>8} {row['ok']:>6} {row['timeouts']:>9} {row['p50_ms']:>9} "
+            f"{row['p99_ms']:>9} {row['peak_saturation']:>9} {row['req_per_s']:>8}"
+        )
+    await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
+'''
+
+alembic_env_async = '''
+# alembic/env.py
+
+import asyncio
+from logging.config import fileConfig
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
+from alembic import context
+
+import sys
+import pathlib
+
+# Add app folder to sys.path for imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "app"))
+
+from app.core.config import settings
+from app.db.base import Base  # Import your Base for autogenerate
+
+# ---------------------- Import all models here for Alembic -------------------#
+# Import all models here so Alembic sees
+
+# from app.modules.user import models as user_models
+# from app.modules.auth import models as auth_models
+# from app.modules.books import models as book_models
+
+# ------------------------------------------------------------------------------#
+
+# Alembic Config object
+config = context.config
+
+# Interpret the config file for Python logging
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Set DB URL dynamically from settings
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode."""
+    url = config.get_main_option("sqlalchemy.url")
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Run migrations through an async engine."""
+    connectable = async_engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode."""
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
+'''
+
+user_crud_async = '''
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.response_cache import ainvalidate
+from app.modules.auth.cache import principal_cache
+from app.modules.auth.utility import aget_password_hash
+from app.modules.user.models import User
+from app.modules.user.schemas import UserCreate, UserSchema
+from app.utils.pagination import PageParams
+
+
+async def get_users(db: AsyncSession, page: PageParams = None):
+    page = page or PageParams()
+    columns = page.columns(User, UserSchema.model_fields)
+    query = page.apply(select(*columns) if columns else select(User), User)
+    result = await db.execute(query)
+    return result.mappings().all() if columns else result.scalars().all()
+
+
+async def get_user(db: AsyncSession, user_id: int):
+    return await db.get(User, user_id)
+
+
+async def get_user_by_email(db: AsyncSession, email: str):
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none()
+
+async def get_user_by_username(db: AsyncSession, username:str):
+    result = await db.execute(select(User).where(User.username == username))
+    return result.scalar_one_or_none()
+
+async def create_user(db: AsyncSession, user: UserCreate):
+    db_user = User(
+        email=str(user.email),
+        username=user.username,
+        password=await aget_password_hash(user.password)
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    await ainvalidate("users")
+    return db_user
+
+
+async def delete_user(db: AsyncSession, user_id: int):
+    db_user = await db.get(User, user_id)
+    if db_user:
+        await db.delete(db_user)
+        await db.commit()
+        await principal_cache.ainvalidate_user(user_id)
+        await ainvalidate("users")
+    return
+'''
+
+user_router_async = '''
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.response_cache import cached_response
+from app.modules.auth.crud import get_current_active_user
+from app.db.session import get_db
+from app.modules.user.models import User
+from app.modules.user.schemas import UserSchema, UserCreate
+from app.modules.user.crud import get_users, create_user, get_user, delete_user
+from app.utils.pagination import PageParams, page_params
+
+user_router = APIRouter(
+    prefix='/users',
+    tags=['Users']
+)
+
+
+@user_router.get('/', response_model=list[UserSchema])
+@cached_response(namespace="users", ttl=30, response_model=list[UserSchema], lazy=("db",))
+async def users_list(response: Response, page: PageParams = Depends(page_params), db: AsyncSession = Depends(get_db)):
+    db_users = await get_users(db, page)
+
+    return page.respond(db_users, response)
+
+
+@user_router.get('/me', response_model=UserSchema)
+async def user_list(current_user: User = Depends(get_current_active_user)):
+    return current_user
+
+
+
+@user_router.get('/{user_id}', response_model=UserSchema)
+@cached_response(namespace="users", ttl=60, response_model=UserSchema, lazy=("db",))
+async def user_detail(user_id: int, db: AsyncSession = Depends(get_db)):
+    db_user = await get_user(db, user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return db_user
+
+
+@user_router.delete('/{user_id}')
+async def user_delete(user_id: int, db: AsyncSession = Depends(get_db)):
+    db_user = await get_user(db, user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    await delete_user(db, db_user.id)
+    return {"message": "User deleted"}
+
+
+@user_router.post("/", response_model=UserSchema)
+async def user_post(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    return await create_user(db, user)
+'''
+
+auth_crud_async = '''
+from typing import Annotated,Optional
+
+from jwt import PyJWTError
+from app.modules.auth.models import TokenData
+from app.modules.auth.utility import averify_password
+
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, HTTPException, status
+from datetime import datetime, timedelta, timezone
+import jwt
+from app.db.session import AsyncSessionLocal
+from app.modules.user.models import User
+from app.modules.user.crud import get_user_by_username
+from app.core.config import settings
+from app.modules.auth.cache import principal_cache
+
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
+
+
+async def authenticate_user(username: str, password: str, db: AsyncSession):
+    user = await get_user_by_username(db, username)
+    if not user:
+        return False
+    if not await averify_password(password, user.password):
+        return False
+    return user
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.now(timezone.utc) + expires_delta
+    else:
+        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    # Fast path: a token verified recently needs neither decoding nor a DB lookup
+    cached = await principal_cache.aget(token)
+    if cached is not None:
+        return cached
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        username = payload.get("sub")
+        if username is None:
+            raise credentials_exception
+        token_data = TokenData(username=username)
+
+    except PyJWTError:
+        raise credentials_exception
+    # Own short-lived session: only opened on a principal-cache miss
+    async with AsyncSessionLocal() as db:
+        user = await get_user_by_username(db, username=token_data.username)
+    if user is None:
+        raise credentials_exception
+    await principal_cache.aset(token, user, payload.get("exp"))
+    return user
+
+
+async def get_current_active_user(current_user: User = Depends(get_current_user)):
+    return current_user
+'''
+
+auth_router_async = '''
+from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import timedelta
+from typing import Annotated
+from app.modules.auth.models import Token
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.auth.crud import authenticate_user, create_access_token
+from app.db.session import get_db
+
+auth_router = APIRouter(
+    prefix='/auth',
+    tags=['Auth'],
+)
+
+
+@auth_router.post('/token')
+async def login_for_access_token(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    db: AsyncSession = Depends(get_db)
+) -> Token:
+    user = await authenticate_user(form_data.username, form_data.password, db)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    access_token_expires = timedelta(minutes=1440)
+    access_token = create_access_token(
+        data={"sub": user.username}, expires_delta=access_token_expires
+    )
+
+    return Token(access_token=access_token, token_type="bearer")
+'''
+
+app_crud_async = '''from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.response_cache import ainvalidate
+from app.utils.pagination import PageParams
+from .models import {{app_class}}
+from .schemas import {{app_class}}Create, {{app_class}}Schema
+
+
+async def get_{{app_name}}s(db: AsyncSession, page: PageParams = None):
+    page = page or PageParams()
+    columns = page.columns({{app_class}}, {{app_class}}Schema.model_fields)
+    query = page.apply(select(*columns) if columns else select({{app_class}}), {{app_class}})
+    result = await db.execute(query)
+    return result.mappings().all() if columns else result.scalars().all()
+
+
+async def get_{{app_name}}(db: AsyncSession, {{app_name}}_id: int):
+    return await db.get({{app_class}}, {{app_name}}_id)
+
+
+async def create_{{app_name}}(db: AsyncSession, {{app_name}}: {{app_class}}Create):
+    db_{{app_name}} = {{app_class}}(**{{app_name}}.dict())
+    db.add(db_{{app_name}})
+    await db.commit()
+    await db.refresh(db_{{app_name}})
+    await ainvalidate("{{app_name}}s")
+    return db_{{app_name}}
+
+
+async def delete_{{app_name}}(db: AsyncSession, {{app_name}}_id: int):
+    db_{{app_name}} = await db.get({{app_class}}, {{app_name}}_id)
+    if db_{{app_name}}:
+        await db.delete(db_{{app_name}})
+        await db.commit()
+        await ainvalidate("{{app_name}}s")
+    return db_{{app_name}}
+'''
+
+app_router_async = '''from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.response_cache import cached_response
+from app.db.session import get_db
+from app.utils.pagination import PageParams, page_params
+from .schemas import {{app_class}}Schema, {{app_class}}Create
+from .crud import get_{{app_name}}s, get_{{app_name}}, create_{{app_name}}, delete_{{app_name}}
+
+{{app_name}}_router = APIRouter(
+    prefix='/{{app_name}}s',
+    tags=['{{app_class}}s']
+)
+
+
+@{{app_name}}_router.get('/', response_model=list[{{app_class}}Schema])
+@cached_response(namespace="{{app_name}}s", ttl=30, response_model=list[{{app_class}}Schema], lazy=("db",))
+async def list_{{app_name}}s(response: Response, page: PageParams = Depends(page_params), db: AsyncSession = Depends(get_db)):
+    return page.respond(await get_{{app_name}}s(db, page), response)
+
+
+@{{app_name}}_router.get('/{id}', response_model={{app_class}}Schema)
+@cached_response(namespace="{{app_name}}s", ttl=60, response_model={{app_class}}Schema, lazy=("db",))
+async def get_{{app_name}}_detail(id: int, db: AsyncSession = Depends(get_db)):
+    {{app_name}} = await get_{{app_name}}(db, id)
+    if not {{app_name}}:
+        raise HTTPException(status_code=404, detail="{{app_class}} not found")
+    return {{app_name}}
+
+
+@{{app_name}}_router.post('/', response_model={{app_class}}Schema)
+async def create_{{app_name}}_endpoint({{app_name}}: {{app_class}}Create, db: AsyncSession = Depends(get_db)):
+    return await create_{{app_name}}(db, {{app_name}})
+
+
+@{{app_name}}_router.delete('/{id}')
+async def delete_{{app_name}}_endpoint(id: int, db: AsyncSession = Depends(get_db)):
+    {{app_name}} = await delete_{{app_name}}(db, id)
+    if not {{app_name}}:
+        raise HTTPException(status_code=404, detail="{{app_class}} not found")
+    return {"message": "{{app_class}} deleted"}
+'''
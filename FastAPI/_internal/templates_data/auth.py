@@ -0,0 +1,466 @@
+# templates_data/auth.py
+# ----------------AUTH MODULE---------------#
+auth_crud = '''
+from decouple import config
+from typing import Annotated,Optional
+
+from jwt import PyJWTError
+from app.modules.auth.models import TokenData
+from app.modules.auth.utility import averify_password
+
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
+from fastapi import Depends, HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from datetime import datetime, timedelta, timezone
+import jwt
+from app.db.session import SessionLocal, get_db
+from app.modules.user.models import User
+from app.modules.user.crud import get_user_by_username
+from app.core.config import settings
+from app.modules.auth.cache import principal_cache
+
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
+
+
+async def authenticate_user(username: str, password: str, db:Session = Depends(get_db)):
+    user = await run_in_threadpool(get_user_by_username, db, username)
+    if not user:
+        return False
+    if not await averify_password(password, user.password):
+        return False
+    return user
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.now(timezone.utc) + expires_delta
+    else:
+        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+
+def _load_user(username: str):
+    # Own short-lived session: only opened on a principal-cache miss
+    with SessionLocal() as db:
+        return get_user_by_username(db, username=username)
+
+
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    # Fast path: a token verified recently needs neither decoding nor a DB lookup
+    cached = await principal_cache.aget(token)
+    if cached is not None:
+        return cached
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        username = payload.get("sub")
+        if username is None:
+            raise credentials_exception
+        token_data = TokenData(username=username)
+        
+    except PyJWTError:
+        raise credentials_exception
+    user = await run_in_threadpool(_load_user, token_data.username)
+    if user is None:
+        raise credentials_exception
+    await principal_cache.aset(token, user, payload.get("exp"))
+    return user
+
+
+async def get_current_active_user(current_user: User = Depends(get_current_user)):
+    return current_user
+'''
+auth_router = '''
+from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import timedelta
+from typing import Annotated
+from app.modules.auth.models import Token
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.orm import Session
+
+from app.modules.auth.crud import authenticate_user, create_access_token
+from app.db.session import get_db
+
+auth_router = APIRouter(
+    prefix='/auth',
+    tags=['Auth'],
+)
+
+
+@auth_router.post('/token')
+async def login_for_access_token(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    db: Session = Depends(get_db)
+) -> Token:
+    user = await authenticate_user(form_data.username, form_data.password, db)
+    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    access_token_expires = timedelta(minutes=1440)
+    access_token = create_access_token(
+        data={"sub": user.username}, expires_delta=access_token_expires
+    )
+
+    return Token(access_token=access_token, token_type="bearer")
+'''
+auth_models = '''
+from pydantic import BaseModel
+from typing import Optional
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    
+class TokenData(BaseModel):
+    username: Optional[str] = None
+'''
+auth_utils = '''
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from bcrypt import hashpw, gensalt, checkpw
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+# bcrypt releases the GIL, so a small dedicated pool hashes in parallel
+# without blocking the event loop or starving the default threadpool.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_pending_hashes = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+class PasswordHasherBusy(HTTPException):
+    """Raised (as a 503) when too many hashes are already queued."""
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent password checks, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+def get_password_hash(password: str) -> str:
+    return hashpw(password.encode("utf-8"), gensalt(rounds=settings.BCRYPT_ROUNDS)).decode("utf-8")
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except ValueError:
+        return False
+
+
+async def _run_hash(func, *args):
+    # Fail fast instead of queueing without bound: during a login storm the
+    # excess requests get a 503 and everything else keeps its latency.
+    if _pending_hashes.locked():
+        raise PasswordHasherBusy()
+    async with _pending_hashes:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+
+
+async def aget_password_hash(password: str) -> str:
+    """get_password_hash on the bounded hashing pool."""
+    return await _run_hash(get_password_hash, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bounded hashing pool."""
+    return await _run_hash(verify_password, plain_password, hashed_password)
+'''
+auth_login_benchmark = '''
+# scripts/login_burst_benchmark.py
+"""
+Login-burst benchmark.
+
+Fires bursts of concurrent logins at a running server while a probe thread
+keeps requesting a cheap endpoint, then reports p50/p99 latency for both.
+With bcrypt on the event loop, probe p99 climbs to roughly (burst size x
+hash time); with hashing on the bounded pool it stays close to its idle
+value, and logins beyond PASSWORD_HASH_MAX_PENDING get a fast 503.
+
+Usage:
+    python scripts/login_burst_benchmark.py --username alice --password secret
+        [--url http://localhost:8000] [--burst 50] [--bursts 5]
+"""
+import argparse
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def timed_request(request) -> tuple:
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, time.perf_counter() - started
+
+
+def percentile(samples: list, p: float) -> float:
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--login-path", default="/auth/token")
+    parser.add_argument("--probe-path", default="/docs")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--burst", type=int, default=50, help="concurrent logins per burst")
+    parser.add_argument("--bursts", type=int, default=5)
+    args = parser.parse_args()
+
+    form = urllib.parse.urlencode({"username": args.username, "password": args.password}).encode()
+    login = lambda _: timed_request(urllib.request.Request(args.url + args.login_path, data=form))
+
+    probe_latencies = []
+    done = threading.Event()
+
+    def probe():
+        while not done.is_set():
+            probe_latencies.append(timed_request(args.url + args.probe_path)[1])
+            time.sleep(0.01)
+
+    prober = threading.Thread(target=probe, daemon=True)
+    prober.start()
+    results = []
+    with ThreadPoolExecutor(max_workers=args.burst) as pool:
+        for _ in range(args.bursts):
+            results.extend(pool.map(login, range(args.burst)))
+            time.sleep(0.5)
+    done.set()
+    prober.join()
+
+    ok = [seconds for status, seconds in results if status == 200]
+    busy = sum(1 for status, _ in results if status == 503)
+    failed = len(results) - len(ok) - busy
+    print(f"logins: {len(results)}  ok: {len(ok)}  503 busy: {busy}  other errors: {failed}")
+    print(f"login  p50 {percentile(ok, 0.50):>8} ms   p99 {percentile(ok, 0.99):>8} ms")
+    print(
+        f"probe  p50 {percentile(probe_latencies, 0.50):>8} ms   p99 {percentile(probe_latencies, 0.99):>8} ms"
+        f"   ({len(probe_latencies)} requests)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+auth_cache = '''
+# app/modules/auth/cache.py
+"""
+Principal cache for get_current_user.
+
+Verified tokens map (by SHA-256 of the token) to a snapshot of the user's
+public columns, so authenticated requests skip both the JWT decode and the
+database lookup. Entries live in an in-process LRU with a TTL (never past
+the token's own expiry) and, with PRINCIPAL_CACHE_REDIS, in Redis as well
+so other workers can reuse them. delete_user() invalidates every entry of
+that user; other workers' in-process entries expire after the TTL.
+
+Async code uses aget/aset/ainvalidate_user: in-process hits are answered
+inline and only the Redis round trips go to the threadpool.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+PRINCIPAL_KEY = "principal:{}"
+USER_TOKENS_KEY = "principal-user:{}"
+
+
+class CachedPrincipal(SimpleNamespace):
+    """Read-only stand-in for a User, without the password hash."""
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def principal_fields(user) -> dict:
+    return {
+        column.name: getattr(user, column.name)
+        for column in user.__table__.columns
+        if column.name != "password"
+    }
+
+
+class PrincipalCache:
+    def __init__(self, maxsize: int, ttl: float, redis_client=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.redis = redis_client
+        self._entries = OrderedDict()  # token key -> (expires_at, user_id, fields)
+        self._by_user = {}  # user id -> set of token keys
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[CachedPrincipal]:
+        key = token_key(token)
+        cached = self._get_local(key)
+        if cached is not None or self.redis is None:
+            return cached
+        return self._get_remote(key)
+
+    async def aget(self, token: str) -> Optional[CachedPrincipal]:
+        key = token_key(token)
+        cached = self._get_local(key)
+        if cached is not None or self.redis is None:
+            return cached
+        return await run_in_threadpool(self._get_remote, key)
+
+    def _get_local(self, key: str) -> Optional[CachedPrincipal]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] > time.time():
+                self._entries.move_to_end(key)
+                return CachedPrincipal(**entry[2])
+            self._drop(key)
+        return None
+
+    def _get_remote(self, key: str) -> Optional[CachedPrincipal]:
+        now = time.time()
+        try:
+            raw = self.redis.get(PRINCIPAL_KEY.format(key))
+        except Exception:
+            return None
+        if raw is None:
+            return None
+        cached = json.loads(raw)
+        if cached["expires_at"] <= now:
+            return None
+        self._store(key, cached["expires_at"], cached["fields"])
+        return CachedPrincipal(**cached["fields"])
+
+    def set(self, token: str, user, token_expires_at: Optional[float] = None) -> None:
+        key, expires_at, fields = self._store_user(token, user, token_expires_at)
+        if self.redis is not None:
+            self._set_remote(key, expires_at, fields)
+
+    async def aset(self, token: str, user, token_expires_at: Optional[float] = None) -> None:
+        key, expires_at, fields = self._store_user(token, user, token_expires_at)
+        if self.redis is not None:
+            await run_in_threadpool(self._set_remote, key, expires_at, fields)
+
+    def _store_user(self, token: str, user, token_expires_at: Optional[float]) -> tuple:
+        key = token_key(token)
+        expires_at = time.time() + self.ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        fields = principal_fields(user)
+        self._store(key, expires_at, fields)
+        return key, expires_at, fields
+
+    def _set_remote(self, key: str, expires_at: float, fields: dict) -> None:
+        ttl = max(1, int(expires_at - time.time()))
+        payload = json.dumps({"expires_at": expires_at, "fields": fields}, default=str)
+        index = USER_TOKENS_KEY.format(fields["id"])
+        try:
+            self.redis.pipeline([
+                ("set", PRINCIPAL_KEY.format(key), payload, ttl),
+                ("sadd", index, key),
+                ("expire", index, int(self.ttl) + 1),
+            ])
+        except Exception:
+            pass
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._invalidate_local(user_id)
+        if self.redis is not None:
+            self._invalidate_remote(user_id)
+
+    async def ainvalidate_user(self, user_id: int) -> None:
+        self._invalidate_local(user_id)
+        if self.redis is not None:
+            await run_in_threadpool(self._invalidate_remote, user_id)
+
+    def _invalidate_local(self, user_id: int) -> None:
+        with self._lock:
+            for key in list(self._by_user.get(user_id, ())):
+                self._drop(key)
+
+    def _invalidate_remote(self, user_id: int) -> None:
+        try:
+            index = USER_TOKENS_KEY.format(user_id)
+            members = self.redis.pipeline([("smembers", index)])[0]
+            keys = [PRINCIPAL_KEY.format(k.decode() if isinstance(k, bytes) else k) for k in members]
+            self.redis.delete(index, *keys)
+        except Exception:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def _store(self, key: str, expires_at: float, fields: dict) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires_at, fields["id"], fields)
+            self._by_user.setdefault(fields["id"], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: str) -> None:
+        # Caller holds the lock.
+        _, user_id, _ = self._entries.pop(key)
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+
+def _redis_backing():
+    if not (settings.PRINCIPAL_CACHE_REDIS and settings.REDIS_URL):
+        return None
+    from app.core.redis_client import RedisClient
+
+    return RedisClient()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+    redis_client=_redis_backing(),
+)
+'''
@@ -0,0 +1,994 @@
+# templates_data/core.py
+# -----------------CORE FOLDER-----------#
+core_config = '''
+# app/core/config.py
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
+from typing import Optional
+
+class Settings(BaseSettings):
+    # App
+    PROJECT_NAME: str = "FastAPI Template"
+    DEBUG: bool = True
+    ENVIRONMENT: str = "development"  # development | staging | production
+    API_V1_PREFIX: str = "/api/v1"
+
+    # Pagination
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 100  # hard cap on ?limit= for list endpoints
+
+    # Server
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    RELOAD: bool = True
+
+    # Database
+    DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds; recycle before server-side idle timeouts
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a free connection
+    DB_POOL_PRE_PING: bool = True
+
+    # Security
+    SECRET_KEY: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ALGORITHM: str = "HS256"
+    HASHING_ALGORITHM: str
+    BCRYPT_ROUNDS: int = 12  # each +1 doubles the cost of a hash
+    PASSWORD_HASH_WORKERS: int = 2  # threads dedicated to bcrypt
+    PASSWORD_HASH_MAX_PENDING: int = 64  # queued hashes beyond this get a 503
+    PRINCIPAL_CACHE_SIZE: int = 10000  # verified tokens kept in memory per worker
+    PRINCIPAL_CACHE_TTL: int = 60  # seconds; also bounds staleness across workers
+    PRINCIPAL_CACHE_REDIS: bool = False  # share the cache through REDIS_URL
+    # Email
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: Optional[int] = None
+    SMTP_USER: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    EMAILS_FROM_EMAIL: Optional[str] = None
+    EMAILS_FROM_NAME: Optional[str] = None
+
+    # Other services
+    REDIS_URL: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50  # per worker process
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    RESPONSE_CACHE_ENABLED: bool = True  # cache decorated GET routes in Redis
+    RESPONSE_CACHE_LOCK_TIMEOUT: float = 5.0  # seconds a miss may hold its key before others compute it too
+
+    # Resilience (app/utils/resilience.py), per named dependency
+    RETRY_BUDGET_RATIO: float = 0.2  # retry tokens earned per call
+    RETRY_BUDGET_MAX: float = 10.0
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # consecutive failed attempts before the circuit opens
+    CIRCUIT_RESET_TIMEOUT: float = 30.0  # seconds before a half-open probe
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_DIR: str = "logs"
+    LOG_QUEUE_SIZE: int = 10000  # records beyond this are dropped, not waited for
+    LOG_BATCH_SIZE: int = 256
+    LOG_FLUSH_INTERVAL: float = 0.5
+
+    # ✅ Pydantic v2 config
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_ignore_empty=True,
+        case_sensitive=True,
+    )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
+'''
+core_security = '''
+# app/core/security.py
+
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# ───── Password Hashing ─────
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a hashed one."""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """Hash a password for storing."""
+    return pwd_context.hash(password)
+'''
+core_logger = '''
+# app/core/logger.py
+"""
+Non-blocking logging pipeline.
+
+Request handlers only put records on a bounded in-memory queue; a single
+background thread drains it in batches, formats them as JSON lines and
+writes each batch to the console and the rotating log file in one write.
+When the queue is full (e.g. the disk stalls) new records are dropped and
+counted instead of blocking the event loop.
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
+
+from app.core.config import settings
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops and counts records when its queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare() folds the traceback into the message and
+        # clears exc_info. Keep it rendered in exc_text instead, so
+        # JsonFormatter still writes it as a separate "exception" field.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchingListener:
+    """Drains a log queue on a background thread and writes records in batches."""
+
+    _STOP = object()
+
+    def __init__(self, log_queue: queue.Queue, handlers: list, batch_size: int, flush_interval: float):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Writes every queued record, then stops the thread."""
+        if self._thread is None:
+            return
+        # Blocking put: the stop marker must not be dropped, even on a full queue.
+        self.queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+        for handler in self.handlers:
+            handler.close()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            stopping = record is self._STOP
+            if not stopping:
+                batch.append(record)
+            while not stopping and len(batch) < self.batch_size:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is self._STOP:
+                    stopping = True
+                else:
+                    batch.append(record)
+            if batch:
+                self.write(batch)
+            if stopping:
+                return
+
+    def write(self, batch: list) -> None:
+        for handler in self.handlers:
+            records = [record for record in batch if record.levelno >= handler.level]
+            if not records:
+                continue
+            handler.acquire()
+            try:
+                if isinstance(handler, RotatingFileHandler) and handler.shouldRollover(records[0]):
+                    handler.doRollover()
+                handler.stream.write("".join(handler.format(record) + handler.terminator for record in records))
+                handler.flush()
+            except Exception:
+                handler.handleError(records[0])
+            finally:
+                handler.release()
+
+
+_queue_handler = None
+_listener = None
+
+
+def setup_logging(name: str = "api-logger") -> logging.Logger:
+    """Attaches the queue pipeline to ``name`` once and returns the logger."""
+    global _queue_handler, _listener
+
+    logger = logging.getLogger(name)
+    logger.setLevel(settings.LOG_LEVEL)
+    if _queue_handler is not None:
+        return logger
+
+    os.makedirs(settings.LOG_DIR, exist_ok=True)
+    formatter = JsonFormatter()
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    file_handler = RotatingFileHandler(
+        os.path.join(settings.LOG_DIR, "api.log"), maxBytes=5*1024*1024, backupCount=5, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _listener = BatchingListener(
+        log_queue,
+        [console_handler, file_handler],
+        batch_size=settings.LOG_BATCH_SIZE,
+        flush_interval=settings.LOG_FLUSH_INTERVAL,
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logger.addHandler(_queue_handler)
+    logger.propagate = False
+    return logger
+
+
+def dropped_records() -> int:
+    """Number of records dropped because the log queue was full."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+logger = setup_logging()
+'''
+
+core_middleware='''
+import json
+import logging
+import time
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+
+# --- Sensitive fields ---
+SENSITIVE_KEYS = {"password", "token", "secret", "authorization"}
+LOGGED_HEADERS = {"content-type", "user-agent", "authorization"}
+
+# Only this many bytes of each request/response body are kept for the log line.
+MAX_LOGGED_BODY_BYTES = 2048
+
+
+def mask_sensitive(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {
+            k: ("***" if k.lower() in SENSITIVE_KEYS else mask_sensitive(v))
+            for k, v in data.items()
+        }
+    elif isinstance(data, list):
+        return [mask_sensitive(i) for i in data]
+    return data
+
+
+class BodyTee:
+    """Keeps a bounded prefix of a body that is streamed past it."""
+
+    __slots__ = ("limit", "chunks", "size", "truncated")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.chunks = []
+        self.size = 0
+        self.truncated = False
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        remaining = self.limit - self.size
+        if remaining <= 0:
+            self.truncated = True
+            return
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            self.truncated = True
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+
+    def parsed(self) -> Any:
+        if not self.chunks:
+            return None
+        text = b"".join(self.chunks).decode("utf-8", errors="replace")
+        if not self.truncated:
+            try:
+                return mask_sensitive(json.loads(text))
+            except ValueError:
+                pass
+        return text + ("...(truncated)" if self.truncated else "")
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI request logger.
+
+    Request and response messages are passed through untouched; only the
+    first MAX_LOGGED_BODY_BYTES of each body are copied for the log line, so
+    streaming and SSE responses keep streaming and large downloads are never
+    held in memory. One line is logged per request once the response is done.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int = MAX_LOGGED_BODY_BYTES):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        request_body = BodyTee(self.max_body_bytes)
+        response_body = BodyTee(self.max_body_bytes)
+        response = {"status_code": 500, "started": False}
+
+        async def receive_and_tee() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.feed(message.get("body", b""))
+            return message
+
+        async def send_and_tee(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status_code"] = message["status"]
+                response["started"] = True
+            elif message["type"] == "http.response.body":
+                response_body.feed(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_and_tee, send_and_tee)
+        except Exception as e:
+            # If the route raises before responding, answer with a 500 here
+            if response["started"]:
+                raise
+            error_response = JSONResponse(content={"error": str(e)}, status_code=500)
+            await error_response(scope, receive, send_and_tee)
+        finally:
+            process_time = (time.perf_counter() - start_time) * 1000
+            self.log(Request(scope), response["status_code"], process_time, request_body, response_body)
+
+    def log(self, request: Request, status_code: int, process_time: float, request_body: BodyTee, response_body: BodyTee) -> None:
+        client_ip = request.client.host if request.client else "unknown"
+        headers = {
+            k: ("***" if k.lower() in SENSITIVE_KEYS else v)
+            for k, v in request.headers.items()
+            if k.lower() in LOGGED_HEADERS
+        }
+
+        # --- Structured log record (JSON fields) ---
+        fields = {
+            "client_ip": client_ip,
+            "method": request.method,
+            "path": request.url.path,
+            "query_params": dict(request.query_params),
+            "headers": headers,
+            "request_body": request_body.parsed(),
+            "status_code": status_code,
+            "response_time_ms": round(process_time, 2),
+            "response_body": response_body.parsed(),
+        }
+
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        logger.log(level, "%s %s %s", request.method, request.url.path, status_code, extra=fields)
+'''
+
+redis_client = '''import threading
+import time
+from functools import lru_cache
+
+import redis
+import redis.asyncio as aioredis
+from redis import Redis
+
+from app.core.config import settings
+
+
+class RedisError(Exception):
+    """Custom exception for Redis errors."""
+
+
+class CommandMetrics:
+    """Per-command call count, error count and latency, shared by the sync and async clients."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def observe(self, command: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(command, {"calls": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0})
+            stats["calls"] += 1
+            stats["errors"] += failed
+            stats["total_s"] += seconds
+            stats["max_s"] = max(stats["max_s"], seconds)
+
+    def snapshot(self) -> dict:
+        """Command -> {"calls", "errors", "avg_ms", "max_ms"}."""
+        with self._lock:
+            return {
+                command: {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "avg_ms": round(stats["total_s"] / stats["calls"] * 1000, 3),
+                    "max_ms": round(stats["max_s"] * 1000, 3),
+                }
+                for command, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+redis_metrics = CommandMetrics()
+
+
+def rate_limit_key(key: str, window: int) -> str:
+    """Counter key for ``key`` in the current ``window``-second window."""
+    return f"ratelimit:{key}:{int(time.time() // window)}"
+
+
+def _pool_kwargs() -> dict:
+    return {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+    }
+
+
+@lru_cache
+def get_connection_pool() -> redis.ConnectionPool:
+    """The process-wide connection pool, built from settings.REDIS_URL."""
+    return redis.ConnectionPool.from_url(settings.REDIS_URL or "redis://localhost:6379/0", **_pool_kwargs())
+
+
+@lru_cache
+def get_async_connection_pool() -> aioredis.ConnectionPool:
+    """The process-wide asyncio connection pool, built from settings.REDIS_URL."""
+    return aioredis.ConnectionPool.from_url(settings.REDIS_URL or "redis://localhost:6379/0", **_pool_kwargs())
+
+
+class RedisClient:
+    """
+    A Redis client wrapper class for simplified interaction with Redis.
+
+    Clients share one connection pool (built from settings.REDIS_URL) unless
+    an explicit client or host is given, and every command is timed into
+    redis_metrics.
+    """
+
+    def __init__(
+        self,
+        client: Redis = None,
+        host: str = None,
+        port: int = 6379,
+        db: int = 0,
+    ):
+        """
+        Initializes the Redis client.
+
+        Args:
+            client (Redis, optional): An existing redis.Redis to wrap.
+            host (str, optional): Redis server host. When omitted the shared
+                pool from settings.REDIS_URL is used.
+            port (int): Redis server port. Defaults to 6379.
+            db (int): Redis database index. Defaults to 0.
+        """
+        if client is not None and isinstance(client, Redis):
+            self.client = client
+        elif host is not None:
+            self.client = redis.Redis(host=host, port=port, db=db)
+        else:
+            self.client = redis.Redis(connection_pool=get_connection_pool())
+
+    def _call(self, command: str, func, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except redis.RedisError as e:
+            redis_metrics.observe(command, time.perf_counter() - started, failed=True)
+            raise RedisError(str(e))
+        redis_metrics.observe(command, time.perf_counter() - started)
+        return result
+
+    def get(self, key: str):
+        """
+        Retrieves the value associated with the given key from Redis.
+
+        Args:
+            key (str): The key to retrieve the value for.
+
+        Returns:
+            str: The value associated with the key, or None if the key does not exist.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        return self._call("get", self.client.get, key)
+
+    def set(self, key: str, value: str, ex: int = None, nx: bool = False):
+        """
+        Sets the value for the given key in Redis.
+
+        Args:
+            key (str): The key to set the value for.
+            value (str): The value to be set.
+            ex (int, optional): Expiration time in seconds for the key.
+            nx (bool, optional): Only set the key if it does not exist yet.
+
+        Returns:
+            bool: Whether the key was set (False only with ``nx``).
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        return bool(self._call("set", self.client.set, key, value, ex=ex, nx=nx))
+
+    def mget(self, keys: list) -> list:
+        """
+        Retrieves several keys in one round trip.
+
+        Returns:
+            list: Values in the order of ``keys`` (None for missing keys).
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        return self._call("mget", self.client.mget, keys)
+
+    def mset(self, mapping: dict, ex: int = None):
+        """
+        Sets several keys in one round trip; with ``ex`` every key also gets
+        that expiry (sent as one pipeline, since MSET has no expiry).
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        if ex is None:
+            self._call("mset", self.client.mset, mapping)
+        else:
+            self.pipeline([("set", key, value, ex) for key, value in mapping.items()])
+
+    def delete(self, *keys: str) -> int:
+        """
+        Deletes keys.
+
+        Returns:
+            int: Number of keys that were removed.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        return self._call("delete", self.client.delete, *keys) if keys else 0
+
+    def incr(self, key: str):
+        """
+        Increments the value associated with the given key in Redis.
+
+        Args:
+            key (str): The key to increment.
+
+        Returns:
+            int: The incremented value.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        return self._call("incr", self.client.incr, key)
+
+    def expire(self, key: str, ex: int):
+        """
+        Sets an expiration time for the given key in Redis.
+
+        Args:
+            key (str): The key to set the expiration for.
+            ex (int): Expiration time in seconds for the key.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        self._call("expire", self.client.expire, key, ex)
+
+    def incr_with_expiry(self, key: str, ex: int) -> int:
+        """
+        INCR and EXPIRE in one atomic round trip, e.g. for a rate-limit window.
+
+        Returns:
+            int: The incremented value.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        count, _ = self.pipeline([("incr", key), ("expire", key, ex)], transaction=True)
+        return count
+
+    def rate_limit(self, key: str, limit: int, window: int) -> tuple:
+        """
+        Fixed-window rate limiter: counts one hit for ``key`` in the current
+        ``window``-second window, in one round trip.
+
+        Args:
+            key (str): What is being limited, e.g. f"login:{client_ip}".
+            limit (int): Hits allowed per window.
+            window (int): Window length in seconds.
+
+        Returns:
+            tuple: (allowed, remaining) - whether this hit is within
+                ``limit`` and how many hits are left in the window.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        count = self.incr_with_expiry(rate_limit_key(key, window), window)
+        return count <= limit, max(0, limit - count)
+
+    def pipeline(self, commands: list, transaction: bool = False) -> list:
+        """
+        Sends several commands in one round trip.
+
+        Args:
+            commands (list): Tuples of (command name, *args), e.g.
+                [("incr", "hits"), ("expire", "hits", 60)].
+            transaction (bool, optional): Wrap them in MULTI/EXEC. Defaults to False.
+
+        Returns:
+            list: One result per command.
+
+        Raises:
+            RedisError: If there is an error during the Redis operation.
+        """
+        def run():
+            pipe = self.client.pipeline(transaction=transaction)
+            for name, *args in commands:
+                getattr(pipe, name)(*args)
+            return pipe.execute()
+
+        return self._call("pipeline", run)
+
+
+class AsyncRedisClient:
+    """
+    redis.asyncio twin of RedisClient for async routes; same methods,
+    awaited, on a shared asyncio connection pool.
+    """
+
+    def __init__(self, client: aioredis.Redis = None):
+        self.client = client if client is not None else aioredis.Redis(connection_pool=get_async_connection_pool())
+
+    async def _call(self, command: str, coroutine):
+        started = time.perf_counter()
+        try:
+            result = await coroutine
+        except redis.RedisError as e:
+            redis_metrics.observe(command, time.perf_counter() - started, failed=True)
+            raise RedisError(str(e))
+        redis_metrics.observe(command, time.perf_counter() - started)
+        return result
+
+    async def get(self, key: str):
+        return await self._call("get", self.client.get(key))
+
+    async def set(self, key: str, value: str, ex: int = None, nx: bool = False):
+        return bool(await self._call("set", self.client.set(key, value, ex=ex, nx=nx)))
+
+    async def mget(self, keys: list) -> list:
+        return await self._call("mget", self.client.mget(keys))
+
+    async def mset(self, mapping: dict, ex: int = None):
+        if ex is None:
+            await self._call("mset", self.client.mset(mapping))
+        else:
+            await self.pipeline([("set", key, value, ex) for key, value in mapping.items()])
+
+    async def delete(self, *keys: str) -> int:
+        return await self._call("delete", self.client.delete(*keys)) if keys else 0
+
+    async def incr(self, key: str):
+        return await self._call("incr", self.client.incr(key))
+
+    async def expire(self, key: str, ex: int):
+        await self._call("expire", self.client.expire(key, ex))
+
+    async def incr_with_expiry(self, key: str, ex: int) -> int:
+        count, _ = await self.pipeline([("incr", key), ("expire", key, ex)], transaction=True)
+        return count
+
+    async def rate_limit(self, key: str, limit: int, window: int) -> tuple:
+        count = await self.incr_with_expiry(rate_limit_key(key, window), window)
+        return count <= limit, max(0, limit - count)
+
+    async def pipeline(self, commands: list, transaction: bool = False) -> list:
+        pipe = self.client.pipeline(transaction=transaction)
+        for name, *args in commands:
+            getattr(pipe, name)(*args)
+        return await self._call("pipeline", pipe.execute())
+'''
+
+response_cache = '''
+# app/core/response_cache.py
+"""
+Redis-backed response cache for GET routes.
+
+    @router.get("/", response_model=list[ItemSchema])
+    @cached_response(namespace="items", ttl=30, response_model=list[ItemSchema], lazy=("db",))
+    async def list_items(..., db: Session = Depends(get_db)): ...
+
+The key is namespace + path + sorted query string, so every page and
+filter is cached separately. Dependencies named in ``lazy`` are only
+resolved when the route actually runs, so a hit never opens a session. On a miss, only one request per key (the one
+that wins a short Redis lock) runs the route; concurrent requests for the
+same key wait for its result instead of all hitting the database. Create
+and delete CRUD functions call invalidate()/ainvalidate() for their
+namespace. If Redis is unreachable the cache is bypassed for a few seconds
+and routes run as if undecorated.
+"""
+import asyncio
+import functools
+import inspect
+import json
+import time
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.redis_client import AsyncRedisClient, RedisClient, RedisError
+
+KEY_PREFIX = "respcache"
+SKIPPED_HEADERS = {"content-length", "content-type"}
+RETRY_AFTER_ERROR = 5.0  # seconds to bypass the cache after a Redis error
+
+_down_until = 0.0
+_async_client = None
+_sync_client = None
+# Namespace -> longest TTL of its routes. The namespace index must outlive
+# every entry it lists, or invalidate() could no longer find them.
+_index_ttls = {}
+
+
+def _available() -> bool:
+    return settings.RESPONSE_CACHE_ENABLED and bool(settings.REDIS_URL) and time.monotonic() >= _down_until
+
+
+def _mark_down() -> None:
+    global _down_until
+    _down_until = time.monotonic() + RETRY_AFTER_ERROR
+
+
+def _async_redis() -> AsyncRedisClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncRedisClient()
+    return _async_client
+
+
+def _sync_redis() -> RedisClient:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = RedisClient()
+    return _sync_client
+
+
+def namespace_index(namespace: str) -> str:
+    return f"{KEY_PREFIX}-index:{namespace}"
+
+
+def cache_key(namespace: str, request: Request) -> str:
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{KEY_PREFIX}:{namespace}:{request.url.path}?{query}"
+
+
+def _serialize(result, response: Response, response_model) -> tuple:
+    """Returns (status, body, headers) exactly as the client would get them."""
+    if isinstance(result, Response):
+        headers = {k: v for k, v in result.headers.items() if k.lower() not in SKIPPED_HEADERS}
+        return result.status_code, result.body.decode("utf-8"), headers
+    if response_model is not None:
+        adapter = TypeAdapter(response_model)
+        body = adapter.dump_json(adapter.validate_python(result, from_attributes=True)).decode("utf-8")
+    else:
+        body = json.dumps(jsonable_encoder(result))
+    headers = {k: v for k, v in response.headers.items() if k.lower() not in SKIPPED_HEADERS}
+    return response.status_code or 200, body, headers
+
+
+async def _enter_dependency(stack: AsyncExitStack, dependency):
+    """Resolves a parameterless dependency (e.g. get_db) the way FastAPI would."""
+    if inspect.isasyncgenfunction(dependency):
+        return await stack.enter_async_context(asynccontextmanager(dependency)())
+    if inspect.isgeneratorfunction(dependency):
+        manager = contextmanager(dependency)()
+        value = await run_in_threadpool(manager.__enter__)
+        stack.push_async_exit(lambda *exc: run_in_threadpool(manager.__exit__, *exc))
+        return value
+    if inspect.iscoroutinefunction(dependency):
+        return await dependency()
+    return await run_in_threadpool(dependency)
+
+
+def _to_response(entry: dict, cache_status: str) -> Response:
+    headers = dict(entry["headers"], **{"X-Cache": cache_status})
+    return Response(content=entry["body"], status_code=entry["status"], headers=headers, media_type="application/json")
+
+
+def cached_response(namespace: str, ttl: int = 30, response_model=None, lazy: tuple = ()):
+    """
+    Caches the serialized response of a GET route in Redis for ``ttl`` seconds.
+
+    ``response_model`` should match the route's, so cached bodies are
+    filtered the same way as live ones. ``lazy`` names parameters whose
+    ``Depends(...)`` (parameterless, like get_db) is resolved only on a miss.
+    """
+    _index_ttls[namespace] = max(_index_ttls.get(namespace, 0), ttl)
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        lazy_dependencies = {}
+        for name in lazy:
+            dependency = getattr(signature.parameters[name].default, "dependency", None)
+            if dependency is None:
+                raise TypeError(f"lazy parameter {name!r} of {func.__name__} must default to Depends(...)")
+            lazy_dependencies[name] = dependency
+        exposed = [p for name, p in signature.parameters.items() if name not in lazy_dependencies]
+        extra = [
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+            for name, annotation in (("request", Request), ("response", Response))
+            if name not in signature.parameters
+        ]
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs["request"] if "request" in signature.parameters else kwargs.pop("request")
+            response = kwargs["response"] if "response" in signature.parameters else kwargs.pop("response")
+
+            async def call_route():
+                async with AsyncExitStack() as stack:
+                    for name, dependency in lazy_dependencies.items():
+                        kwargs[name] = await _enter_dependency(stack, dependency)
+                    if inspect.iscoroutinefunction(func):
+                        return await func(*args, **kwargs)
+                    return await run_in_threadpool(func, *args, **kwargs)
+
+            if not _available():
+                return await call_route()
+
+            redis = _async_redis()
+            key = cache_key(namespace, request)
+            lock_key = f"{key}:lock"
+            try:
+                cached = await redis.get(key)
+                if cached is not None:
+                    return _to_response(json.loads(cached), "HIT")
+                owner = await redis.set(lock_key, "1", ex=max(1, int(settings.RESPONSE_CACHE_LOCK_TIMEOUT)), nx=True)
+                if not owner:
+                    # Someone else is computing this key: wait for their result.
+                    deadline = time.monotonic() + settings.RESPONSE_CACHE_LOCK_TIMEOUT
+                    while time.monotonic() < deadline:
+                        await asyncio.sleep(0.025)
+                        cached = await redis.get(key)
+                        if cached is not None:
+                            return _to_response(json.loads(cached), "HIT")
+                    return await call_route()
+            except RedisError:
+                _mark_down()
+                return await call_route()
+
+            try:
+                result = await call_route()
+                status, body, headers = _serialize(result, response, response_model)
+                entry = {"status": status, "body": body, "headers": headers}
+                if status == 200:
+                    try:
+                        await redis.pipeline([
+                            ("set", key, json.dumps(entry), ttl),
+                            ("sadd", namespace_index(namespace), key),
+                            ("expire", namespace_index(namespace), _index_ttls[namespace]),
+                        ])
+                    except RedisError:
+                        _mark_down()
+                return _to_response(entry, "MISS")
+            finally:
+                try:
+                    await redis.delete(lock_key)
+                except RedisError:
+                    _mark_down()
+
+        wrapper.__signature__ = signature.replace(parameters=exposed + extra)
+        return wrapper
+
+    return decorator
+
+
+def invalidate(namespace: str) -> None:
+    """Drops every cached response of ``namespace`` (for sync CRUD functions)."""
+    if not _available():
+        return
+    try:
+        redis = _sync_redis()
+        keys = redis.pipeline([("smembers", namespace_index(namespace))])[0]
+        redis.delete(namespace_index(namespace), *keys)
+    except RedisError:
+        _mark_down()
+
+
+async def ainvalidate(namespace: str) -> None:
+    """Drops every cached response of ``namespace`` (for async CRUD functions)."""
+    if not _available():
+        return
+    try:
+        redis = _async_redis()
+        keys = (await redis.pipeline([("smembers", namespace_index(namespace))]))[0]
+        await redis.delete(namespace_index(namespace), *keys)
+    except RedisError:
+        _mark_down()
+'''
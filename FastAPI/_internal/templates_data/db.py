@@ -0,0 +1,259 @@
+# templates_data/db.py
+# ----------------DATABASE---------------#
+db_base = '''
+# app/db/base.py
+
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+'''
+
+db_session = '''
+# app/db/session.py
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.metrics import PoolMetrics
+
+
+def pool_options() -> dict:
+    """Connection-pool arguments for create_engine, taken from Settings."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+# Create the SQLAlchemy engine
+engine = create_engine(
+    settings.DATABASE_URL,
+    future=True,
+    **pool_options(),
+)
+
+# Session factory
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    future=True,
+)
+
+
+pool_metrics = PoolMetrics(engine.pool, capacity=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+
+
+def pool_stats() -> dict:
+    """Current pool gauges and checkout latency percentiles, e.g. for a metrics endpoint."""
+    return pool_metrics.snapshot()
+
+
+# Dependency for FastAPI routes. The session checks a connection out of
+# the pool on its first query, so routes that never query hold none.
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+'''
+
+db_metrics = '''
+# app/db/metrics.py
+
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+class PoolMetrics:
+    """
+    Checkout latency and saturation of a connection pool.
+
+    Sessions keep acquiring their connection lazily, on the first query:
+    the wait is timed around pool.connect(), and checkouts/checkins are
+    followed through pool events. Latencies are kept in a fixed-size
+    window, so percentiles describe recent traffic and memory stays bounded.
+    engine.dispose() replaces the pool, so build a new PoolMetrics after it.
+    """
+
+    def __init__(self, pool, capacity: int, window: int = 1024):
+        self.pool = pool
+        self.capacity = capacity
+        self.window = window
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.reset()
+        self._instrument()
+
+    def _instrument(self) -> None:
+        connect = self.pool.connect
+
+        def timed_connect(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                connection = connect(*args, **kwargs)
+            except PoolTimeoutError:
+                self.record_timeout()
+                raise
+            self.observe(time.perf_counter() - started)
+            return connection
+
+        self.pool.connect = timed_connect
+        event.listen(self.pool, "checkout", self._on_checkout)
+        event.listen(self.pool, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latencies = deque(maxlen=self.window)
+            self.checkouts = 0
+            self.timeouts = 0
+            self.peak_in_use = self.in_use
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+            self.checkouts += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def saturation(self) -> float:
+        """Checked-out connections as a fraction of pool_size + max_overflow."""
+        return self.in_use / self.capacity if self.capacity > 0 else 0.0
+
+    def peak_saturation(self) -> float:
+        """Highest saturation since the last reset()."""
+        return self.peak_in_use / self.capacity if self.capacity > 0 else 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            checkouts, timeouts = self.checkouts, self.timeouts
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 3)
+
+        return {
+            "capacity": self.capacity,
+            "checked_out": self.in_use,
+            "overflow": self.pool.overflow() if hasattr(self.pool, "overflow") else None,
+            "saturation": round(self.saturation(), 3),
+            "peak_saturation": round(self.peak_saturation(), 3),
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "checkout_ms_p50": percentile(0.50),
+            "checkout_ms_p99": percentile(0.99),
+            "checkout_ms_max": percentile(1.0),
+        }
+'''
+
+db_pool_load_test = '''
+# scripts/pool_load_test.py
+"""
+Connection-pool load test.
+
+Runs waves of concurrent requests against DATABASE_URL. Each request gets
+a session from get_db, runs SELECT 1 and holds the connection for
+--hold-ms, like a route doing work. Up to DB_POOL_SIZE + DB_MAX_OVERFLOW
+concurrent requests, checkout latency stays near zero. Beyond that,
+requests queue for a free connection: latency grows by about one hold time
+per extra "wave", saturation stays pinned at 1.0, and requests fail with
+QueuePool timeouts once the wait exceeds DB_POOL_TIMEOUT.
+
+Usage:
+    python scripts/pool_load_test.py [--hold-ms 50] [--requests 200] [--levels 5 15 30 60]
+"""
+import argparse
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+from app.db.session import get_db, pool_metrics
+
+
+def one_request(hold: float) -> bool:
+    dependency = get_db()
+    db = next(dependency)
+    try:
+        # The connection is checked out here, on the first query
+        db.execute(text("SELECT 1"))
+        time.sleep(hold)
+    except PoolTimeoutError:
+        return False
+    finally:
+        dependency.close()
+    return True
+
+
+def run_level(concurrency: int, requests: int, hold: float) -> dict:
+    pool_metrics.reset()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: one_request(hold), range(requests)))
+    wall = time.perf_counter() - started
+
+    stats = pool_metrics.snapshot()
+    return {
+        "concurrency": concurrency,
+        "ok": sum(results),
+        "timeouts": stats["timeouts"],
+        "p50_ms": stats["checkout_ms_p50"],
+        "p99_ms": stats["checkout_ms_p99"],
+        "peak_saturation": stats["peak_saturation"],
+        "req_per_s": round(requests / wall, 1),
+    }
+
+
+def main() -> int:
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hold-ms", type=float, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--levels", type=int, nargs="+",
+        default=[max(1, settings.DB_POOL_SIZE // 2), settings.DB_POOL_SIZE, capacity, capacity * 2, capacity * 4],
+    )
+    args = parser.parse_args()
+
+    print(f"pool_size={settings.DB_POOL_SIZE} max_overflow={settings.DB_MAX_OVERFLOW} pool_timeout={settings.DB_POOL_TIMEOUT}s")
+    print(f"{'clients':>8} {'ok':>6} {'timeouts':>9} {'p50 ms':>9} {'p99 ms':>9} {'peak sat':>9} {'req/s':>8}")
+    for concurrency in args.levels:
+        row = run_level(concurrency, args.requests, args.hold_ms / 1000)
+        print(
+            f"{row['concurrency']:>8} {row['ok']:>6} {row['timeouts']:>9} {row['p50_ms']:>9} "
+            f"{row['p99_ms']:>9} {row['peak_saturation']:>9} {row['req_per_s']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
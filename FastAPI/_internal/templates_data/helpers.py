@@ -0,0 +1,339 @@
+# templates_data/helpers.py
+# --------------------helpers---------------#
+
+message = '''
+
+# ============================================================
+# Centralized Message Repository for API & CLI
+# ============================================================
+
+# =====================
+# General Errors
+# =====================
+GENERAL_ERRORS = {
+    "invalid_input": "The input provided is invalid.",
+    "bad_request": "The request could not be understood or was missing parameters.",
+    "not_found": "The requested resource was not found.",
+    "method_not_allowed": "The HTTP method is not allowed for this endpoint.",
+    "internal_server_error": "An unexpected error occurred. Please try again later.",
+    "service_unavailable": "The service is temporarily unavailable. Please try again later.",
+    "unsupported_media": "Unsupported media type in request.",
+    "too_many_requests": "Too many requests. Please try again later.",
+}
+
+# =====================
+# Authentication & Authorization
+# =====================
+AUTH_ERRORS = {
+    "unauthorized": "You are not authorized. Please provide valid credentials.",
+    "forbidden": "You do not have permission to perform this action.",
+    "token_expired": "Authentication token has expired. Please login again.",
+    "invalid_token": "Invalid authentication token provided.",
+    "missing_token": "Authentication token is required.",
+    "invalid_credentials": "Invalid username or password.",
+    "account_locked": "Your account is locked. Contact support.",
+    "account_inactive": "Your account is inactive. Please verify your email.",
+}
+
+# =====================
+# Validation Errors
+# =====================
+VALIDATION_ERRORS = {
+    "missing_fields": "Required fields are missing.",
+    "invalid_type": "Invalid data type provided.",
+    "invalid_email": "Please provide a valid email address.",
+    "invalid_id": "The provided ID is invalid.",
+    "invalid_format": "Data format is incorrect.",
+    "min_length": "Input is too short.",
+    "max_length": "Input is too long.",
+    "value_out_of_range": "Input value is out of allowed range.",
+    "password_strength": "Password must contain uppercase, lowercase, numbers, and special characters.",
+}
+
+# =====================
+# Database Errors
+# =====================
+DB_ERRORS = {
+   50010: "Token is expired, please re login.",
+    50009: "Token is not valid, Please provide valid token.",
+    50008: "Incorrect username or password.",
+    50001: "User email already exists in system, please provide valid user email.",
+    50006: "User not exists in system, please provide valid user details.",
+    50011: "User '{}' is locked, please contact administrator for it.",
+    50012: "User '{}' is inactive, please contact administrator for it.",
+}
+
+# =====================
+# Request Errors
+# =====================
+REQUEST_ERRORS = {
+    "invalid_query": "The query parameters are invalid.",
+    "invalid_body": "The request body is invalid or malformed.",
+    "invalid_headers": "Invalid or missing headers.",
+    "timeout": "The request timed out.",
+    "payload_too_large": "The request payload is too large.",
+}
+
+# =====================
+# File Handling Errors
+# =====================
+FILE_ERRORS = {
+    "file_not_found": "The requested file does not exist.",
+    "file_too_large": "The uploaded file exceeds the allowed size limit.",
+    "unsupported_file": "Unsupported file type.",
+    "upload_failed": "File upload failed.",
+    "read_error": "Failed to read the file.",
+    "write_error": "Failed to write the file.",
+    "permission_error": "Insufficient permissions to access the file.",
+}
+
+
+# =====================
+# Network/External API Errors
+# =====================
+NETWORK_ERRORS = {
+    "api_unreachable": "External API is unreachable.",
+    "api_timeout": "External API request timed out.",
+    "api_invalid_response": "External API returned an invalid response.",
+    "dns_error": "DNS resolution failed.",
+    "connection_refused": "Connection to external service was refused.",
+    "ssl_error": "SSL certificate validation failed.",
+}
+
+# =====================
+# Success Messages
+# =====================
+SUCCESS_MESSAGES = {
+    "created": "Resource created successfully.",
+    "updated": "Resource updated successfully.",
+    "deleted": "Resource deleted successfully.",
+    "fetched": "Data retrieved successfully.",
+    "executed": "Command executed successfully.",
+    "login_success": "Logged in successfully.",
+    "logout_success": "Logged out successfully.",
+    "email_sent": "Email has been sent successfully.",
+    "file_uploaded": "File uploaded successfully.",
+}
+
+# =====================
+# Informational / Warnings
+# =====================
+INFO_MESSAGES = {
+    "deprecated": "This endpoint is deprecated and will be removed in future versions.",
+    "retry": "The operation failed. Please try again later.",
+    "partial_success": "The operation completed with partial success.",
+}
+
+'''
+
+execeptions = '''
+
+from app.core.helpers.message import GENERAL_ERRORS, AUTH_ERRORS, VALIDATION_ERRORS, DB_ERRORS, REQUEST_ERRORS, FILE_ERRORS, NETWORK_ERRORS, SUCCESS_MESSAGES, INFO_MESSAGES
+
+class AppException(Exception):
+    """Base exception for all custom app errors."""
+    def __init__(self, message: str, code: int = 400):
+        self.message = message
+        self.code = code
+        super().__init__(self.message)
+
+    def to_dict(self):
+        return {"error": self.message, "code": self.code}
+
+
+# ==== General Errors ====
+class InvalidInputError(AppException):
+    def __init__(self):
+        super().__init__(GENERAL_ERRORS["invalid_input"], code=400)
+
+
+class NotFoundError(AppException):
+    def __init__(self):
+        super().__init__(GENERAL_ERRORS["not_found"], code=404)
+
+
+class InternalServerError(AppException):
+    def __init__(self):
+        super().__init__(GENERAL_ERRORS["internal_server_error"], code=500)
+
+
+# ==== Auth Errors ====
+class UnauthorizedError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["unauthorized"], code=401)
+
+
+class TokenExpiredError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["token_expired"], code=401)
+
+
+class InvalidTokenError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["invalid_token"], code=401)
+
+
+class ForbiddenError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["forbidden"], code=403)
+
+
+class MissingTokenError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["missing_token"], code=401)
+
+
+class InvalidCredentialsError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["invalid_credentials"], code=401)
+
+
+class AccountLockedError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["account_locked"], code=403)
+
+
+class AccountInactiveError(AppException):
+    def __init__(self):
+        super().__init__(AUTH_ERRORS["account_inactive"], code=403)
+
+
+# ==== Validation Errors ====
+class MissingFieldsError(AppException):
+    def __init__(self):
+        super().__init__(VALIDATION_ERRORS["missing_fields"], code=400)
+
+
+class InvalidTypeError(AppException):
+    def __init__(self):
+        super().__init__(VALIDATION_ERRORS["invalid_type"], code=400)
+
+
+class InvalidEmailError(AppException):
+    def __init__(self):
+        super().__init__(VALIDATION_ERRORS["invalid_email"], code=400)
+
+
+class InvalidFormatError(AppException):
+    def __init__(self):
+        super().__init__(VALIDATION_ERRORS["invalid_format"], code=400)
+
+
+# ==== Database Errors ====
+class DatabaseError(AppException):
+    def __init__(self, code: int):
+        message = DB_ERRORS.get(code, "Database operation failed")
+        super().__init__(message, code=500)
+
+
+# ==== Request Errors ====
+class InvalidQueryError(AppException):
+    def __init__(self):
+        super().__init__(REQUEST_ERRORS["invalid_query"], code=400)
+
+
+class InvalidBodyError(AppException):
+    def __init__(self):
+        super().__init__(REQUEST_ERRORS["invalid_body"], code=400)
+
+
+class RequestTimeoutError(AppException):
+    def __init__(self):
+        super().__init__(REQUEST_ERRORS["timeout"], code=408)
+
+
+# ==== File Errors ====
+class FileNotFoundError(AppException):
+    def __init__(self):
+        super().__init__(FILE_ERRORS["file_not_found"], code=404)
+
+
+class FileTooLargeError(AppException):
+    def __init__(self):
+        super().__init__(FILE_ERRORS["file_too_large"], code=413)
+
+
+class UnsupportedFileError(AppException):
+    def __init__(self):
+        super().__init__(FILE_ERRORS["unsupported_file"], code=400)
+
+
+# ==== Network Errors ====
+class APIUnreachableError(AppException):
+    def __init__(self):
+        super().__init__(NETWORK_ERRORS["api_unreachable"], code=503)
+
+
+class APITimeoutError(AppException):
+    def __init__(self):
+        super().__init__(NETWORK_ERRORS["api_timeout"], code=504)
+
+
+# ==== Success Messages ====
+class AppSuccess:
+    """Base class for success responses."""
+    def __init__(self, message: str, code: int = 200):
+        self.message = message
+        self.code = code
+
+    def to_dict(self):
+        return {"message": self.message, "code": self.code}
+
+
+class CreatedSuccess(AppSuccess):
+    def __init__(self):
+        super().__init__(SUCCESS_MESSAGES["created"], code=201)
+
+
+class UpdatedSuccess(AppSuccess):
+    def __init__(self):
+        super().__init__(SUCCESS_MESSAGES["updated"], code=200)
+
+
+class DeletedSuccess(AppSuccess):
+    def __init__(self):
+        super().__init__(SUCCESS_MESSAGES["deleted"], code=200)
+
+
+class FetchedSuccess(AppSuccess):
+    def __init__(self):
+        super().__init__(SUCCESS_MESSAGES["fetched"], code=200)
+
+
+class LoginSuccess(AppSuccess):
+    def __init__(self):
+        super().__init__(SUCCESS_MESSAGES["login_success"], code=200)
+
+
+class FileUploadedSuccess(AppSuccess):
+    def __init__(self):
+        super().__init__(SUCCESS_MESSAGES["file_uploaded"], code=201)
+
+
+# ==== Info Messages ====
+class AppInfo:
+    """Base class for informational messages."""
+    def __init__(self, message: str, code: int = 200):
+        self.message = message
+        self.code = code
+
+    def to_dict(self):
+        return {"info": self.message, "code": self.code}
+
+
+class DeprecatedInfo(AppInfo):
+    def __init__(self):
+        super().__init__(INFO_MESSAGES["deprecated"], code=200)
+
+
+class RetryInfo(AppInfo):
+    def __init__(self):
+        super().__init__(INFO_MESSAGES["retry"], code=200)
+
+
+class PartialSuccessInfo(AppInfo):
+    def __init__(self):
+        super().__init__(INFO_MESSAGES["partial_success"], code=206)
+
+
+ '''
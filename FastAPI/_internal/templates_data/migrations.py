@@ -0,0 +1,77 @@
+# templates_data/migrations.py
+# --------------------alembic---------------#
+alembic_env = '''
+# alembic/env.py
+
+from logging.config import fileConfig
+from sqlalchemy import engine_from_config, pool
+from alembic import context
+
+import sys
+import pathlib
+
+# Add app folder to sys.path for imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "app"))
+
+from app.core.config import settings
+from app.db.base import Base  # Import your Base for autogenerate
+
+# ---------------------- Import all models here for Alembic -------------------#
+# Import all models here so Alembic sees 
+
+# from app.modules.user import models as user_models
+# from app.modules.auth import models as auth_models
+# from app.modules.books import models as book_models
+
+# ------------------------------------------------------------------------------#
+
+# Alembic Config object
+config = context.config
+
+# Interpret the config file for Python logging
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Set DB URL dynamically from settings
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+
+target_metadata = Base.metadata
+
+# 
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode."""
+    url = config.get_main_option("sqlalchemy.url")
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode."""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
+'''
@@ -0,0 +1,148 @@
+# templates_data/user.py
+# ----------------USER MODULE---------------#
+user_crud='''
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.response_cache import invalidate
+from app.modules.auth.cache import principal_cache
+from app.modules.auth.utility import get_password_hash
+from app.modules.user.models import User
+from app.modules.user.schemas import UserCreate, UserSchema
+from app.utils.pagination import PageParams
+
+
+def get_users(db: Session, page: PageParams = None):
+    page = page or PageParams()
+    columns = page.columns(User, UserSchema.model_fields)
+    query = page.apply(select(*columns) if columns else select(User), User)
+    result = db.execute(query)
+    return result.mappings().all() if columns else result.scalars().all()
+
+
+def get_user(db: Session, user_id: int):
+    return db.query(User).filter(User.id == user_id).first()
+
+
+def get_user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+def get_user_by_username(db: Session, username:str):
+    return db.query(User).filter(User.username == username).first()
+
+def create_user(db: Session, user: UserCreate):
+    db_user = User(
+        email=str(user.email),
+        username=user.username,
+        password=get_password_hash(user.password)
+    )
+    db.add(db_user)
+    db.commit()
+    db.refresh(db_user)
+    invalidate("users")
+    return db_user
+
+
+def delete_user(db: Session, user_id: int):
+    db_user = db.query(User).filter(User.id == user_id).first()
+    if db_user:
+        db.delete(db_user)
+        db.commit()
+        principal_cache.invalidate_user(user_id)
+        invalidate("users")
+    return
+'''
+user_router = '''
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from sqlalchemy.orm import Session
+
+from app.core.response_cache import cached_response
+from app.modules.auth.crud import get_current_active_user
+from app.db.session import get_db
+from app.modules.user.models import User
+from app.modules.user.schemas import UserSchema, UserCreate
+from app.modules.user.crud import get_users, create_user, get_user, delete_user
+from app.utils.pagination import PageParams, page_params
+
+user_router = APIRouter(
+    prefix='/users',
+    tags=['Users']
+)
+
+
+@user_router.get('/', response_model=list[UserSchema])
+@cached_response(namespace="users", ttl=30, response_model=list[UserSchema], lazy=("db",))
+def users_list(response: Response, page: PageParams = Depends(page_params), db: Session = Depends(get_db)):
+    db_users = get_users(db, page)
+
+    return page.respond(db_users, response)
+
+
+@user_router.get('/me', response_model=UserSchema)
+def user_list(current_user: User = Depends(get_current_active_user)):
+    return current_user
+
+
+
+@user_router.get('/{user_id}', response_model=UserSchema)
+@cached_response(namespace="users", ttl=60, response_model=UserSchema, lazy=("db",))
+def user_detail(user_id: int, db: Session = Depends(get_db)):
+    db_user = get_user(db, user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return db_user
+
+
+@user_router.delete('/{user_id}')
+def user_delete(user_id: int, db: Session = Depends(get_db)):
+    db_user = get_user(db, user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    delete_user(db, db_user.id)
+    return {"message": "User deleted"}
+
+
+@user_router.post("/", response_model=UserSchema)
+def user_post(user: UserCreate, db:Session = Depends(get_db)):
+    return create_user(db, user)
+'''
+user_models = '''
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, Boolean, DateTime
+from app.db.base import Base
+from datetime import datetime, timezone
+
+
+class User(Base):
+    __tablename__ = 'users'
+
+    id: Mapped[int]                 = mapped_column(Integer, primary_key=True)
+    username: Mapped[str]           = mapped_column(String(32), unique=True, nullable=False)
+    email: Mapped[str]              = mapped_column(String(64), unique=True, nullable=False)
+    password: Mapped[str]           = mapped_column(String(128), nullable=False)
+    is_active: Mapped[bool]         = mapped_column(Boolean, default=True)
+    created_at: Mapped[DateTime]    = mapped_column(DateTime, default=datetime.now(timezone.utc), nullable=False)
+    updated_at: Mapped[DateTime]    = mapped_column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
+'''
+user_schemas = '''
+from pydantic import BaseModel, EmailStr
+
+
+class UserBase(BaseModel):
+    username: str
+    email: EmailStr
+
+
+class UserCreate(UserBase):
+    password: str
+
+
+class UserSchema(UserBase):
+    id: int
+
+    class Config:
+        from_attributes = True
+'''
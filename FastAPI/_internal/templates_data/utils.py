@@ -0,0 +1,434 @@
+# templates_data/utils.py
+retry_utils = '''
+# retry_utils.py
+"""
+Simple retry helpers, kept for existing call sites. They delegate to
+app.utils.resilience, which adds per-dependency retry budgets and circuit
+breakers; prefer @resilient("name") for calls to external services.
+"""
+
+from app.utils.resilience import call_with_retry, retry
+
+
+# --- Synchronous Retry Decorator ---
+def retry_on_exception(
+    exception_type=Exception,
+    max_attempts=3,
+    wait_seconds=5,
+):
+    """
+    Decorator to retry sync (or async) functions on specific exception types.
+    Waits at least ``wait_seconds`` between attempts, plus a small jitter
+    (at most another ``wait_seconds``) so callers don't retry in lockstep.
+
+    Usage:
+        @retry_on_exception(SomeError)
+        def your_func(): ...
+    """
+    return retry(exceptions=exception_type, max_attempts=max_attempts, max_delay=wait_seconds, min_delay=wait_seconds)
+
+
+# --- Async Retry Function Wrapper ---
+async def async_retry_on_exception(
+    func,
+    *args,
+    exception_type=Exception,
+    max_attempts=3,
+    wait_seconds=2,
+    **kwargs
+):
+    """
+    Retry wrapper for async functions. Pass the function and its arguments;
+    the retry options are keyword-only. Like retry_on_exception, waits at
+    least ``wait_seconds`` between attempts, plus a small jitter.
+
+    Usage:
+        result = await async_retry_on_exception(your_async_func, arg1, arg2, key=value)
+
+    Example:
+        await async_retry_on_exception(fetch_data, url, exception_type=httpx.RequestError)
+    """
+    return await call_with_retry(
+        func, *args,
+        exceptions=exception_type,
+        max_attempts=max_attempts,
+        max_delay=wait_seconds,
+        min_delay=wait_seconds,
+        **kwargs
+    )
+'''
+
+resilience = '''
+# app/utils/resilience.py
+"""
+Retries with exponential backoff and full jitter, per-dependency retry
+budgets and circuit breakers, for sync and async callables alike.
+
+    @resilient("payments", exceptions=(httpx.TransportError,))
+    async def charge(...): ...
+
+    @resilient("geocoder")
+    def lookup(...): ...
+
+Every named dependency has:
+
+- a retry budget: each call earns RETRY_BUDGET_RATIO retry tokens (up to
+  RETRY_BUDGET_MAX) and each retry spends one, so retries stay a bounded
+  fraction of traffic instead of multiplying load on a struggling service;
+- a circuit breaker: after CIRCUIT_FAILURE_THRESHOLD consecutive failed
+  attempts it opens and rejects calls with CircuitOpenError for
+  CIRCUIT_RESET_TIMEOUT seconds, then lets a single probe through
+  (half-open) and closes again if it succeeds;
+- counters, returned by resilience_stats() for a health or metrics endpoint.
+"""
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+
+from app.core.config import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit for {name!r} is open; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float, min_delay: float = 0.0) -> float:
+    """Full-jitter backoff: min_delay + uniform in [0, min(max_delay, base_delay * 2 ** attempt)]."""
+    return min_delay + random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class RetryBudget:
+    """Token bucket that caps retries at a fraction of calls."""
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raises CircuitOpenError unless the call may go ahead."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            elapsed = time.monotonic() - self.opened_at
+            if self.state == OPEN and elapsed >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(self.name, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Lets another probe through after one ended without a verdict."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Returns True when this failure opened the circuit."""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class Dependency:
+    """Retry budget, circuit breaker and counters of one external dependency."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.budget = RetryBudget(settings.RETRY_BUDGET_RATIO, settings.RETRY_BUDGET_MAX)
+        self.breaker = CircuitBreaker(name, settings.CIRCUIT_FAILURE_THRESHOLD, settings.CIRCUIT_RESET_TIMEOUT)
+        self.counters = dict.fromkeys(
+            ("calls", "successes", "failures", "retries", "budget_exhausted", "short_circuited", "circuit_opened"), 0
+        )
+        self._lock = threading.Lock()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counters[key] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+        return {**counters, "state": self.breaker.state, "retry_tokens": round(self.budget.tokens, 2)}
+
+
+_dependencies = {}
+_dependencies_lock = threading.Lock()
+
+
+def dependency(name: str) -> Dependency:
+    """Returns the shared Dependency called ``name``, creating it on first use."""
+    with _dependencies_lock:
+        if name not in _dependencies:
+            _dependencies[name] = Dependency(name)
+        return _dependencies[name]
+
+
+def resilience_stats() -> dict:
+    """Counters, breaker state and retry tokens of every dependency, by name."""
+    with _dependencies_lock:
+        deps = list(_dependencies.values())
+    return {dep.name: dep.stats() for dep in deps}
+
+
+class _Attempts:
+    """
+    The retry loop shared by the sync and async wrappers: they only differ
+    in how they call the function and how they sleep.
+    """
+
+    def __init__(self, dep, exceptions, max_attempts, base_delay, max_delay, min_delay=0.0):
+        self.dep = dep
+        self.exceptions = exceptions
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_delay = min_delay
+
+    def start(self) -> None:
+        if self.dep is not None:
+            self.dep.count("calls")
+            self.dep.budget.deposit()
+
+    def before_attempt(self) -> None:
+        if self.dep is None:
+            return
+        try:
+            self.dep.breaker.before_call()
+        except CircuitOpenError:
+            self.dep.count("short_circuited")
+            raise
+
+    def succeeded(self) -> None:
+        if self.dep is not None:
+            self.dep.breaker.record_success()
+            self.dep.count("successes")
+
+    def failed(self, attempt: int, error: Exception):
+        """Returns the delay before the next attempt, or None to re-raise ``error``."""
+        if not isinstance(error, self.exceptions):
+            # Not a dependency failure (a bug, a 4xx, a cancellation): don't
+            # retry, and don't hold the half-open probe slot either.
+            if self.dep is not None:
+                self.dep.breaker.release_probe()
+            return None
+        last = attempt + 1 >= self.max_attempts
+        if self.dep is not None:
+            if self.dep.breaker.record_failure():
+                self.dep.count("circuit_opened")
+            if last or self.dep.breaker.state == OPEN:
+                self.dep.count("failures")
+                return None
+            if not self.dep.budget.withdraw():
+                self.dep.count("budget_exhausted")
+                self.dep.count("failures")
+                return None
+            self.dep.count("retries")
+        elif last:
+            return None
+        return backoff_delay(attempt, self.base_delay, self.max_delay, self.min_delay)
+
+
+def retry(
+    name: str = None,
+    exceptions=Exception,
+    max_attempts: int = 3,
+    base_delay: float = 0.1,
+    max_delay: float = 5.0,
+    min_delay: float = 0.0,
+):
+    """
+    Decorator that retries sync or async callables on ``exceptions`` with
+    jittered exponential backoff. With ``name``, calls also go through that
+    dependency's retry budget and circuit breaker. ``min_delay`` is added
+    to every wait, for callers that need a guaranteed pause between attempts.
+    """
+    def decorator(func):
+        def attempts():
+            return _Attempts(
+                dependency(name) if name else None, exceptions, max_attempts, base_delay, max_delay, min_delay
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                state = attempts()
+                state.start()
+                for attempt in range(max_attempts):
+                    state.before_attempt()
+                    try:
+                        result = await func(*args, **kwargs)
+                    except BaseException as e:
+                        delay = state.failed(attempt, e)
+                        if delay is None:
+                            raise
+                        await asyncio.sleep(delay)
+                    else:
+                        state.succeeded()
+                        return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            state = attempts()
+            state.start()
+            for attempt in range(max_attempts):
+                state.before_attempt()
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as e:
+                    delay = state.failed(attempt, e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                else:
+                    state.succeeded()
+                    return result
+
+        return wrapper
+
+    return decorator
+
+
+def resilient(name: str, exceptions=Exception, max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 5.0):
+    """retry() bound to the named dependency's budget and circuit breaker."""
+    return retry(name, exceptions, max_attempts, base_delay, max_delay)
+
+
+async def call_with_retry(func, *args, name: str = None, exceptions=Exception, max_attempts: int = 3,
+                          base_delay: float = 0.1, max_delay: float = 5.0, min_delay: float = 0.0, **kwargs):
+    """Awaits ``func(*args, **kwargs)`` with retries, without decorating it."""
+    wrapped = retry(name, exceptions, max_attempts, base_delay, max_delay, min_delay)(func)
+    result = wrapped(*args, **kwargs)
+    return await result if inspect.isawaitable(result) else result
+'''
+
+pagination_utils = '''
+# app/utils/pagination.py
+
+from typing import Optional
+
+from fastapi import HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-After-Id"
+
+
+class PageParams:
+    """
+    Paging for list endpoints.
+
+    - limit/offset:  ?limit=50&offset=100
+    - keyset cursor: ?limit=50&after_id=1234 (cheap on large tables: the
+      database seeks to the id instead of counting past ``offset`` rows)
+    - projection:    ?fields=id,name selects only those columns
+
+    ``limit`` is capped at settings.MAX_PAGE_SIZE.
+    """
+
+    def __init__(self, limit: Optional[int] = None, offset: int = 0, after_id: Optional[int] = None, fields: Optional[str] = None):
+        self.limit = min(limit or settings.DEFAULT_PAGE_SIZE, settings.MAX_PAGE_SIZE)
+        self.offset = offset
+        self.after_id = after_id
+        self.fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else []
+
+    def apply(self, query, model):
+        """Adds ordering, the cursor or offset, and the limit to a select()."""
+        query = query.order_by(model.id)
+        if self.after_id is not None:
+            query = query.where(model.id > self.after_id)
+        elif self.offset:
+            query = query.offset(self.offset)
+        return query.limit(self.limit)
+
+    def columns(self, model, allowed) -> list:
+        """
+        The model columns requested with ``fields=`` (always including id,
+        which the cursor needs), or an empty list for whole rows. Only names
+        in ``allowed`` (the public schema fields) can be selected.
+        """
+        if not self.fields:
+            return []
+        unknown = sorted(set(self.fields) - set(allowed))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        names = ["id"] + [name for name in self.fields if name != "id"]
+        return [getattr(model, name) for name in names]
+
+    def respond(self, items: list, response: Response):
+        """
+        Returns a page, with the next cursor in the X-Next-After-Id header
+        when the page is full. Projected rows skip response_model validation,
+        since they are partial by design.
+        """
+        headers = {}
+        if items and len(items) == self.limit:
+            last = items[-1]
+            headers[NEXT_CURSOR_HEADER] = str(last["id"] if self.fields else last.id)
+        if self.fields:
+            return JSONResponse(content=jsonable_encoder([dict(item) for item in items]), headers=headers)
+        response.headers.update(headers)
+        return items
+
+
+def page_params(
+    limit: Optional[int] = Query(None, ge=1, description="Page size (capped at MAX_PAGE_SIZE)"),
+    offset: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: return rows with id greater than this"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+) -> PageParams:
+    return PageParams(limit, offset, after_id, fields)
+'''
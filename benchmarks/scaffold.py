@@ -0,0 +1,202 @@
+"""
+Scaffolding benchmark with regression thresholds.
+
+Every (case, size) sample runs the generator in a fresh interpreter inside a
+temporary directory and records:
+
+    wall_ms        time spent in the generator call (import excluded)
+    files          files present in the output tree afterwards
+    bytes_written  total size of those files
+    syscalls       read + write syscalls of the child, not counting its pool
+                   workers (Linux /proc/self/io; null elsewhere)
+    peak_rss_kb    peak resident set size of the child (null on Windows)
+
+The median of --runs samples is reported. With --baseline, the results are
+compared against an earlier --output file and the run fails (exit code 1)
+when wall_ms or peak_rss_kb grows by more than --threshold.
+
+Usage:
+    python benchmarks/scaffold.py [--sizes 1 10 100] [--runs 3] [--output result.json]
+    python benchmarks/scaffold.py --baseline result.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> bundle directory the child imports from
+CASES = {
+    "fastapi:startproject-db-auth": "FastAPI/_internal",
+    "fastapi:startapp": "FastAPI/_internal",
+    "django:startapp": "Django/_internal",
+    "django:startservices": "Django/_internal",
+}
+
+DEFAULT_SIZES = (1, 10, 100)
+COMPARED_METRICS = ("wall_ms", "peak_rss_kb")
+
+
+def run_case(case: str, size: int, workdir: str) -> None:
+    """Runs one generator path with ``size`` apps/services below ``workdir``."""
+    names = [f"app{i}" for i in range(size)]
+    if case == "fastapi:startproject-db-auth":
+        import template
+        template.write_project(os.path.join(workdir, "project"), template.build_file_map(True, True, names))
+    elif case == "fastapi:startapp":
+        import template
+        project = os.path.join(workdir, "project")
+        for name in names:
+            template.write_project(project, template.app_module_templates(name))
+    elif case == "django:startapp":
+        import template_data
+        os.chdir(workdir)
+        for name in names:
+            template_data.generate_app_boilerplate(name, "project")
+    elif case == "django:startservices":
+        import batch_services
+        services = [f"service{i}:users,orders" for i in range(size)]
+        batch_services.scaffold_services(services, base_path=workdir)
+    else:
+        raise ValueError(f"Unknown case {case!r}")
+
+
+def _proc_io() -> dict:
+    try:
+        with open("/proc/self/io", "r") as f:
+            return dict((key, int(value)) for key, value in (line.split(": ") for line in f))
+    except OSError:
+        return {}
+
+
+def _peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    peak = max(peak, peak_children)
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _tree_size(path: str) -> tuple:
+    files = 0
+    size = 0
+    for directory, _, filenames in os.walk(path):
+        for filename in filenames:
+            files += 1
+            size += os.path.getsize(os.path.join(directory, filename))
+    return files, size
+
+
+def child(case: str, size: int, workdir: str) -> dict:
+    io_before = _proc_io()
+    started = time.perf_counter()
+    run_case(case, size, workdir)
+    wall = time.perf_counter() - started
+    io_after = _proc_io()
+
+    files, size_on_disk = _tree_size(workdir)
+    syscalls = None
+    if io_before and io_after:
+        syscalls = (io_after["syscr"] + io_after["syscw"]) - (io_before["syscr"] + io_before["syscw"])
+    return {
+        "wall_ms": round(wall * 1000, 2),
+        "files": files,
+        "bytes_written": size_on_disk,
+        "syscalls": syscalls,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def sample(case: str, size: int, cache_dir: str) -> dict:
+    with tempfile.TemporaryDirectory(prefix="scaffold-bench-") as workdir:
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.path.join(ROOT, CASES[case]),
+            FASTAPI_CLI_CACHE_DIR=cache_dir,
+        )
+        command = [sys.executable, os.path.abspath(__file__), "--child", case, str(size), workdir]
+        output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(samples: list) -> dict:
+    result = {}
+    for key in samples[0]:
+        values = [s[key] for s in samples if s[key] is not None]
+        result[key] = statistics.median(values) if values else None
+    return result
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Returns a description of every metric that regressed beyond ``threshold``."""
+    regressions = []
+    for name, row in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > threshold:
+                regressions.append(f"{name} {metric}: {old} -> {new} (+{change:.0%}, threshold {threshold:.0%})")
+    return regressions
+
+
+def main() -> int:
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        _, _, case, size, workdir = sys.argv
+        print(json.dumps(child(case, int(size), workdir)))
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="only run these cases")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON file from an earlier --output run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression (default 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="scaffold-bench-cache-") as cache_dir:
+        for case in args.case or CASES:
+            for size in args.sizes:
+                name = f"{case}@{size}"
+                results[name] = summarize([sample(case, size, cache_dir) for _ in range(args.runs)])
+                row = results[name]
+                print(
+                    f"{name:36} {row['wall_ms']:>9.2f}ms {row['files']:>6} files "
+                    f"{row['bytes_written']:>10} B  syscalls={row['syscalls']}  rss={row['peak_rss_kb']}KB",
+                    file=sys.stderr,
+                )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    else:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Cold-start benchmark for the CLI entry points.
+
+Each sample runs a fresh interpreter that imports an entry module (and,
+optionally, runs one generator call), so the numbers include module
+evaluation but not the work of a warm process. The bare interpreter start-up
+is measured as well and subtracted.
+
+Usage:
+    python benchmarks/startup.py [--runs 20] [--json]
+    python benchmarks/startup.py --exe "FastAPI/FastAPI_CLI_tool.exe --help"
+"""
+import argparse
+import json
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (bundle directory, python statement)
+ENTRY_POINTS = {
+    "fastapi:import": ("FastAPI/_internal", "import template"),
+    "fastapi:startapp-render": ("FastAPI/_internal", "import template; template.app_module_templates('blog')"),
+    "fastapi:startproject-render": ("FastAPI/_internal", "import template; template.build_file_map(True, True)"),
+    "django:import": ("Django/_internal", "import template_data"),
+    "django:startapp-render": ("Django/_internal", "import template_data; template_data.app_boilerplate_files('blog', 'proj')"),
+    "django:startservices-import": ("Django/_internal", "import batch_services"),
+}
+
+
+def time_command(command: list, env: dict = None, runs: int = 20) -> list:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: list, baseline: float = 0.0) -> dict:
+    return {
+        "min_ms": round((min(samples) - baseline) * 1000, 2),
+        "median_ms": round((statistics.median(samples) - baseline) * 1000, 2),
+        "max_ms": round((max(samples) - baseline) * 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--exe", action="append", default=[], help="also time an executable command line")
+    args = parser.parse_args()
+
+    baseline_samples = time_command([sys.executable, "-c", "pass"], runs=args.runs)
+    baseline = statistics.median(baseline_samples)
+    results = {"python": summarize(baseline_samples)}
+
+    for name, (bundle, statement) in ENTRY_POINTS.items():
+        env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, bundle))
+        samples = time_command([sys.executable, "-c", statement], env=env, runs=args.runs)
+        results[name] = summarize(samples, baseline)
+
+    for command_line in args.exe:
+        samples = time_command(shlex.split(command_line), runs=args.runs)
+        results[command_line] = summarize(samples)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'entry point':40} {'min':>9} {'median':>9} {'max':>9}")
+        for name, row in results.items():
+            print(f"{name:40} {row['min_ms']:>7.2f}ms {row['median_ms']:>7.2f}ms {row['max_ms']:>7.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())